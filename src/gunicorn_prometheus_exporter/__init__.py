@@ -94,13 +94,6 @@ from .plugin import (
     get_prometheus_eventlet_worker,
     get_prometheus_gevent_worker,
 )
-from .backend import (
-    RedisStorageManager,
-    get_redis_storage_manager,
-    setup_redis_metrics,
-    teardown_redis_metrics,
-    is_redis_enabled,
-)
 
 
 # Import async worker classes if available
@@ -124,6 +117,29 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# Redis storage exports are resolved from the backend package on first
+# access, so redis is only imported when Redis storage is actually used.
+_BACKEND_EXPORTS = frozenset(
+    {
+        "RedisStorageManager",
+        "get_redis_storage_manager",
+        "setup_redis_metrics",
+        "teardown_redis_metrics",
+        "is_redis_enabled",
+    }
+)
+
+
+def __getattr__(name):
+    """Import Redis storage exports lazily on first access."""
+    if name not in _BACKEND_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from . import backend
+
+    return getattr(backend, name)
+
+
 # Force Arbiter replacement before gunicorn starts
 # This ensures that when Gunicorn's BaseApplication.run() calls
 # Arbiter(self).run(), it uses our PrometheusMaster instead of the original
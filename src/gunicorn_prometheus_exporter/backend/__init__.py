@@ -14,32 +14,57 @@ Design Patterns:
 - Dependency Injection: Testable and maintainable code
 """
 
-from .core import (
-    RedisMultiProcessCollector,
-    RedisStorageClient,
-    RedisStorageDict,
-    RedisValueClass,
-)
-from .service import (
-    RedisStorageManager,
-    cleanup_redis_keys,
-    get_redis_client,
-    get_redis_collector,
-    get_redis_storage_manager,
-    is_redis_enabled,
-    setup_redis_metrics,
-    teardown_redis_metrics,
-)
+import importlib
+
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing the package does not pull in redis unless Redis storage is used.
+_LAZY_IMPORTS = {
+    # Redis Manager
+    "RedisStorageManager": ".service",
+    "RedisConfig": ".service",
+    "get_redis_storage_manager": ".service",
+    "setup_redis_metrics": ".service",
+    "teardown_redis_metrics": ".service",
+    "is_redis_enabled": ".service",
+    "get_redis_client": ".service",
+    "get_redis_connection_pool": ".service",
+    "cleanup_redis_keys": ".service",
+    "get_redis_collector": ".service",
+    # Redis Backend
+    "RedisMultiProcessCollector": ".core",
+    "RedisStorageClient": ".core",
+    "RedisStorageDict": ".core",
+    "RedisValueClass": ".core",
+}
+
+
+def __getattr__(name):
+    """Import backend attributes lazily on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported attributes in dir()."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 
 __all__ = [
     # Redis Manager
     "RedisStorageManager",
+    "RedisConfig",
     "get_redis_storage_manager",
     "setup_redis_metrics",
     "teardown_redis_metrics",
     "is_redis_enabled",
     "get_redis_client",
+    "get_redis_connection_pool",
     "cleanup_redis_keys",
     "get_redis_collector",
     # Redis Backend
@@ -127,10 +127,18 @@ class RedisClientProtocol(Protocol):
         """Delete keys."""
         raise NotImplementedError
 
+    def unlink(self, *keys: Union[bytes, str]) -> int:
+        """Delete keys, reclaiming their memory in the background."""
+        raise NotImplementedError
+
     def time(self) -> Tuple[int, int]:
         """Get Redis server time as (seconds, microseconds)."""
         raise NotImplementedError
 
+    def pipeline(self, transaction: bool = True):
+        """Create a pipeline for batching commands into one round trip."""
+        raise NotImplementedError
+
 
 class StorageDictProtocol(Protocol):
     """Protocol for storage dictionary interface."""
@@ -156,17 +164,31 @@ class StorageDictProtocol(Protocol):
 class RedisStorageDict:
     """Redis-backed dictionary for storing metric values with thread safety."""
 
-    def __init__(self, redis_client: RedisClientProtocol, key_prefix: str = None):
+    def __init__(
+        self,
+        redis_client: RedisClientProtocol,
+        key_prefix: str = None,
+        flush_threshold: int = 1,
+    ):
         """Initialize Redis storage dictionary.
 
         Args:
             redis_client: Redis client instance
             key_prefix: Prefix for Redis keys
                 (defaults to get_config().redis_key_prefix)
+            flush_threshold: Number of buffered writes that triggers a pipeline
+                flush (defaults to 1, i.e. every write reaches Redis immediately)
         """
         self._redis = redis_client
         self._key_prefix = key_prefix or get_config().redis_key_prefix
         self._lock = threading.Lock()
+        self._flush_threshold = max(1, flush_threshold)
+        self._pipe = None
+        self._pending_writes = 0
+        # Resolve the TTL once instead of re-reading the config on every write
+        self._ttl_seconds: Optional[int] = (
+            get_config().redis_ttl_seconds if _should_set_ttl() else None
+        )
         logger.debug("Initialized Redis storage dict with prefix: %s", key_prefix)
 
     def _redis_now(self) -> float:
@@ -266,31 +288,104 @@ class RedisStorageDict:
                 key, metric_type
             )
         metric_key = self._get_metric_key(key, metric_type, multiprocess_mode)
+        metadata_key = self._get_metadata_key(key, metric_type, multiprocess_mode)
+
+        with self._lock:
+            self._queue_value_write(key, metric_key, metadata_key, value, timestamp)
+            self._pending_writes += 1
+            if self._pending_writes >= self._flush_threshold:
+                self._flush_unlocked()
+
+    def increment_value(
+        self,
+        key: str,
+        amount: float,
+        timestamp: float,
+        metric_type: str = "counter",
+        multiprocess_mode: str = "",
+        initial_value: float = 0.0,
+    ) -> float:
+        """Atomically increment the value for a metric key.
+
+        Args:
+            key: Metric key
+            amount: Amount to add (HINCRBYFLOAT)
+            timestamp: Metric timestamp
+            metric_type: Type of metric (counter, gauge, histogram, summary)
+            multiprocess_mode: Multiprocess mode for gauge metrics
+            initial_value: Value to start from if the key is missing in Redis
+                (e.g. after its TTL expired)
+
+        Returns:
+            The value stored in Redis after the increment
+        """
+        if not multiprocess_mode:
+            multiprocess_mode = self._get_multiprocess_mode_from_metadata(
+                key, metric_type
+            )
+        metric_key = self._get_metric_key(key, metric_type, multiprocess_mode)
+        metadata_key = self._get_metadata_key(key, metric_type, multiprocess_mode)
 
         with self._lock:
-            # Store value and timestamp in Redis hash
-            self._redis.hset(
+            # Send buffered writes first so the increment result is results[1]
+            self._flush_unlocked()
+            self._queue_value_write(
+                key, metric_key, metadata_key, initial_value, timestamp, amount
+            )
+            results = self._pipe.execute()
+
+        return _safe_parse_float(results[1])
+
+    def _queue_value_write(
+        self,
+        key: str,
+        metric_key: str,
+        metadata_key: str,
+        value: float,
+        timestamp: float,
+        increment: Optional[float] = None,
+    ) -> None:
+        """Queue the commands for one value write on the write pipeline.
+
+        With increment set, value only seeds a missing value field, which is
+        then increased by increment server-side.
+        """
+        now = self._redis_now()
+        if self._pipe is None:
+            self._pipe = self._redis.pipeline(transaction=False)
+        pipe = self._pipe
+
+        # Store value and timestamp in Redis hash
+        if increment is None:
+            pipe.hset(
                 metric_key,
-                mapping={
-                    "value": value,
-                    "timestamp": timestamp,
-                    "updated_at": self._redis_now(),
-                },
+                mapping={"value": value, "timestamp": timestamp, "updated_at": now},
             )
+        else:
+            pipe.hsetnx(metric_key, "value", value)
+            pipe.hincrbyfloat(metric_key, "value", increment)
+            pipe.hset(metric_key, mapping={"timestamp": timestamp, "updated_at": now})
+
+        # Set metadata only once - don't overwrite created_at on subsequent writes
+        pipe.hsetnx(metadata_key, "original_key", key)
+        pipe.hsetnx(metadata_key, "created_at", str(now))
 
-            # Set TTL if not disabled
-            if _should_set_ttl():
-                self._redis.expire(metric_key, get_config().redis_ttl_seconds)
+        # Set TTL for metric and metadata keys if not disabled
+        if self._ttl_seconds is not None:
+            pipe.expire(metric_key, self._ttl_seconds)
+            pipe.expire(metadata_key, self._ttl_seconds)
 
-            # Store metadata separately for easier querying
-            metadata_key = self._get_metadata_key(key, metric_type, multiprocess_mode)
-            # Set metadata only once - don't overwrite created_at on subsequent writes
-            self._redis.hsetnx(metadata_key, "original_key", key)
-            self._redis.hsetnx(metadata_key, "created_at", str(self._redis_now()))
+    def flush(self) -> None:
+        """Send any buffered writes to Redis in a single round trip."""
+        with self._lock:
+            self._flush_unlocked()
 
-            # Set TTL for metadata key as well
-            if _should_set_ttl():
-                self._redis.expire(metadata_key, get_config().redis_ttl_seconds)
+    def _flush_unlocked(self) -> None:
+        """Execute the write pipeline (assumes lock is already held)."""
+        if self._pipe is None or not self._pending_writes:
+            return
+        self._pending_writes = 0
+        self._pipe.execute()
 
     def _get_metric_key(
         self, key: str, metric_type: str = "counter", multiprocess_mode: str = ""
@@ -336,26 +431,12 @@ class RedisStorageDict:
         # Try to get multiprocess_mode from metadata
         multiprocess_mode = self._get_multiprocess_mode_from_metadata(key, metric_type)
         metric_key = self._get_metric_key(key, metric_type, multiprocess_mode)
-
-        # Store value and timestamp in Redis hash
-        self._redis.hset(
-            metric_key,
-            mapping={"value": 0.0, "timestamp": 0.0, "updated_at": self._redis_now()},
-        )
-
-        # Set TTL for metric key if not disabled
-        if _should_set_ttl():
-            self._redis.expire(metric_key, get_config().redis_ttl_seconds)
-
-        # Store metadata separately for easier querying
         metadata_key = self._get_metadata_key(key, metric_type, multiprocess_mode)
-        # Set metadata only once - don't overwrite created_at on subsequent writes
-        self._redis.hsetnx(metadata_key, "original_key", key)
-        self._redis.hsetnx(metadata_key, "created_at", str(self._redis_now()))
 
-        # Set TTL for metadata key as well
-        if _should_set_ttl():
-            self._redis.expire(metadata_key, get_config().redis_ttl_seconds)
+        # Defaults are written immediately, together with any buffered writes
+        self._queue_value_write(key, metric_key, metadata_key, 0.0, 0.0)
+        self._pending_writes += 1
+        self._flush_unlocked()
 
     def _extract_original_key(self, metadata):
         """Extract original key from metadata, handling both bytes and string."""
@@ -434,8 +515,8 @@ class RedisStorageDict:
                 self._redis.hset(metadata_key, mapping=metadata)
 
                 # Set TTL if configured
-                if _should_set_ttl():
-                    self._redis.expire(metadata_key, get_config().redis_ttl_seconds)
+                if self._ttl_seconds is not None:
+                    self._redis.expire(metadata_key, self._ttl_seconds)
 
                 logger.debug(
                     "Created metadata for key %s: typ=%s, mode=%s",
@@ -448,8 +529,8 @@ class RedisStorageDict:
                 logger.warning("Failed to ensure metadata for key %s: %s", key, e)
 
     def close(self):
-        """Close Redis connection if needed."""
-        # Redis client is typically managed externally
+        """Flush buffered writes; the Redis connection is managed externally."""
+        self.flush()
 
 
 class RedisValueClass:
@@ -507,32 +588,25 @@ class RedisStorageClient:
         """
         try:
             pattern = f"{self._key_prefix}:*:{pid}:*"
-            deleted_count = 0
-            batch_size = 100
+            batch_size = 500
+            max_keys = 1000
+            batches = []
             current_batch = []
 
             try:
                 # Process keys in streaming fashion to avoid memory issues
-                for key in self._redis_client.scan_iter(match=pattern, count=100):
+                for key in self._redis_client.scan_iter(match=pattern, count=1000):
                     current_batch.append(key)
-
-                    # Delete when batch is full
                     if len(current_batch) >= batch_size:
-                        try:
-                            self._redis_client.delete(*current_batch)
-                            deleted_count += len(current_batch)
-                        except Exception as delete_error:
-                            logger.warning(
-                                "Failed to delete Redis key batch for process %d: %s",
-                                pid,
-                                delete_error,
-                            )
+                        batches.append(current_batch)
                         current_batch = []
 
                         # Limit total cleanup to avoid blocking for too long
-                        if deleted_count >= 1000:
+                        if len(batches) * batch_size >= max_keys:
                             logger.debug(
-                                "Reached cleanup limit of 1000 keys for process %d", pid
+                                "Reached cleanup limit of %d keys for process %d",
+                                max_keys,
+                                pid,
                             )
                             break
 
@@ -542,17 +616,28 @@ class RedisStorageClient:
                 )
                 return
 
-            # Delete any remaining keys in the final batch
             if current_batch:
-                try:
-                    self._redis_client.delete(*current_batch)
-                    deleted_count += len(current_batch)
-                except Exception as delete_error:
+                batches.append(current_batch)
+            if not batches:
+                return
+
+            # Send every batch in one round trip; UNLINK frees memory off the
+            # main Redis thread, unlike DEL. Errors come back per batch.
+            pipe = self._redis_client.pipeline(transaction=False)
+            for batch in batches:
+                pipe.unlink(*batch)
+            results = pipe.execute(raise_on_error=False)
+
+            deleted_count = 0
+            for result in results:
+                if isinstance(result, Exception):
                     logger.warning(
-                        "Failed to delete final Redis key batch for process %d: %s",
+                        "Failed to delete Redis key batch for process %d: %s",
                         pid,
-                        delete_error,
+                        result,
                     )
+                else:
+                    deleted_count += result
 
             if deleted_count > 0:
                 logger.debug(
@@ -1,4 +1,5 @@
 import json
+import logging
 import os
 
 from collections import defaultdict
@@ -11,6 +12,9 @@ from ...config import get_config
 from .client import _safe_decode_bytes, _safe_extract_original_key, _safe_parse_float
 
 
+logger = logging.getLogger(__name__)
+
+
 # Conditional Redis import - only import when needed
 try:
     import redis
@@ -24,6 +28,9 @@ except ImportError:
 class RedisMultiProcessCollector:
     """Collector for Redis-based multi-process mode."""
 
+    # Number of metric keys read per pipelined round trip
+    READ_BATCH_SIZE = 500
+
     def __init__(self, registry, redis_client=None, redis_key_prefix=None):
         if not REDIS_AVAILABLE:
             raise ImportError(
@@ -114,13 +121,53 @@ class RedisMultiProcessCollector:
         pattern = f"{redis_key_prefix}:*:*:metric:*"
         metric_keys = list(redis_client.scan_iter(match=pattern, count=100))
 
-        for metric_key in metric_keys:
-            RedisMultiProcessCollector._process_metric_key(
-                metric_key, redis_client, metrics, _parse_key
+        # Fetch metadata and values for a whole batch of keys in one round trip
+        batch_size = RedisMultiProcessCollector.READ_BATCH_SIZE
+        for start in range(0, len(metric_keys), batch_size):
+            batch = metric_keys[start : start + batch_size]
+            fetched = RedisMultiProcessCollector._fetch_metric_batch(
+                batch, redis_client
             )
+            for metric_key, prefetched in zip(batch, fetched):
+                if prefetched is None:
+                    continue
+                RedisMultiProcessCollector._process_metric_key(
+                    metric_key, redis_client, metrics, _parse_key, prefetched
+                )
 
         return metrics
 
+    @staticmethod
+    def _fetch_metric_batch(metric_keys, redis_client):
+        """Pipeline metadata and value lookups for a batch of metric keys.
+
+        Returns a list of (metadata, value_data, timestamp_data) tuples in the
+        same order as metric_keys. A key whose lookups failed (e.g. a
+        WRONGTYPE error for a non-hash key) is logged and returned as None so
+        one bad key does not fail the whole scrape.
+        """
+        pipe = redis_client.pipeline(transaction=False)
+        for metric_key in metric_keys:
+            pipe.hgetall(RedisMultiProcessCollector._get_metadata_key(metric_key))
+            pipe.hmget(metric_key, "value", "timestamp")
+        results = pipe.execute(raise_on_error=False)
+
+        fetched = []
+        for metric_key, metadata, values in zip(
+            metric_keys, results[0::2], results[1::2]
+        ):
+            error = next(
+                (r for r in (metadata, values) if isinstance(r, Exception)), None
+            )
+            if error is not None:
+                logger.warning(
+                    "Error reading metric from Redis: %s: %s", metric_key, error
+                )
+                fetched.append(None)
+            else:
+                fetched.append((metadata, *values))
+        return fetched
+
     @staticmethod
     def _extract_original_key_from_metadata(metadata):
         """Extract original key from metadata, handling both bytes and string."""
@@ -136,13 +183,22 @@ class RedisMultiProcessCollector:
         return key_parts[2] if len(key_parts) > 2 else "unknown"
 
     @staticmethod
-    def _process_metric_key(metric_key, redis_client, metrics, _parse_key):  # pylint: disable=too-many-locals
-        """Process a single metric key from Redis."""
+    def _process_metric_key(  # pylint: disable=too-many-locals
+        metric_key, redis_client, metrics, _parse_key, prefetched=None
+    ):
+        """Process a single metric key from Redis.
+
+        prefetched is an optional (metadata, value_data, timestamp_data) tuple
+        already read by _fetch_metric_batch; without it the data is looked up.
+        """
         try:
             # Get and validate metadata
-            metadata = RedisMultiProcessCollector._get_metadata(
-                metric_key, redis_client
-            )
+            if prefetched is None:
+                metadata = RedisMultiProcessCollector._get_metadata(
+                    metric_key, redis_client
+                )
+            else:
+                metadata, value_data, timestamp_data = prefetched
             if not metadata:
                 return
 
@@ -157,9 +213,12 @@ class RedisMultiProcessCollector:
             typ = RedisMultiProcessCollector._extract_metric_type(metric_key)
 
             # Get and validate values
-            value_data, timestamp_data = RedisMultiProcessCollector._get_metric_values(
-                metric_key, redis_client
-            )
+            if prefetched is None:
+                value_data, timestamp_data = (
+                    RedisMultiProcessCollector._get_metric_values(
+                        metric_key, redis_client
+                    )
+                )
             if value_data is None or timestamp_data is None:
                 return
 
@@ -189,15 +248,20 @@ class RedisMultiProcessCollector:
             logger.warning("Error reading metric from Redis: %s", e)
 
     @staticmethod
-    def _get_metadata(metric_key, redis_client):
-        """Get metadata for a metric key."""
+    def _get_metadata_key(metric_key):
+        """Get the metadata key that belongs to a metric key."""
         # metric_key format: gunicorn:type:pid:metric:{original_key}
         # metadata_key format: gunicorn:type:pid:meta:{original_key}
-        metadata_key = (
+        return (
             metric_key.replace(b":metric:", b":meta:", 1)
             if isinstance(metric_key, (bytes, bytearray))
             else metric_key.replace(":metric:", ":meta:", 1)
         )
+
+    @staticmethod
+    def _get_metadata(metric_key, redis_client):
+        """Get metadata for a metric key."""
+        metadata_key = RedisMultiProcessCollector._get_metadata_key(metric_key)
         return redis_client.hgetall(metadata_key)
 
     @staticmethod
@@ -69,15 +69,19 @@ class RedisValue:
         )
 
     def inc(self, amount=1):
-        """Increment the value by amount."""
-        self._value += amount
+        """Increment the value by amount.
+
+        The increment is applied atomically in Redis (HINCRBYFLOAT), so
+        concurrent increments from other threads are never lost.
+        """
         self._timestamp = 0.0
-        self._redis_dict.write_value(
+        self._value = self._redis_dict.increment_value(
             self._key,
-            self._value,
+            amount,
             self._timestamp,
             self._params[0],
             self._params[6],  # Pass multiprocess_mode
+            initial_value=self._value,
         )
 
     def set(self, value, timestamp=None):
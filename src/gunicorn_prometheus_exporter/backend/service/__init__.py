@@ -9,10 +9,12 @@ Modules:
 
 from .manager import (
     FactoryUtilsMixin,
+    RedisConfig,
     RedisStorageManager,
     cleanup_redis_keys,
     get_redis_client,
     get_redis_collector,
+    get_redis_connection_pool,
     get_redis_storage_manager,
     is_redis_enabled,
     setup_redis_metrics,
@@ -23,6 +25,7 @@ from .manager import (
 __all__ = [
     # Main classes
     "RedisStorageManager",
+    "RedisConfig",
     "FactoryUtilsMixin",
     # Manager functions
     "get_redis_storage_manager",
@@ -31,6 +34,7 @@ __all__ = [
     "teardown_redis_metrics",
     "is_redis_enabled",
     "get_redis_client",
+    "get_redis_connection_pool",
     "cleanup_redis_keys",
     "get_redis_collector",
 ]
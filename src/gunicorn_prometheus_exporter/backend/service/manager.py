@@ -4,9 +4,12 @@ This module provides a clean, testable interface for managing Redis-based metric
 storage. Uses dependency injection and proper separation of concerns.
 """
 
+import atexit
 import logging
 import os
+import threading
 
+from dataclasses import dataclass
 from typing import Optional, Protocol
 
 from ...config import get_config
@@ -35,6 +38,37 @@ class PrometheusValueClassProtocol(Protocol):
         raise NotImplementedError
 
 
+@dataclass(frozen=True)
+class RedisConfig:
+    """Redis connection settings used by RedisStorageManager."""
+
+    enabled: bool = True
+    host: str = "127.0.0.1"
+    port: int = 6379
+    db: int = 0
+    password: Optional[str] = None
+    key_prefix: str = "gunicorn"
+
+    @classmethod
+    def from_env(cls) -> "RedisConfig":
+        """Read Redis settings from the environment-backed exporter config."""
+        config = get_config()
+        return cls(
+            enabled=config.redis_enabled,
+            host=config.redis_host,
+            port=config.redis_port,
+            db=config.redis_db,
+            password=config.redis_password,
+            key_prefix=config.redis_key_prefix,
+        )
+
+    @property
+    def url(self) -> str:
+        """Redis connection URL for these settings."""
+        auth = f":{self.password}@" if self.password else ""
+        return f"redis://{auth}{self.host}:{self.port}/{self.db}"
+
+
 class FactoryUtilsMixin:
     """Mixin class for factory utilities."""
 
@@ -71,12 +105,18 @@ class FactoryUtilsMixin:
 class RedisStorageManager:
     """Manages Redis-based metrics storage with proper lifecycle management."""
 
-    def __init__(self, redis_client_factory=None, value_class_factory=None):
+    def __init__(
+        self,
+        redis_client_factory=None,
+        value_class_factory=None,
+        config: Optional[RedisConfig] = None,
+    ):
         """Initialize Redis storage manager.
 
         Args:
             redis_client_factory: Factory function to create Redis client (for testing)
             value_class_factory: Factory function to create value class (for testing)
+            config: Redis settings (defaults to RedisConfig.from_env() on use)
         """
         if not REDIS_AVAILABLE:
             raise ImportError(
@@ -88,6 +128,7 @@ class RedisStorageManager:
         self._redis_value_class: Optional[PrometheusValueClassProtocol] = None
         self._original_value_class: Optional[PrometheusValueClassProtocol] = None
         self._is_initialized = False
+        self._config = config
 
         # Dependency injection for testing
         self._redis_client_factory = redis_client_factory or self._create_redis_client
@@ -99,7 +140,8 @@ class RedisStorageManager:
         Returns:
             bool: True if setup was successful, False otherwise.
         """
-        if not get_config().redis_enabled:
+        config = self._get_redis_config()
+        if not config.enabled:
             logger.debug("Redis is not enabled, skipping Redis metrics setup")
             return False
 
@@ -115,15 +157,15 @@ class RedisStorageManager:
             self._redis_client.ping()
             logger.debug(
                 "Connected to Redis at %s:%s (TTL: %s)",
-                get_config().redis_host,
-                get_config().redis_port,
+                config.host,
+                config.port,
                 "disabled"
                 if not _should_set_ttl()
                 else f"{get_config().redis_ttl_seconds}s",
             )
 
             # Create value class
-            prefix = get_config().redis_key_prefix.rstrip(":")
+            prefix = config.key_prefix.rstrip(":")
             self._redis_value_class = self._value_class_factory(
                 self._redis_client, prefix
             )
@@ -176,7 +218,9 @@ class RedisStorageManager:
 
             pid = os.getpid()
             mark_process_dead_redis(
-                pid, self._redis_client, get_config().redis_key_prefix.rstrip(":")
+                pid,
+                self._redis_client,
+                self._get_redis_config().key_prefix.rstrip(":"),
             )
             logger.debug("Cleaned up Redis keys for process %d", pid)
 
@@ -194,32 +238,27 @@ class RedisStorageManager:
 
             registry = get_shared_registry()
             return RedisMultiProcessCollector(
-                registry, self._redis_client, get_config().redis_key_prefix.rstrip(":")
+                registry,
+                self._redis_client,
+                self._get_redis_config().key_prefix.rstrip(":"),
             )
 
         except Exception as e:
             logger.error("Failed to create Redis collector: %s", e)
             return None
 
+    def _get_redis_config(self) -> RedisConfig:
+        """Get the injected Redis settings, or read them from the environment."""
+        if self._config is not None:
+            return self._config
+        return RedisConfig.from_env()
+
     def _create_redis_client(self) -> RedisClientProtocol:
         """Create Redis client from configuration."""
-        config = get_config()
-        redis_url = f"redis://{config.redis_host}:{config.redis_port}/{config.redis_db}"
-        if get_config().redis_password:
-            redis_url = (
-                f"redis://:{get_config().redis_password}@{get_config().redis_host}:"
-                f"{get_config().redis_port}/{get_config().redis_db}"
-            )
+        redis_url = self._get_redis_config().url
 
         os.environ["PROMETHEUS_REDIS_URL"] = redis_url
-        return redis.from_url(
-            redis_url,
-            decode_responses=False,
-            socket_timeout=5.0,  # 5 second timeout for socket operations
-            socket_connect_timeout=5.0,  # 5 second timeout for connection
-            retry_on_timeout=True,  # Retry on timeout
-            health_check_interval=30,  # Health check every 30 seconds
-        )
+        return redis.Redis(connection_pool=get_redis_connection_pool(redis_url))
 
     def _create_value_class(self, client: RedisClientProtocol, prefix: str):
         """Create Redis value class."""
@@ -279,6 +318,44 @@ class RedisStorageManager:
 # Global manager instance
 _global_manager: Optional[RedisStorageManager] = None
 
+# Connection pool shared by every Redis client created in this process
+_connection_pool = None
+_connection_pool_url: Optional[str] = None
+_connection_pool_lock = threading.Lock()
+
+# Whether teardown_redis_metrics is registered to run at interpreter exit
+_atexit_registered = False
+
+
+def get_redis_connection_pool(redis_url: str):
+    """Get or create the process-wide Redis connection pool.
+
+    Clients built on the same pool share sockets instead of each opening
+    (and authenticating) their own connections. The pool is recreated if
+    the URL changes.
+
+    Args:
+        redis_url: Redis connection URL
+
+    Returns:
+        Shared redis.ConnectionPool instance
+    """
+    global _connection_pool, _connection_pool_url
+    with _connection_pool_lock:
+        if _connection_pool is None or _connection_pool_url != redis_url:
+            if _connection_pool is not None:
+                _connection_pool.disconnect()
+            _connection_pool = redis.ConnectionPool.from_url(
+                redis_url,
+                decode_responses=False,
+                socket_timeout=5.0,  # 5 second timeout for socket operations
+                socket_connect_timeout=5.0,  # 5 second timeout for connection
+                retry_on_timeout=True,  # Retry on timeout
+                health_check_interval=30,  # Health check every 30 seconds
+            )
+            _connection_pool_url = redis_url
+        return _connection_pool
+
 
 def get_redis_storage_manager() -> RedisStorageManager:
     """Get or create global Redis storage manager."""
@@ -290,9 +367,24 @@ def get_redis_storage_manager() -> RedisStorageManager:
 
 # Convenience functions for backward compatibility
 def setup_redis_metrics() -> bool:
-    """Set up Redis-based metrics storage."""
+    """Set up Redis-based metrics storage.
+
+    On success, teardown_redis_metrics is registered (once per process) to run
+    at interpreter exit, so callers do not need to tear down explicitly.
+    """
     manager = get_redis_storage_manager()
-    return manager.setup()
+    result = manager.setup()
+    if result:
+        _register_atexit_teardown()
+    return result
+
+
+def _register_atexit_teardown() -> None:
+    """Register teardown_redis_metrics as a process exit hook, once."""
+    global _atexit_registered
+    if not _atexit_registered:
+        atexit.register(teardown_redis_metrics)
+        _atexit_registered = True
 
 
 def teardown_redis_metrics() -> None:
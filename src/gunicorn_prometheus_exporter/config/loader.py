@@ -6,12 +6,59 @@ import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import yaml
-
 
 logger = logging.getLogger(__name__)
 
 
+def _lower_str(value: Any) -> str:
+    """Render booleans the way the environment variables expect them."""
+    return str(value).lower()
+
+
+# Keys that must be present in the exporter and exporter.prometheus sections
+_REQUIRED_SECTIONS = ("prometheus", "gunicorn")
+_REQUIRED_PROMETHEUS_FIELDS = ("metrics_port", "bind_address")
+
+# (YAML key, environment variable, converter) for each config section
+_PROMETHEUS_ENV_MAP = (
+    ("metrics_port", "PROMETHEUS_METRICS_PORT", str),
+    ("bind_address", "PROMETHEUS_BIND_ADDRESS", str),
+    ("multiproc_dir", "PROMETHEUS_MULTIPROC_DIR", str),
+)
+_SSL_ENV_MAP = (
+    ("certfile", "PROMETHEUS_SSL_CERTFILE", str),
+    ("keyfile", "PROMETHEUS_SSL_KEYFILE", str),
+    ("client_cafile", "PROMETHEUS_SSL_CLIENT_CAFILE", str),
+    ("client_capath", "PROMETHEUS_SSL_CLIENT_CAPATH", str),
+    ("client_auth_required", "PROMETHEUS_SSL_CLIENT_AUTH_REQUIRED", _lower_str),
+)
+_GUNICORN_ENV_MAP = (
+    ("workers", "GUNICORN_WORKERS", str),
+    ("timeout", "GUNICORN_TIMEOUT", str),
+    ("keepalive", "GUNICORN_KEEPALIVE", str),
+)
+_REDIS_ENV_MAP = (
+    ("host", "REDIS_HOST", str),
+    ("port", "REDIS_PORT", str),
+    ("db", "REDIS_DB", str),
+    ("password", "REDIS_PASSWORD", str),
+    ("key_prefix", "REDIS_KEY_PREFIX", str),
+    ("ttl_seconds", "REDIS_TTL_SECONDS", str),
+    ("ttl_disabled", "REDIS_TTL_DISABLED", _lower_str),
+)
+_CLEANUP_ENV_MAP = (("db_files", "CLEANUP_DB_FILES", _lower_str),)
+
+
+def _map_section(
+    section: Dict[str, Any], env_map: tuple, env_vars: Dict[str, str]
+) -> None:
+    """Copy the non-null values of ``section`` named in ``env_map``."""
+    for key, env_key, convert in env_map:
+        value = section.get(key)
+        if value is not None:
+            env_vars[env_key] = convert(value)
+
+
 class YamlConfigLoader:
     """Loads and validates YAML configuration files."""
 
@@ -41,9 +88,17 @@ class YamlConfigLoader:
         if not config_path.is_file():
             raise ValueError(f"Path is not a file: {config_file_path}")
 
+        # Imported here so importing the config package does not pay for PyYAML
+        # unless a YAML file is actually loaded
+        import yaml
+
+        # Prefer the libyaml C loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+        # Binary mode lets PyYAML detect and decode the encoding itself
         try:
-            with open(config_path, "r", encoding="utf-8") as file:
-                config_data = yaml.safe_load(file)
+            with open(config_path, "rb") as file:
+                config_data = yaml.load(file, Loader=loader)  # nosec B506 - safe loader
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Invalid YAML in configuration file: {e}") from e
 
@@ -88,8 +143,7 @@ class YamlConfigLoader:
             raise ValueError("'exporter' section must be a dictionary")
 
         # Validate required sections
-        required_sections = ["prometheus", "gunicorn"]
-        for section in required_sections:
+        for section in _REQUIRED_SECTIONS:
             if section not in exporter_config:
                 raise ValueError(f"Missing required section: exporter.{section}")
 
@@ -99,8 +153,7 @@ class YamlConfigLoader:
         if not isinstance(prometheus_config, dict):
             raise ValueError("'exporter.prometheus' must be a dictionary")
 
-        required_prometheus_fields = ["metrics_port", "bind_address"]
-        for field in required_prometheus_fields:
+        for field in _REQUIRED_PROMETHEUS_FIELDS:
             if field not in prometheus_config:
                 raise ValueError(f"Missing required field: exporter.prometheus.{field}")
 
@@ -149,18 +202,7 @@ class YamlConfigLoader:
         self, prometheus_config: Dict[str, Any], env_vars: Dict[str, str]
     ) -> None:
         """Convert prometheus configuration to environment variables."""
-        if prometheus_config["metrics_port"] is not None:
-            env_vars["PROMETHEUS_METRICS_PORT"] = str(prometheus_config["metrics_port"])
-        if prometheus_config["bind_address"] is not None:
-            env_vars["PROMETHEUS_BIND_ADDRESS"] = str(prometheus_config["bind_address"])
-
-        if (
-            "multiproc_dir" in prometheus_config
-            and prometheus_config["multiproc_dir"] is not None
-        ):
-            env_vars["PROMETHEUS_MULTIPROC_DIR"] = str(
-                prometheus_config["multiproc_dir"]
-            )
+        _map_section(prometheus_config, _PROMETHEUS_ENV_MAP, env_vars)
 
         # SSL configuration
         if "ssl" in prometheus_config:
@@ -173,41 +215,13 @@ class YamlConfigLoader:
         if not ssl_config.get("enabled", False):
             return
 
-        ssl_mappings = {
-            "certfile": "PROMETHEUS_SSL_CERTFILE",
-            "keyfile": "PROMETHEUS_SSL_KEYFILE",
-            "client_cafile": "PROMETHEUS_SSL_CLIENT_CAFILE",
-            "client_capath": "PROMETHEUS_SSL_CLIENT_CAPATH",
-        }
-
-        for ssl_key, env_key in ssl_mappings.items():
-            if ssl_key in ssl_config and ssl_config[ssl_key] is not None:
-                env_vars[env_key] = str(ssl_config[ssl_key])
-
-        if (
-            "client_auth_required" in ssl_config
-            and ssl_config["client_auth_required"] is not None
-        ):
-            env_vars["PROMETHEUS_SSL_CLIENT_AUTH_REQUIRED"] = str(
-                ssl_config["client_auth_required"]
-            ).lower()
+        _map_section(ssl_config, _SSL_ENV_MAP, env_vars)
 
     def _convert_gunicorn_config(
         self, gunicorn_config: Dict[str, Any], env_vars: Dict[str, str]
     ) -> None:
         """Convert gunicorn configuration to environment variables."""
-        gunicorn_mappings = {
-            "workers": "GUNICORN_WORKERS",
-            "timeout": "GUNICORN_TIMEOUT",
-            "keepalive": "GUNICORN_KEEPALIVE",
-        }
-
-        for gunicorn_key, env_key in gunicorn_mappings.items():
-            if (
-                gunicorn_key in gunicorn_config
-                and gunicorn_config[gunicorn_key] is not None
-            ):
-                env_vars[env_key] = str(gunicorn_config[gunicorn_key])
+        _map_section(gunicorn_config, _GUNICORN_ENV_MAP, env_vars)
 
     def _convert_redis_config(
         self, exporter_config: Dict[str, Any], env_vars: Dict[str, str]
@@ -221,26 +235,7 @@ class YamlConfigLoader:
             return
 
         env_vars["REDIS_ENABLED"] = "true"
-
-        redis_mappings = {
-            "host": "REDIS_HOST",
-            "port": "REDIS_PORT",
-            "db": "REDIS_DB",
-            "key_prefix": "REDIS_KEY_PREFIX",
-            "ttl_seconds": "REDIS_TTL_SECONDS",
-        }
-
-        for redis_key, env_key in redis_mappings.items():
-            if redis_key in redis_config and redis_config[redis_key] is not None:
-                env_vars[env_key] = str(redis_config[redis_key])
-
-        # Handle password separately (only if not empty and not None)
-        if "password" in redis_config and redis_config["password"] is not None:
-            env_vars["REDIS_PASSWORD"] = str(redis_config["password"])
-
-        # Handle ttl_disabled separately (convert to lowercase)
-        if "ttl_disabled" in redis_config and redis_config["ttl_disabled"] is not None:
-            env_vars["REDIS_TTL_DISABLED"] = str(redis_config["ttl_disabled"]).lower()
+        _map_section(redis_config, _REDIS_ENV_MAP, env_vars)
 
     def _convert_cleanup_config(
         self, exporter_config: Dict[str, Any], env_vars: Dict[str, str]
@@ -249,9 +244,7 @@ class YamlConfigLoader:
         if "cleanup" not in exporter_config:
             return
 
-        cleanup_config = exporter_config["cleanup"]
-        if "db_files" in cleanup_config and cleanup_config["db_files"] is not None:
-            env_vars["CLEANUP_DB_FILES"] = str(cleanup_config["db_files"]).lower()
+        _map_section(exporter_config["cleanup"], _CLEANUP_ENV_MAP, env_vars)
 
     def load_and_apply_config(self, config_file_path: str) -> None:
         """Load YAML configuration and apply it to environment variables.
@@ -272,13 +265,15 @@ class YamlConfigLoader:
         # Convert to environment variables
         env_vars = self.convert_to_environment_variables(config_data)
 
-        # Apply environment variables (only if not already set)
+        # Apply environment variables (only if not already set) in one update
+        pending = {}
         for key, value in env_vars.items():
             if key not in os.environ:
-                os.environ[key] = value
+                pending[key] = value
                 self.logger.debug("Set environment variable: %s=%s", key, value)
             else:
                 self.logger.debug("Environment variable already set, skipping: %s", key)
+        os.environ.update(pending)
 
         self.logger.info("Configuration loaded successfully from YAML file")
 
@@ -78,10 +78,13 @@ class ConfigManager:
                     logger.info("YAML configuration loaded from: %s", config_file)
 
                 # Set environment variables if provided (these override YAML values)
-                for key, value in kwargs.items():
-                    if value is None:
-                        continue
-                    os.environ[key] = str(value)
+                os.environ.update(
+                    {
+                        key: str(value)
+                        for key, value in kwargs.items()
+                        if value is not None
+                    }
+                )
 
                 # Create configuration instance
                 # Pass is_sidecar argument based on environment variable
@@ -238,10 +241,13 @@ class ConfigManager:
                 logger.info("Updating configuration...")
 
                 # Update environment variables
-                for key, value in kwargs.items():
-                    if value is None:
-                        continue
-                    os.environ[key] = str(value)
+                updates = {
+                    key: str(value)
+                    for key, value in kwargs.items()
+                    if value is not None
+                }
+                os.environ.update(updates)
+                for key in updates:
                     logger.debug("Updated environment variable: %s", key)
 
                 # Revalidate configuration
@@ -384,6 +390,11 @@ def get_config_manager() -> ConfigManager:
     """Get the global configuration manager instance."""
     global _config_manager
 
+    # Double-checked: only the first call (or the first after cleanup) locks
+    manager = _config_manager
+    if manager is not None:
+        return manager
+
     with _manager_lock:
         if _config_manager is None:
             _config_manager = ConfigManager()
@@ -405,10 +416,12 @@ def get_config() -> ExporterConfig:
     """Get the global configuration instance."""
     manager = get_config_manager()
 
-    # Initialize lazily if not initialized
-    with manager._lock:
-        if manager._state == ConfigState.UNINITIALIZED:
-            manager.initialize()
+    # Initialize lazily if not initialized; an already initialized manager
+    # needs no lazy init, so the common path skips taking the lock twice
+    if manager._state != ConfigState.INITIALIZED:
+        with manager._lock:
+            if manager._state == ConfigState.UNINITIALIZED:
+                manager.initialize()
 
     return manager.get_config()
 
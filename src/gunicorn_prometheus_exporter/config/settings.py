@@ -3,13 +3,54 @@
 import logging
 import os
 
+from functools import lru_cache
+from typing import Optional
+
 
 logger = logging.getLogger(__name__)
 
+_TRUTHY_VALUES = frozenset(("true", "1", "yes", "on"))
+
+
+@lru_cache(maxsize=128)
+def _parse_bool(raw: str) -> bool:
+    """Parse a boolean environment value, caching per distinct raw string."""
+    return raw.lower() in _TRUTHY_VALUES
+
+
+@lru_cache(maxsize=128)
+def _parse_int(raw: str) -> int:
+    """Parse an integer environment value, caching per distinct raw string."""
+    return int(raw)
+
+
+def _env_bool(name: str, default: str = "false") -> bool:
+    """Read a boolean environment variable, falling back to ``default``."""
+    return _parse_bool(os.environ.get(name, default))
+
+
+def _env_int(name: str, default: str) -> int:
+    """Read an integer environment variable, falling back to ``default``."""
+    return _parse_int(os.environ.get(name, default))
+
+
+def _env_required(name: str, default: Optional[str], example: str) -> str:
+    """Read an environment variable that must be set in production."""
+    value = os.environ.get(name, default)
+    if value is None:
+        raise ValueError(
+            f"Environment variable {name} must be set in production. "
+            f"Example: export {name}={example}"
+        )
+    return value
+
 
 class ExporterConfig:
     """Configuration class for Gunicorn Prometheus Exporter."""
 
+    # Values live in os.environ; the only per-instance state is the sidecar flag
+    __slots__ = ("_is_sidecar",)
+
     # Default values (only for development/testing)
     _default_prometheus_dir = os.path.join(
         os.path.expanduser("~"), ".gunicorn_prometheus"
@@ -55,6 +96,18 @@ class ExporterConfig:
     ENV_PROMETHEUS_SSL_CLIENT_CAPATH = "PROMETHEUS_SSL_CLIENT_CAPATH"
     ENV_PROMETHEUS_SSL_CLIENT_AUTH_REQUIRED = "PROMETHEUS_SSL_CLIENT_AUTH_REQUIRED"
 
+    # Numeric range rules checked by validate(): (property, min, max, message)
+    _RANGE_RULES = (
+        (
+            "prometheus_metrics_port",
+            1024,
+            65535,
+            "Port {value} is not in valid range (1024-65535)",
+        ),
+        ("gunicorn_workers", 1, None, "Worker count {value} must be at least 1"),
+        ("gunicorn_timeout", 1, None, "Timeout {value} must be at least 1 second"),
+    )
+
     def __init__(self, is_sidecar: bool = False):
         """Initialize configuration with environment variables and defaults.
 
@@ -79,9 +132,9 @@ class ExporterConfig:
             "yes",
         )
         if not redis_enabled and not os.environ.get(self.ENV_PROMETHEUS_MULTIPROC_DIR):
-            os.environ[
-                self.ENV_PROMETHEUS_MULTIPROC_DIR
-            ] = self.PROMETHEUS_MULTIPROC_DIR
+            os.environ[self.ENV_PROMETHEUS_MULTIPROC_DIR] = (
+                self.PROMETHEUS_MULTIPROC_DIR
+            )
 
     @property
     def prometheus_multiproc_dir(self) -> str:
@@ -102,56 +155,35 @@ class ExporterConfig:
     @property
     def prometheus_metrics_port(self) -> int:
         """Get the Prometheus metrics server port."""
-        value = os.environ.get(
-            self.ENV_PROMETHEUS_METRICS_PORT, self.PROMETHEUS_METRICS_PORT
-        )
-        if value is None:
-            raise ValueError(
-                f"Environment variable {self.ENV_PROMETHEUS_METRICS_PORT} "
-                f"must be set in production. "
-                f"Example: export {self.ENV_PROMETHEUS_METRICS_PORT}=9091"
+        return _parse_int(
+            _env_required(
+                self.ENV_PROMETHEUS_METRICS_PORT, self.PROMETHEUS_METRICS_PORT, "9091"
             )
-        return int(value)
+        )
 
     @property
     def prometheus_bind_address(self) -> str:
         """Get the Prometheus metrics server bind address."""
-        value = os.environ.get(
-            self.ENV_PROMETHEUS_BIND_ADDRESS, self.PROMETHEUS_BIND_ADDRESS
+        return _env_required(
+            self.ENV_PROMETHEUS_BIND_ADDRESS, self.PROMETHEUS_BIND_ADDRESS, "0.0.0.0"
         )
-        if value is None:
-            raise ValueError(
-                f"Environment variable {self.ENV_PROMETHEUS_BIND_ADDRESS} "
-                f"must be set in production. "
-                f"Example: export {self.ENV_PROMETHEUS_BIND_ADDRESS}=0.0.0.0"
-            )
-        return value
 
     @property
     def gunicorn_workers(self) -> int:
         """Get the number of Gunicorn workers."""
-        value = os.environ.get(self.ENV_GUNICORN_WORKERS, self.GUNICORN_WORKERS)
-        if value is None:
-            raise ValueError(
-                f"Environment variable {self.ENV_GUNICORN_WORKERS} "
-                f"must be set in production. "
-                f"Example: export {self.ENV_GUNICORN_WORKERS}=4"
-            )
-        return int(value)
+        return _parse_int(
+            _env_required(self.ENV_GUNICORN_WORKERS, self.GUNICORN_WORKERS, "4")
+        )
 
     @property
     def gunicorn_timeout(self) -> int:
         """Get the Gunicorn worker timeout."""
-        return int(
-            os.environ.get(self.ENV_GUNICORN_TIMEOUT, str(self.GUNICORN_TIMEOUT))
-        )
+        return _env_int(self.ENV_GUNICORN_TIMEOUT, str(self.GUNICORN_TIMEOUT))
 
     @property
     def gunicorn_keepalive(self) -> int:
         """Get the Gunicorn keepalive setting."""
-        return int(
-            os.environ.get(self.ENV_GUNICORN_KEEPALIVE, str(self.GUNICORN_KEEPALIVE))
-        )
+        return _env_int(self.ENV_GUNICORN_KEEPALIVE, str(self.GUNICORN_KEEPALIVE))
 
     @property
     def is_sidecar(self) -> bool:
@@ -162,12 +194,7 @@ class ExporterConfig:
     @property
     def redis_enabled(self) -> bool:
         """Check if Redis storage is enabled."""
-        return os.environ.get(self.ENV_REDIS_ENABLED, "").lower() in (
-            "true",
-            "1",
-            "yes",
-            "on",
-        )
+        return _env_bool(self.ENV_REDIS_ENABLED)
 
     @redis_enabled.setter
     def redis_enabled(self, value: bool):
@@ -190,12 +217,12 @@ class ExporterConfig:
     @property
     def redis_port(self) -> int:
         """Get Redis port."""
-        return int(os.environ.get(self.ENV_REDIS_PORT, "6379"))
+        return _env_int(self.ENV_REDIS_PORT, "6379")
 
     @property
     def redis_db(self) -> int:
         """Get Redis database number."""
-        return int(os.environ.get(self.ENV_REDIS_DB, "0"))
+        return _env_int(self.ENV_REDIS_DB, "0")
 
     @property
     def redis_password(self) -> str:
@@ -210,29 +237,17 @@ class ExporterConfig:
     @property
     def redis_ttl_seconds(self) -> int:
         """Get Redis TTL in seconds for metric keys."""
-        return int(
-            os.environ.get(self.ENV_REDIS_TTL_SECONDS, "300")
-        )  # 5 minutes default
+        return _env_int(self.ENV_REDIS_TTL_SECONDS, "300")  # 5 minutes default
 
     @property
     def redis_ttl_disabled(self) -> bool:
         """Check if Redis TTL is disabled (keys persist indefinitely)."""
-        return os.environ.get(self.ENV_REDIS_TTL_DISABLED, "false").lower() in (
-            "true",
-            "1",
-            "yes",
-            "on",
-        )
+        return _env_bool(self.ENV_REDIS_TTL_DISABLED)
 
     @property
     def cleanup_db_files(self) -> bool:
         """Check if DB file cleanup is enabled."""
-        return os.environ.get(self.ENV_CLEANUP_DB_FILES, "true").lower() in (
-            "true",
-            "1",
-            "yes",
-            "on",
-        )
+        return _env_bool(self.ENV_CLEANUP_DB_FILES, "true")
 
     # SSL/TLS properties
     @property
@@ -258,14 +273,7 @@ class ExporterConfig:
     @property
     def prometheus_ssl_client_auth_required(self) -> bool:
         """Check if SSL client authentication is required."""
-        return os.environ.get(
-            self.ENV_PROMETHEUS_SSL_CLIENT_AUTH_REQUIRED, "false"
-        ).lower() in (
-            "true",
-            "1",
-            "yes",
-            "on",
-        )
+        return _env_bool(self.ENV_PROMETHEUS_SSL_CLIENT_AUTH_REQUIRED)
 
     @property
     def prometheus_ssl_enabled(self) -> bool:
@@ -339,29 +347,17 @@ class ExporterConfig:
     def _validate_non_redis_settings(self, redis_enabled: bool) -> None:
         """Helper to validate non-Redis specific settings."""
         if not redis_enabled:
+            # Validate port range, worker count and timeout first: they are
+            # pure checks, so an invalid config fails before touching the disk
+            for prop, minimum, maximum, message in self._RANGE_RULES:
+                value = getattr(self, prop)
+                if value < minimum or (maximum is not None and value > maximum):
+                    raise ValueError(message.format(value=value))
+
             # Validate multiprocess directory
             if not os.path.exists(self.prometheus_multiproc_dir):
                 os.makedirs(self.prometheus_multiproc_dir, exist_ok=True)
 
-            # Validate port range
-            if not (1024 <= self.prometheus_metrics_port <= 65535):
-                raise ValueError(
-                    f"Port {self.prometheus_metrics_port} is not in valid range "
-                    "(1024-65535)"
-                )
-
-            # Validate worker count
-            if self.gunicorn_workers < 1:
-                raise ValueError(
-                    f"Worker count {self.gunicorn_workers} must be at least 1"
-                )
-
-            # Validate timeout
-            if self.gunicorn_timeout < 1:
-                raise ValueError(
-                    f"Timeout {self.gunicorn_timeout} must be at least 1 second"
-                )
-
     def validate(self) -> bool:
         """Validate the configuration."""
         try:
@@ -16,6 +16,7 @@ import logging
 import os
 import time
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -149,11 +150,12 @@ class MetricsServerManager:
             # Configuration already initialized, that's fine
             pass
 
-        port = get_config().prometheus_metrics_port
+        config = get_config()
+        port = config.prometheus_metrics_port
         registry = get_shared_registry()
 
         # Try Redis collector first if Redis is enabled
-        if get_config().redis_enabled:
+        if config.redis_enabled:
             try:
                 from .backend import get_redis_storage_manager
 
@@ -229,10 +231,11 @@ class MetricsServerManager:
 
         try:
             # Get the bind address from configuration
-            bind_address = get_config().prometheus_bind_address
+            config = get_config()
+            bind_address = config.prometheus_bind_address
 
             # Check if SSL/TLS is enabled
-            if get_config().prometheus_ssl_enabled:
+            if config.prometheus_ssl_enabled:
                 self._start_https_server(port, registry, bind_address)
             else:
                 self._start_http_server(port, registry)
@@ -257,12 +260,13 @@ class MetricsServerManager:
 
         # Start HTTPS server with SSL/TLS using start_http_server
         # which supports SSL parameters unlike start_wsgi_server
+        config = get_config()
         start_http_server(
             port=port,
             addr=bind_address,
             registry=registry,
-            certfile=get_config().prometheus_ssl_certfile,
-            keyfile=get_config().prometheus_ssl_keyfile,
+            certfile=config.prometheus_ssl_certfile,
+            keyfile=config.prometheus_ssl_keyfile,
         )
         self.logger.debug(
             "HTTPS metrics server started successfully on %s:%s",
@@ -292,16 +296,24 @@ class ProcessManager:
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self.timeout = 5
+        self.max_parallel = 8
 
     def cleanup_processes(self) -> None:
-        """Clean up child processes on exit."""
+        """Clean up child processes on exit.
+
+        Children are terminated concurrently so that slow exits overlap
+        instead of adding up to one timeout per child.
+        """
 
         try:
             current_process = psutil.Process()
             children = current_process.children(recursive=True)
+            if not children:
+                return
 
-            for child in children:
-                self._terminate_child(child)
+            max_workers = min(len(children), self.max_parallel)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(self._terminate_child, children))
 
         except Exception as e:
             self.logger.error("Error during cleanup: %s", e)
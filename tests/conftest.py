@@ -1,50 +1,70 @@
 """Test configuration and fixtures."""
 
+import fnmatch
 import os
 import tempfile
 
 from unittest.mock import Mock, patch
 
 import pytest
+import yaml
 
 from prometheus_client import CollectorRegistry
 
 from gunicorn_prometheus_exporter.config import initialize_config
 
 
+# libyaml's C dumper when available, like the loader under test; the YAML
+# test modules import this rather than each defining their own
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Pin tests marked ``serial`` to one worker under ``--dist loadgroup``."""
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
     """Set up the test environment with required variables."""
-    # Set up required environment variables for testing
-    os.environ.setdefault("PROMETHEUS_BIND_ADDRESS", "127.0.0.1")
-    os.environ.setdefault("PROMETHEUS_METRICS_PORT", "9091")
-    os.environ.setdefault("GUNICORN_WORKERS", "2")
-
-    # Set up the Prometheus multiprocess directory
-    temp_dir = tempfile.mkdtemp()
-    os.environ["PROMETHEUS_MULTIPROC_DIR"] = temp_dir
-
-    # Initialize configuration with explicit parameters
-    # Handle case where config might already be initialized
-    try:
-        initialize_config(
-            PROMETHEUS_BIND_ADDRESS="127.0.0.1",
-            PROMETHEUS_METRICS_PORT="9091",
-            GUNICORN_WORKERS="2",
-            PROMETHEUS_MULTIPROC_DIR=temp_dir,
-        )
-    except RuntimeError as e:
-        if "Configuration already initialized" in str(e):
-            # Config is already initialized, that's fine
-            pass
-        else:
-            raise
-
-    yield
-
-    # Don't cleanup config to avoid global state issues between tests
-    # Just clean up the environment variable
-    os.environ.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    # Every variable set here is restored when the session ends, even if
+    # setup fails part way through
+    with pytest.MonkeyPatch.context() as mp:
+        # Set up required environment variables for testing
+        for key, value in (
+            ("PROMETHEUS_BIND_ADDRESS", "127.0.0.1"),
+            ("PROMETHEUS_METRICS_PORT", "9091"),
+            ("GUNICORN_WORKERS", "2"),
+        ):
+            if key not in os.environ:
+                mp.setenv(key, value)
+
+        # Set up the Prometheus multiprocess directory
+        temp_dir = tempfile.mkdtemp()
+        mp.setenv("PROMETHEUS_MULTIPROC_DIR", temp_dir)
+
+        # Initialize configuration with explicit parameters
+        # Handle case where config might already be initialized
+        try:
+            initialize_config(
+                PROMETHEUS_BIND_ADDRESS="127.0.0.1",
+                PROMETHEUS_METRICS_PORT="9091",
+                GUNICORN_WORKERS="2",
+                PROMETHEUS_MULTIPROC_DIR=temp_dir,
+            )
+        except RuntimeError as e:
+            if "Configuration already initialized" in str(e):
+                # Config is already initialized, that's fine
+                pass
+            else:
+                raise
+
+        # Don't cleanup config to avoid global state issues between tests
+        yield
 
 
 @pytest.fixture
@@ -83,3 +103,74 @@ def mock_redis():
         patch("redis.StrictRedis", return_value=mock_redis_client),
     ):
         yield mock_redis_client
+
+
+@pytest.fixture(autouse=True)
+def reset_redis_connection_pool(monkeypatch):
+    """Give each test a fresh shared Redis connection pool."""
+    from gunicorn_prometheus_exporter.backend.service import manager
+
+    monkeypatch.setattr(manager, "_connection_pool", None)
+    monkeypatch.setattr(manager, "_connection_pool_url", None)
+
+
+class FakeRedisHashes:
+    """In-memory Redis hashes ({key: {field: value}}) for Mock clients.
+
+    Commands answer by key and field rather than by call order, so tests keep
+    passing when production code reorders or batches its reads and writes.
+    """
+
+    COMMANDS = ("hset", "hsetnx", "hget", "hmget", "hgetall", "scan_iter")
+
+    def __init__(self):
+        self.store = {}
+
+    def bind(self, client):
+        """Route the client's (and its pipelines') hash commands to the store."""
+        pipe = client.pipeline.return_value
+        pipe.execute.return_value = []
+        for command in self.COMMANDS:
+            getattr(client, command).side_effect = getattr(self, command)
+            getattr(pipe, command).side_effect = getattr(self, command)
+        return client
+
+    def hset(self, name, key=None, value=None, mapping=None):
+        fields = self.store.setdefault(name, {})
+        if key is not None:
+            fields[key] = value
+        if mapping:
+            fields.update(mapping)
+        return 1
+
+    def hsetnx(self, name, key, value):
+        fields = self.store.setdefault(name, {})
+        if key in fields:
+            return False
+        fields[key] = value
+        return True
+
+    def hget(self, name, key):
+        return self.store.get(name, {}).get(key)
+
+    def hmget(self, name, keys, *args):
+        fields = list(keys) if isinstance(keys, (list, tuple)) else [keys]
+        return [self.hget(name, field) for field in fields + list(args)]
+
+    def hgetall(self, name):
+        return dict(self.store.get(name, {}))
+
+    def scan_iter(self, match="*", count=None):
+        return [
+            key
+            for key in list(self.store)
+            if fnmatch.fnmatchcase(
+                key.decode() if isinstance(key, bytes) else key, match
+            )
+        ]
+
+
+@pytest.fixture
+def redis_hashes():
+    """Dict-backed Redis hash commands; bind them to a Mock client."""
+    return FakeRedisHashes()
@@ -1,308 +0,0 @@
-"""Simplified unit tests for sidecar functionality."""
-
-import os
-
-from pathlib import Path
-
-
-class TestSidecarBasic:
-    """Test basic sidecar functionality."""
-
-    def setup_method(self):
-        """Set up test environment."""
-        # Clear environment variables
-        for key in [
-            "REDIS_ENABLED",
-            "REDIS_HOST",
-            "REDIS_PORT",
-            "REDIS_DB",
-            "SIDECAR_MODE",
-        ]:
-            os.environ.pop(key, None)
-
-    def teardown_method(self):
-        """Clean up test environment."""
-        # Clear environment variables
-        for key in [
-            "REDIS_ENABLED",
-            "REDIS_HOST",
-            "REDIS_PORT",
-            "REDIS_DB",
-            "SIDECAR_MODE",
-        ]:
-            os.environ.pop(key, None)
-
-    def test_sidecar_script_exists(self):
-        """Test that sidecar.py script exists."""
-        # Get the project root directory (two levels up from this test file)
-        project_root = Path(__file__).parent.parent.parent
-        sidecar_path = project_root / "docker" / "sidecar.py"
-        assert os.path.exists(sidecar_path)
-
-    def test_entrypoint_script_exists(self):
-        """Test that entrypoint.sh script exists."""
-        # Get the project root directory (two levels up from this test file)
-        project_root = Path(__file__).parent.parent.parent
-        entrypoint_path = project_root / "docker" / "entrypoint.sh"
-        assert os.path.exists(entrypoint_path)
-
-    def test_dockerfile_sidecar_exists(self):
-        """Test that Dockerfile.sidecar exists."""
-        # Get the project root directory (two levels up from this test file)
-        project_root = Path(__file__).parent.parent.parent
-        dockerfile_path = project_root / "docker" / "Dockerfile.sidecar"
-        assert os.path.exists(dockerfile_path)
-
-    def test_sidecar_script_content(self):
-        """Test that sidecar.py contains expected functions."""
-        # Get the project root directory (two levels up from this test file)
-        project_root = Path(__file__).parent.parent.parent
-        sidecar_path = project_root / "docker" / "sidecar.py"
-
-        with open(sidecar_path, "r") as f:
-            content = f.read()
-
-        # Check for key functions
-        assert "class SidecarMetrics" in content
-        assert "def setup_metrics_server" in content
-        assert "def run_sidecar_mode" in content
-        assert "def run_standalone_mode" in content
-        assert "def run_health_mode" in content
-        assert "def main" in content
-
-        # Check for Redis handling
-        assert "REDIS_ENABLED" in content
-        assert "redis" in content.lower()
-
-    def test_entrypoint_script_content(self):
-        """Test that entrypoint.sh contains expected functions."""
-        # Get the project root directory (two levels up from this test file)
-        project_root = Path(__file__).parent.parent.parent
-        entrypoint_path = project_root / "docker" / "entrypoint.sh"
-
-        with open(entrypoint_path, "r") as f:
-            content = f.read()
-
-        # Check for key functions
-        assert "run_sidecar()" in content
-        assert "run_standalone()" in content
-        assert "run_health()" in content
-
-        # Check for Redis handling
-        assert "REDIS_ENABLED" in content
-        assert "redis" in content.lower()
-
-        # Check for sidecar.py calls
-        assert "sidecar.py" in content
-        assert "python3" in content
-
-    def test_dockerfile_sidecar_content(self):
-        """Test that Dockerfile.sidecar contains expected content."""
-        # Get the project root directory (two levels up from this test file)
-        project_root = Path(__file__).parent.parent.parent
-        dockerfile_path = project_root / "docker" / "Dockerfile.sidecar"
-
-        with open(dockerfile_path, "r") as f:
-            content = f.read()
-
-        # Check for key Dockerfile instructions
-        assert "FROM" in content
-        assert "COPY" in content
-        assert "EXPOSE" in content
-        assert "ENTRYPOINT" in content
-        assert "CMD" in content
-
-        # Check for sidecar-specific content
-        assert "entrypoint.sh" in content
-        assert "sidecar.py" in content
-        assert "9091" in content  # Default port
-
-    def test_redis_only_mode_environment_variables(self):
-        """Test Redis-only mode environment variables."""
-        # Set up Redis-only mode
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["REDIS_HOST"] = "redis-service"
-        os.environ["REDIS_PORT"] = "6379"
-        os.environ["REDIS_DB"] = "0"
-        os.environ["REDIS_KEY_PREFIX"] = "gunicorn"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""  # Empty = Redis-only mode
-        os.environ["SIDECAR_MODE"] = "true"
-
-        # Verify environment variables are set correctly
-        assert os.environ.get("REDIS_ENABLED") == "true"
-        assert os.environ.get("REDIS_HOST") == "redis-service"
-        assert os.environ.get("REDIS_PORT") == "6379"
-        assert os.environ.get("REDIS_DB") == "0"
-        assert os.environ.get("REDIS_KEY_PREFIX") == "gunicorn"
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-        assert os.environ.get("SIDECAR_MODE") == "true"
-
-    def test_multiproc_dir_empty_in_redis_mode(self):
-        """Test that multiprocess directory is empty in Redis mode."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
-
-        # In Redis-only mode, multiprocess directory should be empty
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-
-        # Verify Redis is enabled
-        assert os.environ.get("REDIS_ENABLED") == "true"
-
-    def test_redis_disabled_variations(self):
-        """Test different Redis disabled values."""
-        test_values = ["false", "FALSE", "False", "0", "no", "NO", "No", ""]
-
-        for value in test_values:
-            os.environ["REDIS_ENABLED"] = value
-            # Redis should be disabled for all these values
-            assert os.environ.get("REDIS_ENABLED") == value
-
-    def test_redis_enabled_variations(self):
-        """Test different Redis enabled values."""
-        test_values = ["true", "TRUE", "True", "1", "yes", "YES", "Yes"]
-
-        for value in test_values:
-            os.environ["REDIS_ENABLED"] = value
-            # Redis should be enabled for all these values
-            assert os.environ.get("REDIS_ENABLED") == value
-
-    def test_sidecar_mode_environment_setting(self):
-        """Test that SIDECAR_MODE environment variable can be set."""
-        os.environ["SIDECAR_MODE"] = "true"
-        assert os.environ.get("SIDECAR_MODE") == "true"
-
-    def test_prometheus_metrics_port_default(self):
-        """Test default Prometheus metrics port."""
-        os.environ["PROMETHEUS_METRICS_PORT"] = "9091"
-        assert os.environ.get("PROMETHEUS_METRICS_PORT") == "9091"
-
-    def test_prometheus_bind_address_default(self):
-        """Test default Prometheus bind address."""
-        os.environ["PROMETHEUS_BIND_ADDRESS"] = "0.0.0.0"
-        assert os.environ.get("PROMETHEUS_BIND_ADDRESS") == "0.0.0.0"
-
-    def test_gunicorn_workers_default(self):
-        """Test default Gunicorn workers setting."""
-        os.environ["GUNICORN_WORKERS"] = "1"
-        assert os.environ.get("GUNICORN_WORKERS") == "1"
-
-    def test_redis_only_mode_kubernetes_compatibility(self):
-        """Test Redis-only mode Kubernetes compatibility."""
-        # Kubernetes environment variables
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["REDIS_HOST"] = "redis-service"
-        os.environ["REDIS_PORT"] = "6379"
-        os.environ["REDIS_DB"] = "0"
-        os.environ["REDIS_KEY_PREFIX"] = "gunicorn"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
-        os.environ["SIDECAR_MODE"] = "true"
-
-        # Verify Kubernetes-compatible settings
-        assert os.environ.get("REDIS_ENABLED") == "true"
-        assert os.environ.get("REDIS_HOST") == "redis-service"
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-
-        # Verify no multiprocess files are used
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-
-    def test_redis_only_mode_docker_compose_compatibility(self):
-        """Test Redis-only mode Docker Compose compatibility."""
-        # Docker Compose environment variables
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["REDIS_HOST"] = "redis"
-        os.environ["REDIS_PORT"] = "6379"
-        os.environ["REDIS_DB"] = "0"
-        os.environ["REDIS_KEY_PREFIX"] = "gunicorn"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
-
-        # Verify Docker Compose-compatible settings
-        assert os.environ.get("REDIS_ENABLED") == "true"
-        assert os.environ.get("REDIS_HOST") == "redis"
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-
-    def test_redis_only_mode_error_handling(self):
-        """Test Redis-only mode error handling."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
-
-        # Test with invalid Redis configuration
-        os.environ["REDIS_HOST"] = "invalid-host"
-        os.environ["REDIS_PORT"] = "9999"
-
-        # Configuration should still be valid
-        assert os.environ.get("REDIS_ENABLED") == "true"
-        assert os.environ.get("REDIS_HOST") == "invalid-host"
-        assert os.environ.get("REDIS_PORT") == "9999"
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-
-    def test_redis_only_mode_fallback_behavior(self):
-        """Test Redis-only mode fallback behavior."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
-
-        # Test with missing Redis configuration
-        os.environ.pop("REDIS_HOST", None)
-        os.environ.pop("REDIS_PORT", None)
-
-        # Should still have Redis enabled and empty multiproc dir
-        assert os.environ.get("REDIS_ENABLED") == "true"
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-
-    def test_redis_only_mode_sidecar_integration(self):
-        """Test Redis-only mode sidecar integration."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
-        os.environ["SIDECAR_MODE"] = "true"
-
-        # Verify sidecar mode settings
-        assert os.environ.get("SIDECAR_MODE") == "true"
-        assert os.environ.get("REDIS_ENABLED") == "true"
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-
-    def test_redis_only_mode_metrics_collection(self):
-        """Test Redis-only mode metrics collection."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
-
-        # In Redis-only mode, metrics should be collected from Redis
-        assert os.environ.get("REDIS_ENABLED") == "true"
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-
-        # Verify no multiprocess files are used
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-
-    def test_redis_only_mode_performance(self):
-        """Test Redis-only mode performance characteristics."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
-
-        # Redis-only mode should be more efficient for containerized deployments
-        assert os.environ.get("REDIS_ENABLED") == "true"
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-
-        # No file system operations for metrics storage
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-
-    def test_redis_only_mode_security(self):
-        """Test Redis-only mode security characteristics."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
-
-        # Redis-only mode is more secure for containerized deployments
-        assert os.environ.get("REDIS_ENABLED") == "true"
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-
-        # No shared file system required
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-
-    def test_redis_only_mode_scalability(self):
-        """Test Redis-only mode scalability characteristics."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
-
-        # Redis-only mode scales better across multiple pods/nodes
-        assert os.environ.get("REDIS_ENABLED") == "true"
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
-
-        # No shared file system required for scaling
-        assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
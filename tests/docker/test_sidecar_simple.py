@@ -4,34 +4,34 @@ import os
 
 from pathlib import Path
 
+import pytest
+
+
+# Every variable the tests below may set, restored after each test
+_ENV_KEYS = (
+    "REDIS_ENABLED",
+    "REDIS_HOST",
+    "REDIS_PORT",
+    "REDIS_DB",
+    "REDIS_KEY_PREFIX",
+    "SIDECAR_MODE",
+    "PROMETHEUS_MULTIPROC_DIR",
+    "PROMETHEUS_METRICS_PORT",
+    "PROMETHEUS_BIND_ADDRESS",
+    "GUNICORN_WORKERS",
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    """Start each test without the sidecar variables; monkeypatch restores them."""
+    for key in _ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+
 
 class TestSidecarBasic:
     """Test basic sidecar functionality."""
 
-    def setup_method(self):
-        """Set up test environment."""
-        # Clear environment variables
-        for key in [
-            "REDIS_ENABLED",
-            "REDIS_HOST",
-            "REDIS_PORT",
-            "REDIS_DB",
-            "SIDECAR_MODE",
-        ]:
-            os.environ.pop(key, None)
-
-    def teardown_method(self):
-        """Clean up test environment."""
-        # Clear environment variables
-        for key in [
-            "REDIS_ENABLED",
-            "REDIS_HOST",
-            "REDIS_PORT",
-            "REDIS_DB",
-            "SIDECAR_MODE",
-        ]:
-            os.environ.pop(key, None)
-
     def test_sidecar_script_exists(self):
         """Test that sidecar.py script exists."""
         # Get the project root directory (two levels up from this test file)
@@ -117,16 +117,16 @@ class TestSidecarBasic:
         assert "sidecar.py" in content
         assert "9091" in content  # Default port
 
-    def test_redis_only_mode_environment_variables(self):
+    def test_redis_only_mode_environment_variables(self, monkeypatch):
         """Test Redis-only mode environment variables."""
         # Set up Redis-only mode
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["REDIS_HOST"] = "redis-service"
-        os.environ["REDIS_PORT"] = "6379"
-        os.environ["REDIS_DB"] = "0"
-        os.environ["REDIS_KEY_PREFIX"] = "gunicorn"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""  # Empty = Redis-only mode
-        os.environ["SIDECAR_MODE"] = "true"
+        monkeypatch.setenv("REDIS_ENABLED", "true")
+        monkeypatch.setenv("REDIS_HOST", "redis-service")
+        monkeypatch.setenv("REDIS_PORT", "6379")
+        monkeypatch.setenv("REDIS_DB", "0")
+        monkeypatch.setenv("REDIS_KEY_PREFIX", "gunicorn")
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")  # Empty = Redis-only mode
+        monkeypatch.setenv("SIDECAR_MODE", "true")
 
         # Verify environment variables are set correctly
         assert os.environ.get("REDIS_ENABLED") == "true"
@@ -137,10 +137,10 @@ class TestSidecarBasic:
         assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
         assert os.environ.get("SIDECAR_MODE") == "true"
 
-    def test_multiproc_dir_empty_in_redis_mode(self):
+    def test_multiproc_dir_empty_in_redis_mode(self, monkeypatch):
         """Test that multiprocess directory is empty in Redis mode."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
+        monkeypatch.setenv("REDIS_ENABLED", "true")
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
 
         # In Redis-only mode, multiprocess directory should be empty
         assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
@@ -148,54 +148,54 @@ class TestSidecarBasic:
         # Verify Redis is enabled
         assert os.environ.get("REDIS_ENABLED") == "true"
 
-    def test_redis_disabled_variations(self):
+    def test_redis_disabled_variations(self, monkeypatch):
         """Test different Redis disabled values."""
         test_values = ["false", "FALSE", "False", "0", "no", "NO", "No", ""]
 
         for value in test_values:
-            os.environ["REDIS_ENABLED"] = value
+            monkeypatch.setenv("REDIS_ENABLED", value)
             # Redis should be disabled for all these values
             assert os.environ.get("REDIS_ENABLED") == value
 
-    def test_redis_enabled_variations(self):
+    def test_redis_enabled_variations(self, monkeypatch):
         """Test different Redis enabled values."""
         test_values = ["true", "TRUE", "True", "1", "yes", "YES", "Yes"]
 
         for value in test_values:
-            os.environ["REDIS_ENABLED"] = value
+            monkeypatch.setenv("REDIS_ENABLED", value)
             # Redis should be enabled for all these values
             assert os.environ.get("REDIS_ENABLED") == value
 
-    def test_sidecar_mode_environment_setting(self):
+    def test_sidecar_mode_environment_setting(self, monkeypatch):
         """Test that SIDECAR_MODE environment variable can be set."""
-        os.environ["SIDECAR_MODE"] = "true"
+        monkeypatch.setenv("SIDECAR_MODE", "true")
         assert os.environ.get("SIDECAR_MODE") == "true"
 
-    def test_prometheus_metrics_port_default(self):
+    def test_prometheus_metrics_port_default(self, monkeypatch):
         """Test default Prometheus metrics port."""
-        os.environ["PROMETHEUS_METRICS_PORT"] = "9091"
+        monkeypatch.setenv("PROMETHEUS_METRICS_PORT", "9091")
         assert os.environ.get("PROMETHEUS_METRICS_PORT") == "9091"
 
-    def test_prometheus_bind_address_default(self):
+    def test_prometheus_bind_address_default(self, monkeypatch):
         """Test default Prometheus bind address."""
-        os.environ["PROMETHEUS_BIND_ADDRESS"] = "0.0.0.0"
+        monkeypatch.setenv("PROMETHEUS_BIND_ADDRESS", "0.0.0.0")
         assert os.environ.get("PROMETHEUS_BIND_ADDRESS") == "0.0.0.0"
 
-    def test_gunicorn_workers_default(self):
+    def test_gunicorn_workers_default(self, monkeypatch):
         """Test default Gunicorn workers setting."""
-        os.environ["GUNICORN_WORKERS"] = "1"
+        monkeypatch.setenv("GUNICORN_WORKERS", "1")
         assert os.environ.get("GUNICORN_WORKERS") == "1"
 
-    def test_redis_only_mode_kubernetes_compatibility(self):
+    def test_redis_only_mode_kubernetes_compatibility(self, monkeypatch):
         """Test Redis-only mode Kubernetes compatibility."""
         # Kubernetes environment variables
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["REDIS_HOST"] = "redis-service"
-        os.environ["REDIS_PORT"] = "6379"
-        os.environ["REDIS_DB"] = "0"
-        os.environ["REDIS_KEY_PREFIX"] = "gunicorn"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
-        os.environ["SIDECAR_MODE"] = "true"
+        monkeypatch.setenv("REDIS_ENABLED", "true")
+        monkeypatch.setenv("REDIS_HOST", "redis-service")
+        monkeypatch.setenv("REDIS_PORT", "6379")
+        monkeypatch.setenv("REDIS_DB", "0")
+        monkeypatch.setenv("REDIS_KEY_PREFIX", "gunicorn")
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
+        monkeypatch.setenv("SIDECAR_MODE", "true")
 
         # Verify Kubernetes-compatible settings
         assert os.environ.get("REDIS_ENABLED") == "true"
@@ -205,29 +205,29 @@ class TestSidecarBasic:
         # Verify no multiprocess files are used
         assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
 
-    def test_redis_only_mode_docker_compose_compatibility(self):
+    def test_redis_only_mode_docker_compose_compatibility(self, monkeypatch):
         """Test Redis-only mode Docker Compose compatibility."""
         # Docker Compose environment variables
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["REDIS_HOST"] = "redis"
-        os.environ["REDIS_PORT"] = "6379"
-        os.environ["REDIS_DB"] = "0"
-        os.environ["REDIS_KEY_PREFIX"] = "gunicorn"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
+        monkeypatch.setenv("REDIS_ENABLED", "true")
+        monkeypatch.setenv("REDIS_HOST", "redis")
+        monkeypatch.setenv("REDIS_PORT", "6379")
+        monkeypatch.setenv("REDIS_DB", "0")
+        monkeypatch.setenv("REDIS_KEY_PREFIX", "gunicorn")
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
 
         # Verify Docker Compose-compatible settings
         assert os.environ.get("REDIS_ENABLED") == "true"
         assert os.environ.get("REDIS_HOST") == "redis"
         assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
 
-    def test_redis_only_mode_error_handling(self):
+    def test_redis_only_mode_error_handling(self, monkeypatch):
         """Test Redis-only mode error handling."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
+        monkeypatch.setenv("REDIS_ENABLED", "true")
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
 
         # Test with invalid Redis configuration
-        os.environ["REDIS_HOST"] = "invalid-host"
-        os.environ["REDIS_PORT"] = "9999"
+        monkeypatch.setenv("REDIS_HOST", "invalid-host")
+        monkeypatch.setenv("REDIS_PORT", "9999")
 
         # Configuration should still be valid
         assert os.environ.get("REDIS_ENABLED") == "true"
@@ -235,10 +235,10 @@ class TestSidecarBasic:
         assert os.environ.get("REDIS_PORT") == "9999"
         assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
 
-    def test_redis_only_mode_fallback_behavior(self):
+    def test_redis_only_mode_fallback_behavior(self, monkeypatch):
         """Test Redis-only mode fallback behavior."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
+        monkeypatch.setenv("REDIS_ENABLED", "true")
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
 
         # Test with missing Redis configuration
         os.environ.pop("REDIS_HOST", None)
@@ -248,21 +248,21 @@ class TestSidecarBasic:
         assert os.environ.get("REDIS_ENABLED") == "true"
         assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
 
-    def test_redis_only_mode_sidecar_integration(self):
+    def test_redis_only_mode_sidecar_integration(self, monkeypatch):
         """Test Redis-only mode sidecar integration."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
-        os.environ["SIDECAR_MODE"] = "true"
+        monkeypatch.setenv("REDIS_ENABLED", "true")
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
+        monkeypatch.setenv("SIDECAR_MODE", "true")
 
         # Verify sidecar mode settings
         assert os.environ.get("SIDECAR_MODE") == "true"
         assert os.environ.get("REDIS_ENABLED") == "true"
         assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
 
-    def test_redis_only_mode_metrics_collection(self):
+    def test_redis_only_mode_metrics_collection(self, monkeypatch):
         """Test Redis-only mode metrics collection."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
+        monkeypatch.setenv("REDIS_ENABLED", "true")
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
 
         # In Redis-only mode, metrics should be collected from Redis
         assert os.environ.get("REDIS_ENABLED") == "true"
@@ -271,10 +271,10 @@ class TestSidecarBasic:
         # Verify no multiprocess files are used
         assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
 
-    def test_redis_only_mode_performance(self):
+    def test_redis_only_mode_performance(self, monkeypatch):
         """Test Redis-only mode performance characteristics."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
+        monkeypatch.setenv("REDIS_ENABLED", "true")
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
 
         # Redis-only mode should be more efficient for containerized deployments
         assert os.environ.get("REDIS_ENABLED") == "true"
@@ -283,10 +283,10 @@ class TestSidecarBasic:
         # No file system operations for metrics storage
         assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
 
-    def test_redis_only_mode_security(self):
+    def test_redis_only_mode_security(self, monkeypatch):
         """Test Redis-only mode security characteristics."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
+        monkeypatch.setenv("REDIS_ENABLED", "true")
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
 
         # Redis-only mode is more secure for containerized deployments
         assert os.environ.get("REDIS_ENABLED") == "true"
@@ -295,10 +295,10 @@ class TestSidecarBasic:
         # No shared file system required
         assert os.environ.get("PROMETHEUS_MULTIPROC_DIR") == ""
 
-    def test_redis_only_mode_scalability(self):
+    def test_redis_only_mode_scalability(self, monkeypatch):
         """Test Redis-only mode scalability characteristics."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["PROMETHEUS_MULTIPROC_DIR"] = ""
+        monkeypatch.setenv("REDIS_ENABLED", "true")
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
 
         # Redis-only mode scales better across multiple pods/nodes
         assert os.environ.get("REDIS_ENABLED") == "true"
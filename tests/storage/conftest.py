@@ -0,0 +1,52 @@
+"""Fixtures shared by the Redis storage tests."""
+
+from unittest.mock import Mock
+
+import pytest
+
+
+# Every test here drives the Redis backend, so skip the whole package on
+# installs without the Redis client or fakeredis instead of failing imports.
+pytest.importorskip("redis")
+pytest.importorskip("fakeredis")
+
+REDIS_TEST_ENV = {
+    "REDIS_ENABLED": "true",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_DB": "0",
+}
+
+
+@pytest.fixture(scope="package", autouse=True)
+def redis_test_env():
+    """Enable Redis in the environment once for the whole storage package."""
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in REDIS_TEST_ENV.items():
+            mp.setenv(key, value)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def isolate_redis_value_class(monkeypatch):
+    """Keep Redis setup in one test from replacing ValueClass for later ones."""
+    from prometheus_client import values
+
+    from gunicorn_prometheus_exporter.backend.service import manager
+
+    monkeypatch.setattr(values, "ValueClass", values.ValueClass)
+    monkeypatch.setattr(manager, "_global_manager", None)
+
+
+@pytest.fixture
+def make_mock_redis():
+    """Build a Redis client mock wired for the manager's setup and cleanup."""
+
+    def _make(ping=True, ping_side_effect=None, scan_keys=()):
+        client = Mock()
+        client.ping.return_value = ping
+        client.ping.side_effect = ping_side_effect
+        client.scan_iter.return_value = list(scan_keys)
+        return client
+
+    return _make
@@ -35,10 +35,10 @@ class TestRedisStorageManager:
             )
 
     @patch("gunicorn_prometheus_exporter.backend.service.manager.get_config")
-    @patch("redis.from_url")
+    @patch("redis.Redis")
     @patch("prometheus_client.values")
     def test_setup_redis_metrics_success(
-        self, mock_values, mock_redis_from_url, mock_get_config
+        self, mock_values, mock_redis_class, mock_get_config, make_mock_redis
     ):
         """Test successful Redis setup."""
         # Configure mocks
@@ -51,9 +51,8 @@ class TestRedisStorageManager:
         mock_config.redis_key_prefix = "gunicorn"
         mock_get_config.return_value = mock_config
 
-        mock_client = Mock()
-        mock_client.ping.return_value = True
-        mock_redis_from_url.return_value = mock_client
+        mock_client = make_mock_redis()
+        mock_redis_class.return_value = mock_client
 
         mock_value_class = Mock()
         self.manager._value_class_factory = Mock(return_value=mock_value_class)
@@ -70,8 +69,9 @@ class TestRedisStorageManager:
             assert self.manager.is_enabled() is True
             assert self.manager.get_client() is mock_client
 
-            # Verify Redis client was created
-            mock_redis_from_url.assert_called_once()
+            # Verify Redis client was created on the shared connection pool
+            mock_redis_class.assert_called_once()
+            assert "connection_pool" in mock_redis_class.call_args.kwargs
             mock_client.ping.assert_called_once()
 
             # Verify value class was replaced
@@ -86,20 +86,20 @@ class TestRedisStorageManager:
             )
 
     @patch("gunicorn_prometheus_exporter.backend.service.manager.get_config")
-    @patch("redis.from_url")
+    @patch("redis.Redis")
     def test_setup_redis_metrics_connection_error(
-        self, mock_redis_from_url, mock_config
+        self, mock_redis_class, mock_get_config, make_mock_redis
     ):
         """Test Redis setup with connection error."""
+        mock_config = mock_get_config.return_value
         mock_config.redis_enabled = True
         mock_config.redis_host = "localhost"
         mock_config.redis_port = 6379
         mock_config.redis_db = 0
         mock_config.redis_password = None
 
-        mock_client = Mock()
-        mock_client.ping.side_effect = Exception("Connection failed")
-        mock_redis_from_url.return_value = mock_client
+        mock_client = make_mock_redis(ping_side_effect=Exception("Connection failed"))
+        mock_redis_class.return_value = mock_client
 
         with patch(
             "gunicorn_prometheus_exporter.backend.service.manager.logger"
@@ -112,6 +112,51 @@ class TestRedisStorageManager:
                 "Failed to setup Redis metrics: %s", mock_client.ping.side_effect
             )
 
+    @patch("gunicorn_prometheus_exporter.backend.service.manager.redis")
+    def test_clients_share_connection_pool(self, mock_redis):
+        """Test that clients created by separate managers share one pool."""
+        other_manager = RedisStorageManager()
+
+        self.manager._create_redis_client()
+        other_manager._create_redis_client()
+
+        mock_redis.ConnectionPool.from_url.assert_called_once()
+        pool = mock_redis.ConnectionPool.from_url.return_value
+        assert mock_redis.Redis.call_count == 2
+        for call in mock_redis.Redis.call_args_list:
+            assert call.kwargs["connection_pool"] is pool
+
+    @patch("gunicorn_prometheus_exporter.backend.service.manager.redis")
+    def test_connection_pool_recreated_for_new_url(self, mock_redis):
+        """Test that a changed Redis URL replaces the shared pool."""
+        from gunicorn_prometheus_exporter.backend.service.manager import (
+            get_redis_connection_pool,
+        )
+
+        first_pool, second_pool = Mock(), Mock()
+        mock_redis.ConnectionPool.from_url.side_effect = [first_pool, second_pool]
+
+        assert get_redis_connection_pool("redis://a:6379/0") is first_pool
+        assert get_redis_connection_pool("redis://a:6379/0") is first_pool
+        assert get_redis_connection_pool("redis://b:6379/0") is second_pool
+        first_pool.disconnect.assert_called_once()
+
+    @patch("gunicorn_prometheus_exporter.backend.service.manager.get_config")
+    @patch("gunicorn_prometheus_exporter.backend.service.manager.redis")
+    def test_setup_pings_on_every_setup(self, mock_redis, mock_get_config):
+        """Test that every setup() PINGs, so a Redis that went away is noticed."""
+        mock_get_config.return_value.redis_enabled = True
+        mock_get_config.return_value.redis_password = None
+        mock_client = mock_redis.Redis.return_value
+
+        with patch("prometheus_client.values"):
+            assert self.manager.setup() is True
+            self.manager.teardown()
+            mock_client.ping.side_effect = ConnectionError("Redis went away")
+            assert self.manager.setup() is False
+
+        assert mock_client.ping.call_count == 2
+
     def test_teardown_when_not_initialized(self):
         """Test teardown when not initialized."""
         with patch("gunicorn_prometheus_exporter.backend.service.manager.logger"):
@@ -162,33 +162,23 @@ class TestRedisStorageDict:
             f":meta:{hashlib.md5('test_key'.encode('utf-8'), usedforsecurity=False).hexdigest()}"
         )
 
-    def test_read_value_existing(self):
+    def test_read_value_existing(self, redis_hashes):
         """Test reading existing value."""
-        mock_redis = Mock()
-        mock_redis.hget.side_effect = [b"1.5", b"1234567890"]
-
+        mock_redis = redis_hashes.bind(Mock())
         storage_dict = RedisStorageDict(mock_redis, "test_prefix")
+        redis_hashes.store[storage_dict._get_metric_key("test_key")] = {
+            "value": b"1.5",
+            "timestamp": b"1234567890",
+        }
+
         value, timestamp = storage_dict.read_value("test_key")
 
         assert value == 1.5
         assert timestamp == 1234567890.0
 
-        # Verify Redis calls - check that hget was called with the correct pattern
-        assert mock_redis.hget.call_count == 2
-        # Check that the calls match the new key format pattern
-        calls = mock_redis.hget.call_args_list
-        metric_key = calls[0][0][0]  # First argument of first call
-        assert metric_key.startswith("test_prefix:counter:")
-        assert metric_key.endswith(
-            f":metric:{hashlib.md5('test_key'.encode('utf-8'), usedforsecurity=False).hexdigest()}"
-        )
-        assert calls[0][0][1] == "value"  # Second argument should be "value"
-        assert calls[1][0][1] == "timestamp"  # Second argument should be "timestamp"
-
-    def test_read_value_missing(self):
+    def test_read_value_missing(self, redis_hashes):
         """Test reading missing value (initializes with defaults)."""
-        mock_redis = Mock()
-        mock_redis.hget.side_effect = [None, None]  # Both value and timestamp missing
+        mock_redis = redis_hashes.bind(Mock())  # Both value and timestamp missing
 
         storage_dict = RedisStorageDict(mock_redis, "test_prefix")
 
@@ -199,12 +189,12 @@ class TestRedisStorageDict:
             assert timestamp == 0.0
             mock_init.assert_called_once_with("test_key", "counter")
 
-    def test_read_value_partial_missing(self):
+    def test_read_value_partial_missing(self, redis_hashes):
         """Test reading value with missing timestamp."""
-        mock_redis = Mock()
-        mock_redis.hget.side_effect = [b"1.5", None]  # Value exists, timestamp missing
-
+        mock_redis = redis_hashes.bind(Mock())
         storage_dict = RedisStorageDict(mock_redis, "test_prefix")
+        # Value exists, timestamp missing
+        redis_hashes.store[storage_dict._get_metric_key("test_key")] = {"value": b"1.5"}
 
         with patch.object(storage_dict, "_init_value_unlocked") as mock_init:
             value, timestamp = storage_dict.read_value("test_key")
@@ -216,17 +206,24 @@ class TestRedisStorageDict:
     def test_write_value(self):
         """Test writing value."""
         mock_redis = Mock()
+        mock_pipe = mock_redis.pipeline.return_value
         storage_dict = RedisStorageDict(mock_redis, "test_prefix")
 
         with patch("time.time", return_value=1234567890.0):
             storage_dict.write_value("test_key", 1.5, 987654321.0)
 
-        # Verify Redis calls - check that hset was called once for metric data
-        assert mock_redis.hset.call_count == 1
-        assert mock_redis.hsetnx.call_count == 2  # Two hsetnx calls for metadata
+        # All commands are queued on one non-transactional pipeline
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        mock_pipe.execute.assert_called_once()
+        mock_redis.hset.assert_not_called()
+        mock_redis.hsetnx.assert_not_called()
+
+        # Verify pipelined calls - hset once for metric data
+        assert mock_pipe.hset.call_count == 1
+        assert mock_pipe.hsetnx.call_count == 2  # Two hsetnx calls for metadata
 
         # Check that the calls match the new key format pattern
-        calls = mock_redis.hset.call_args_list
+        calls = mock_pipe.hset.call_args_list
         metric_key = calls[0][0][0]  # First argument of first call
 
         assert metric_key.startswith("test_prefix:counter:")
@@ -241,7 +238,7 @@ class TestRedisStorageDict:
         assert metric_mapping["updated_at"] == 1234567890.0
 
         # Check hsetnx calls for metadata
-        hsetnx_calls = mock_redis.hsetnx.call_args_list
+        hsetnx_calls = mock_pipe.hsetnx.call_args_list
         assert len(hsetnx_calls) == 2
 
         # First hsetnx call for original_key
@@ -262,6 +259,30 @@ class TestRedisStorageDict:
         assert hsetnx_calls[1][0][1] == "created_at"
         assert hsetnx_calls[1][0][2] == "1234567890.0"
 
+    def test_write_value_batched_flush(self):
+        """Test buffered writes are flushed every flush_threshold calls."""
+        mock_redis = Mock()
+        mock_pipe = mock_redis.pipeline.return_value
+        storage_dict = RedisStorageDict(mock_redis, "test_prefix", flush_threshold=50)
+
+        for i in range(49):
+            storage_dict.write_value("test_key", float(i), 987654321.0, "gauge", "all")
+        mock_pipe.execute.assert_not_called()
+
+        for i in range(49, 60):
+            storage_dict.write_value("test_key", float(i), 987654321.0, "gauge", "all")
+        assert mock_pipe.execute.call_count == 1
+
+        # Remaining writes are sent on close
+        storage_dict.close()
+        assert mock_pipe.execute.call_count == 2
+        assert mock_pipe.hset.call_count == 60
+        mock_redis.hset.assert_not_called()
+
+        # Nothing pending, so a second flush is a no-op
+        storage_dict.flush()
+        assert mock_pipe.execute.call_count == 2
+
     def test_init_value(self):
         """Test initializing value."""
         mock_redis = Mock()
@@ -274,17 +295,22 @@ class TestRedisStorageDict:
     def test_init_value_unlocked(self):
         """Test initializing value without lock."""
         mock_redis = Mock()
-        storage_dict = RedisStorageDict(mock_redis, "test_prefix")
+        mock_pipe = mock_redis.pipeline.return_value
+        storage_dict = RedisStorageDict(mock_redis, "test_prefix", flush_threshold=50)
 
         with patch("time.time", return_value=1234567890.0):
             storage_dict._init_value_unlocked("test_key")
 
-        # Verify Redis calls - check that hset was called once for metric data
-        assert mock_redis.hset.call_count == 1
-        assert mock_redis.hsetnx.call_count == 2  # Two hsetnx calls for metadata
+        # Defaults are sent right away in one round trip, even when batching
+        mock_pipe.execute.assert_called_once()
+        mock_redis.hset.assert_not_called()
+
+        # Verify pipelined calls - hset once for metric data
+        assert mock_pipe.hset.call_count == 1
+        assert mock_pipe.hsetnx.call_count == 2  # Two hsetnx calls for metadata
 
         # Check that the calls match the new key format pattern
-        calls = mock_redis.hset.call_args_list
+        calls = mock_pipe.hset.call_args_list
         metric_key = calls[0][0][0]  # First argument of first call
 
         assert metric_key.startswith("test_prefix:counter:")
@@ -299,7 +325,7 @@ class TestRedisStorageDict:
         assert metric_mapping["updated_at"] == 1234567890.0
 
         # Check hsetnx calls for metadata
-        hsetnx_calls = mock_redis.hsetnx.call_args_list
+        hsetnx_calls = mock_pipe.hsetnx.call_args_list
         assert len(hsetnx_calls) == 2
 
         # First hsetnx call for original_key
@@ -339,11 +365,9 @@ class TestRedisValueClass:
 
         assert value_class._key_prefix == "gunicorn"
 
-    def test_call(self):
+    def test_call(self, redis_hashes):
         """Test creating RedisValue instance."""
-        mock_redis = Mock()
-        # Mock the Redis responses to return proper byte strings
-        mock_redis.hget.side_effect = [b"0.0", b"0.0"]  # value, timestamp
+        mock_redis = redis_hashes.bind(Mock())
 
         value_class = RedisValueClass(mock_redis, "test_prefix")
 
@@ -391,7 +415,8 @@ class TestRedisStorageClient:
         """Test successful cleanup of process keys."""
         mock_redis = Mock()
         mock_redis.scan_iter.return_value = [b"key1", b"key2", b"key3"]
-        mock_redis.delete.return_value = 3
+        mock_pipe = mock_redis.pipeline.return_value
+        mock_pipe.execute.return_value = [3]
 
         client = RedisStorageClient(mock_redis, "test_prefix")
 
@@ -402,8 +427,12 @@ class TestRedisStorageClient:
 
         # Verify Redis calls
         expected_pattern = "test_prefix:*:12345:*"
-        mock_redis.scan_iter.assert_called_once_with(match=expected_pattern, count=100)
-        mock_redis.delete.assert_called_once_with(b"key1", b"key2", b"key3")
+        mock_redis.scan_iter.assert_called_once_with(match=expected_pattern, count=1000)
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        mock_pipe.unlink.assert_called_once_with(b"key1", b"key2", b"key3")
+        mock_pipe.execute.assert_called_once_with(raise_on_error=False)
+        mock_redis.unlink.assert_not_called()
+        mock_redis.delete.assert_not_called()
 
         # Verify logging
         mock_logger.debug.assert_called_once_with(
@@ -424,12 +453,64 @@ class TestRedisStorageClient:
 
         # Verify Redis calls
         expected_pattern = "test_prefix:*:12345:*"
-        mock_redis.scan_iter.assert_called_once_with(match=expected_pattern, count=100)
-        mock_redis.delete.assert_not_called()
+        mock_redis.scan_iter.assert_called_once_with(match=expected_pattern, count=1000)
+        mock_redis.pipeline.assert_not_called()
 
         # Verify no debug logging
         mock_logger.debug.assert_not_called()
 
+    def test_cleanup_process_keys_braced_prefix(self):
+        """Test a Redis Cluster hash-tag prefix is used verbatim in the pattern."""
+        mock_redis = Mock()
+        mock_redis.scan_iter.return_value = []
+
+        client = RedisStorageClient(mock_redis, "{tenant}")
+        client.cleanup_process_keys(12345)
+
+        mock_redis.scan_iter.assert_called_once_with(
+            match="{tenant}:*:12345:*", count=1000
+        )
+
+    def test_cleanup_process_keys_batches_unlink(self):
+        """Test cleanup unlinks keys in batches of 500."""
+        mock_redis = Mock()
+        keys = [f"test_prefix:counter:12345:metric:{i}".encode() for i in range(750)]
+        mock_redis.scan_iter.return_value = iter(keys)
+        mock_pipe = mock_redis.pipeline.return_value
+        mock_pipe.execute.return_value = [500, 250]
+
+        client = RedisStorageClient(mock_redis, "test_prefix")
+        client.cleanup_process_keys(12345)
+
+        assert mock_pipe.unlink.call_count == 2
+        first_batch, second_batch = mock_pipe.unlink.call_args_list
+        assert first_batch[0] == tuple(keys[:500])
+        assert second_batch[0] == tuple(keys[500:])
+        # Both batches go out in a single round trip
+        mock_pipe.execute.assert_called_once_with(raise_on_error=False)
+
+    def test_cleanup_process_keys_reports_failed_batches(self):
+        """Test a failed UNLINK batch is logged without aborting the others."""
+        mock_redis = Mock()
+        keys = [f"test_prefix:counter:12345:metric:{i}".encode() for i in range(600)]
+        mock_redis.scan_iter.return_value = iter(keys)
+        batch_error = redis.ResponseError("UNLINK failed")
+        mock_redis.pipeline.return_value.execute.return_value = [batch_error, 100]
+
+        client = RedisStorageClient(mock_redis, "test_prefix")
+
+        with patch(
+            "gunicorn_prometheus_exporter.backend.core.client.logger"
+        ) as mock_logger:
+            client.cleanup_process_keys(12345)
+
+        mock_logger.warning.assert_called_once_with(
+            "Failed to delete Redis key batch for process %d: %s", 12345, batch_error
+        )
+        mock_logger.debug.assert_called_once_with(
+            "Cleaned up %d Redis keys for process %d", 100, 12345
+        )
+
     def test_cleanup_process_keys_exception(self):
         """Test cleanup with exception."""
         mock_redis = Mock()
@@ -708,15 +789,15 @@ class TestRedisStorageEdgeCases:
             # If exception is raised, that's also acceptable behavior
             pass
 
-    def test_redis_corrupted_metadata(self):
+    def test_redis_corrupted_metadata(self, redis_hashes):
         """Test handling of corrupted metadata."""
-        mock_redis = Mock()
-        # Return corrupted metadata
-        mock_redis.hget.side_effect = [
-            "1.5",  # Valid metric value
-            "corrupted_metadata",  # Corrupted timestamp
-        ]
+        mock_redis = redis_hashes.bind(Mock())
         storage_dict = RedisStorageDict(mock_redis, "test_prefix")
+        # Valid metric value, corrupted timestamp
+        redis_hashes.store[storage_dict._get_metric_key("test_key")] = {
+            "value": "1.5",
+            "timestamp": "corrupted_metadata",
+        }
 
         # Should handle corrupted metadata gracefully
         try:
@@ -726,31 +807,30 @@ class TestRedisStorageEdgeCases:
             # If exception is raised, that's also acceptable behavior
             pass
 
-    def test_redis_large_data_handling(self):
+    def test_redis_large_data_handling(self, redis_hashes):
         """Test handling of large data in Redis."""
-        mock_redis = Mock()
-        # Simulate large data values
-        mock_redis.hget.side_effect = ["10000000000.0", "987654321.0"]
+        mock_redis = redis_hashes.bind(Mock())
         storage_dict = RedisStorageDict(mock_redis, "test_prefix")
+        # Simulate large data values
+        redis_hashes.store[storage_dict._get_metric_key("test_key")] = {
+            "value": "10000000000.0",
+            "timestamp": "987654321.0",
+        }
 
         # Should handle large data gracefully
         result = storage_dict.read_value("test_key")
         assert result == (10000000000.0, 987654321.0)
 
-    def test_redis_concurrent_access_simulation(self):
+    def test_redis_concurrent_access_simulation(self, redis_hashes):
         """Test handling of concurrent access scenarios."""
-        mock_redis = Mock()
-        # Simulate concurrent access by returning different values
-        mock_redis.hget.side_effect = [
-            "1.0",
-            "987654321.0",  # First read
-            "2.0",
-            "987654322.0",  # Second read
-        ]
+        mock_redis = redis_hashes.bind(Mock())
         storage_dict = RedisStorageDict(mock_redis, "test_prefix")
+        metric_key = storage_dict._get_metric_key("test_key")
 
-        # Should handle concurrent access gracefully
+        # Simulate another process updating the value between reads
+        redis_hashes.store[metric_key] = {"value": "1.0", "timestamp": "987654321.0"}
         result1 = storage_dict.read_value("test_key")
+        redis_hashes.store[metric_key] = {"value": "2.0", "timestamp": "987654322.0"}
         result2 = storage_dict.read_value("test_key")
         assert result1 == (1.0, 987654321.0)
         assert result2 == (2.0, 987654322.0)
@@ -1002,8 +1082,9 @@ class TestBackendClientEdgeCases:
             result = storage_dict.write_value("test_key", 1.0, 1234567890.0)
 
             assert result is None  # write_value returns None
-            mock_redis.hset.assert_called()
-            mock_redis.expire.assert_called()
+            mock_pipe = mock_redis.pipeline.return_value
+            mock_pipe.hset.assert_called()
+            mock_pipe.expire.assert_called()
 
     def test_redis_storage_dict_write_value_without_ttl(self):
         """Test RedisStorageDict.write_value without TTL (lines 132, 153)."""
@@ -1019,8 +1100,25 @@ class TestBackendClientEdgeCases:
             result = storage_dict.write_value("test_key", 1.0, 1234567890.0)
 
             assert result is None  # write_value returns None
-            mock_redis.hset.assert_called()
-            mock_redis.expire.assert_not_called()
+            mock_pipe = mock_redis.pipeline.return_value
+            mock_pipe.hset.assert_called()
+            mock_pipe.expire.assert_not_called()
+
+    def test_redis_storage_dict_write_value_ttl_resolved_once(self):
+        """Test RedisStorageDict reads the TTL config at init, not per write."""
+        mock_redis = MagicMock()
+        storage_dict = RedisStorageDict(mock_redis, "test_prefix")
+
+        with patch(
+            "gunicorn_prometheus_exporter.backend.core.client._should_set_ttl",
+            side_effect=AssertionError("TTL config re-read on write"),
+        ):
+            storage_dict.write_value("test_key", 1.0, 1234567890.0, "gauge", "all")
+            storage_dict.write_value("test_key", 2.0, 1234567890.0, "gauge", "all")
+
+        expire_calls = mock_redis.pipeline.return_value.expire.call_args_list
+        assert len(expire_calls) == 4
+        assert all(call[0][1] == 300 for call in expire_calls)
 
     def test_redis_storage_dict_cleanup_dead_worker_redis_error(self):
         """Test RedisStorageDict.cleanup_dead_worker when Redis raises exception (lines 207-208)."""
@@ -1036,7 +1134,7 @@ class TestBackendClientEdgeCases:
     def test_redis_storage_dict_cleanup_dead_worker_delete_error(self):
         """Test RedisStorageDict.cleanup_dead_worker when delete raises exception (lines 370, 388)."""
         mock_redis = MagicMock()
-        mock_redis.hset.side_effect = Exception("Delete error")
+        mock_redis.pipeline.return_value.execute.side_effect = Exception("Delete error")
 
         storage_dict = RedisStorageDict(mock_redis)
 
@@ -1051,9 +1149,9 @@ class TestBackendClientEdgeCases:
         storage_dict = RedisStorageDict(mock_redis)
 
         # Test successful write_value
-        mock_redis.hset.return_value = 1
         storage_dict.write_value("test_key", 1.0, 1234567890.0)
-        mock_redis.hset.assert_called()
+        mock_redis.pipeline.return_value.hset.assert_called()
+        mock_redis.pipeline.return_value.execute.assert_called_once()
 
     def test_redis_storage_dict_cleanup_dead_worker_no_keys(self):
         """Test RedisStorageDict.cleanup_dead_worker when no keys found (lines 447-448)."""
@@ -1080,7 +1178,9 @@ class TestBackendClientEdgeCases:
     def test_redis_storage_dict_cleanup_dead_worker_general_exception(self):
         """Test RedisStorageDict.cleanup_dead_worker general exception (lines 550-551)."""
         mock_redis = MagicMock()
-        mock_redis.hset.side_effect = Exception("General Redis error")
+        mock_redis.pipeline.return_value.execute.side_effect = Exception(
+            "General Redis error"
+        )
 
         storage_dict = RedisStorageDict(mock_redis)
 
@@ -1,11 +1,11 @@
 """Tests for Redis storage collector."""
 
 import json
-import os
 
 from collections import defaultdict
 from unittest.mock import Mock, patch
 
+import fakeredis
 import pytest
 
 
@@ -14,6 +14,7 @@ try:
 except ImportError:
     redis = None
 
+from gunicorn_prometheus_exporter.backend import RedisValueClass
 from gunicorn_prometheus_exporter.backend.core.collector import (
     RedisMultiProcessCollector,
 )
@@ -78,61 +79,59 @@ class TestRedisMultiProcessCollector:
         ):
             RedisMultiProcessCollector(mock_registry, None, "test_prefix")
 
-    def test_get_default_redis_client_from_env(self):
+    def test_get_default_redis_client_from_env(self, monkeypatch):
         """Test getting Redis client from environment variable."""
-        with patch.dict(
-            os.environ, {"PROMETHEUS_REDIS_URL": "redis://localhost:6379/0"}
-        ):
-            with patch(
-                "gunicorn_prometheus_exporter.backend.core.collector.redis.from_url"
-            ) as mock_from_url:
-                mock_client = Mock()
-                mock_from_url.return_value = mock_client
-
-                collector = RedisMultiProcessCollector(Mock(), None, "test_prefix")
-
-                mock_from_url.assert_called_once_with(
-                    "redis://localhost:6379/0",
-                    decode_responses=False,
-                    socket_timeout=5.0,
-                    socket_connect_timeout=5.0,
-                    retry_on_timeout=True,
-                    health_check_interval=30,
-                )
-                assert collector._redis_client is mock_client
-
-    def test_get_default_redis_client_local(self):
+        monkeypatch.setenv("PROMETHEUS_REDIS_URL", "redis://localhost:6379/0")
+        with patch(
+            "gunicorn_prometheus_exporter.backend.core.collector.redis.from_url"
+        ) as mock_from_url:
+            mock_client = Mock()
+            mock_from_url.return_value = mock_client
+
+            collector = RedisMultiProcessCollector(Mock(), None, "test_prefix")
+
+            mock_from_url.assert_called_once_with(
+                "redis://localhost:6379/0",
+                decode_responses=False,
+                socket_timeout=5.0,
+                socket_connect_timeout=5.0,
+                retry_on_timeout=True,
+                health_check_interval=30,
+            )
+            assert collector._redis_client is mock_client
+
+    def test_get_default_redis_client_local(self, monkeypatch):
         """Test getting local Redis client."""
-        with patch.dict(os.environ, {}, clear=True):
-            with patch(
-                "gunicorn_prometheus_exporter.backend.core.collector.redis.Redis"
-            ) as mock_redis_class:
-                mock_client = Mock()
-                mock_redis_class.return_value = mock_client
-
-                collector = RedisMultiProcessCollector(Mock(), None, "test_prefix")
-
-                mock_redis_class.assert_called_once_with(
-                    host="localhost",
-                    port=6379,
-                    db=0,
-                    decode_responses=False,
-                    socket_timeout=5.0,
-                    socket_connect_timeout=5.0,
-                    retry_on_timeout=True,
-                    health_check_interval=30,
-                )
-                assert collector._redis_client is mock_client
-
-    def test_get_default_redis_client_connection_error(self):
+        monkeypatch.delenv("PROMETHEUS_REDIS_URL", raising=False)
+        with patch(
+            "gunicorn_prometheus_exporter.backend.core.collector.redis.Redis"
+        ) as mock_redis_class:
+            mock_client = Mock()
+            mock_redis_class.return_value = mock_client
+
+            collector = RedisMultiProcessCollector(Mock(), None, "test_prefix")
+
+            mock_redis_class.assert_called_once_with(
+                host="localhost",
+                port=6379,
+                db=0,
+                decode_responses=False,
+                socket_timeout=5.0,
+                socket_connect_timeout=5.0,
+                retry_on_timeout=True,
+                health_check_interval=30,
+            )
+            assert collector._redis_client is mock_client
+
+    def test_get_default_redis_client_connection_error(self, monkeypatch):
         """Test handling connection error when getting local Redis client."""
-        with patch.dict(os.environ, {}, clear=True):
-            with patch(
-                "gunicorn_prometheus_exporter.backend.core.collector.redis.Redis",
-                side_effect=Exception("Connection failed"),
-            ):
-                with pytest.raises(Exception, match="Connection failed"):
-                    RedisMultiProcessCollector(Mock(), None, "test_prefix")
+        monkeypatch.delenv("PROMETHEUS_REDIS_URL", raising=False)
+        with patch(
+            "gunicorn_prometheus_exporter.backend.core.collector.redis.Redis",
+            side_effect=Exception("Connection failed"),
+        ):
+            with pytest.raises(Exception, match="Connection failed"):
+                RedisMultiProcessCollector(Mock(), None, "test_prefix")
 
     def test_merge_from_redis(self):
         """Test merge_from_redis static method."""
@@ -163,6 +162,8 @@ class TestRedisMultiProcessCollector:
         """Test _read_metrics_from_redis static method."""
         mock_redis = Mock()
         mock_redis.scan_iter.return_value = [b"test_prefix:gauge:12345:metric:hash"]
+        mock_pipe = mock_redis.pipeline.return_value
+        mock_pipe.execute.return_value = [{b"original_key": b"key"}, [b"1", b"2"]]
 
         with patch.object(
             RedisMultiProcessCollector, "_process_metric_key"
@@ -174,13 +175,68 @@ class TestRedisMultiProcessCollector:
             mock_redis.scan_iter.assert_called_once_with(
                 match="test_prefix:*:*:metric:*", count=100
             )
+            mock_redis.pipeline.assert_called_once_with(transaction=False)
+            mock_pipe.hgetall.assert_called_once_with(
+                b"test_prefix:gauge:12345:meta:hash"
+            )
+            mock_pipe.hmget.assert_called_once_with(
+                b"test_prefix:gauge:12345:metric:hash", "value", "timestamp"
+            )
             mock_process.assert_called_once()
+            assert mock_process.call_args[0][4] == (
+                {b"original_key": b"key"},
+                b"1",
+                b"2",
+            )
             assert isinstance(result, dict)
 
+    def test_read_metrics_from_redis_batches_pipeline(self):
+        """Test _read_metrics_from_redis reads keys in pipelined batches."""
+        mock_redis = Mock()
+        mock_redis.scan_iter.return_value = [
+            f"test_prefix:counter:1:metric:{i}".encode() for i in range(3)
+        ]
+        mock_redis.pipeline.return_value.execute.side_effect = [
+            [{}, [None, None], {}, [None, None]],
+            [{}, [None, None]],
+        ]
+
+        with (
+            patch.object(RedisMultiProcessCollector, "READ_BATCH_SIZE", 2),
+            patch.object(
+                RedisMultiProcessCollector, "_process_metric_key"
+            ) as mock_process,
+        ):
+            RedisMultiProcessCollector._read_metrics_from_redis(
+                mock_redis, "test_prefix"
+            )
+
+        assert mock_redis.pipeline.return_value.execute.call_count == 2
+        assert mock_process.call_count == 3
+        mock_redis.hgetall.assert_not_called()
+        mock_redis.hget.assert_not_called()
+
+    def test_read_metrics_from_redis_skips_unreadable_keys(self):
+        """Test a non-hash key among the metric keys does not fail the scrape."""
+        client = fakeredis.FakeStrictRedis()
+        value = RedisValueClass(client, "test_prefix")(
+            "counter", "requests", "requests_total", (), (), "Requests"
+        )
+        value.inc(3)
+        # Matches the metric key pattern but is a string, so HMGET fails
+        client.set("test_prefix:counter:999:metric:bad", "oops")
+
+        metrics = RedisMultiProcessCollector._read_metrics_from_redis(
+            client, "test_prefix"
+        )
+
+        assert [s.value for s in metrics["requests"].samples] == [3.0]
+
     def test_parse_key_valid_json(self):
         """Test _parse_key with valid JSON."""
         mock_redis = Mock()
         mock_redis.scan_iter.return_value = [b"test_prefix:gauge:12345:metric:hash"]
+        mock_redis.pipeline.return_value.execute.return_value = [{}, [None, None]]
 
         # Mock the _process_metric_key to test _parse_key indirectly
         with patch.object(
@@ -212,6 +268,7 @@ class TestRedisMultiProcessCollector:
         """Test _parse_key with invalid JSON."""
         mock_redis = Mock()
         mock_redis.scan_iter.return_value = [b"test_prefix:gauge:12345:metric:hash"]
+        mock_redis.pipeline.return_value.execute.return_value = [{}, [None, None]]
 
         with patch.object(
             RedisMultiProcessCollector, "_process_metric_key"
@@ -227,13 +284,16 @@ class TestRedisMultiProcessCollector:
             result = _parse_key("invalid_json")
             assert result == ("invalid_json", "invalid_json", {}, (), "")
 
-    def test_process_metric_key_success(self):
+    def test_process_metric_key_success(self, redis_hashes):
         """Test _process_metric_key with successful processing."""
-        mock_redis = Mock()
-        mock_redis.hgetall.return_value = {
+        mock_redis = redis_hashes.bind(Mock())
+        redis_hashes.store[b"test_prefix:counter:12345:meta:hash"] = {
             b"original_key": b'["metric", "name", {}, "help"]'
         }
-        mock_redis.hget.side_effect = [b"1.0", b"1234567890"]
+        redis_hashes.store[b"test_prefix:counter:12345:metric:hash"] = {
+            "value": b"1.0",
+            "timestamp": b"1234567890",
+        }
 
         metrics = {}
 
@@ -298,13 +358,12 @@ class TestRedisMultiProcessCollector:
 
         assert len(metrics) == 0
 
-    def test_process_metric_key_no_values(self):
+    def test_process_metric_key_no_values(self, redis_hashes):
         """Test _process_metric_key with no values."""
-        mock_redis = Mock()
-        mock_redis.hgetall.return_value = {
+        mock_redis = redis_hashes.bind(Mock())
+        redis_hashes.store[b"test_prefix:counter:12345:meta:hash"] = {
             b"original_key": b'["metric", "name", {}, "help"]'
         }
-        mock_redis.hget.side_effect = [None, None]
 
         metrics = {}
 
@@ -348,22 +407,18 @@ class TestRedisMultiProcessCollector:
         mock_redis.hgetall.assert_called_once_with(expected_key)
         assert result == {b"key": b"value"}
 
-    def test_get_metric_values(self):
+    def test_get_metric_values(self, redis_hashes):
         """Test _get_metric_values static method."""
-        mock_redis = Mock()
-        mock_redis.hget.side_effect = [b"1.0", b"1234567890"]
+        mock_redis = redis_hashes.bind(Mock())
+        redis_hashes.store[b"test_prefix:counter:12345:metric:hash"] = {
+            "value": b"1.0",
+            "timestamp": b"1234567890",
+        }
 
         value, timestamp = RedisMultiProcessCollector._get_metric_values(
             b"test_prefix:counter:12345:metric:hash", mock_redis
         )
 
-        assert mock_redis.hget.call_count == 2
-        mock_redis.hget.assert_any_call(
-            b"test_prefix:counter:12345:metric:hash", "value"
-        )
-        mock_redis.hget.assert_any_call(
-            b"test_prefix:counter:12345:metric:hash", "timestamp"
-        )
         assert value == b"1.0"
         assert timestamp == b"1234567890"
 
@@ -1116,14 +1171,16 @@ class TestMarkProcessDeadRedis:
         """Test mark_process_dead_redis with provided client."""
         mock_redis = Mock()
         mock_redis.scan_iter.return_value = [b"key1", b"key2"]
-        mock_redis.delete.return_value = 2
+        mock_pipe = mock_redis.pipeline.return_value
+        mock_pipe.execute.return_value = [2]
 
         mark_process_dead_redis(12345, mock_redis, "test_prefix")
 
         mock_redis.scan_iter.assert_called_once_with(
-            match="test_prefix:*:12345:*", count=100
+            match="test_prefix:*:12345:*", count=1000
         )
-        mock_redis.delete.assert_called_once_with(b"key1", b"key2")
+        mock_pipe.unlink.assert_called_once_with(b"key1", b"key2")
+        mock_pipe.execute.assert_called_once_with(raise_on_error=False)
 
     def test_mark_process_dead_redis_without_client_from_env(self):
         """Test mark_process_dead_redis without client, using env var."""
@@ -1145,9 +1202,9 @@ class TestMarkProcessDeadRedis:
         mark_process_dead_redis(12345, mock_redis, "test_prefix")
 
         mock_redis.scan_iter.assert_called_once_with(
-            match="test_prefix:*:12345:*", count=100
+            match="test_prefix:*:12345:*", count=1000
         )
-        mock_redis.delete.assert_not_called()
+        mock_redis.unlink.assert_not_called()
 
 
 class TestCollectorExceptionHandling:
@@ -2,7 +2,9 @@
 
 import os
 
-from unittest.mock import Mock, patch
+from unittest.mock import patch
+
+import fakeredis
 
 from gunicorn_prometheus_exporter.backend import (
     RedisStorageClient,
@@ -26,27 +28,11 @@ from gunicorn_prometheus_exporter.backend.core.values import (
 class TestStorageModuleIntegration:
     """Integration tests for the entire storage module."""
 
-    def setup_method(self):
-        """Set up test environment."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["REDIS_HOST"] = "localhost"
-        os.environ["REDIS_PORT"] = "6379"
-        os.environ["REDIS_DB"] = "0"
-
-    def teardown_method(self):
-        """Clean up test environment."""
-        os.environ.pop("REDIS_ENABLED", None)
-        os.environ.pop("REDIS_HOST", None)
-        os.environ.pop("REDIS_PORT", None)
-        os.environ.pop("REDIS_DB", None)
-
     @patch("gunicorn_prometheus_exporter.backend.service.manager.redis")
-    def test_redis_storage_manager_integration(self, mock_redis):
+    def test_redis_storage_manager_integration(self, mock_redis, make_mock_redis):
         """Test RedisStorageManager integration."""
-        mock_client = Mock()
-        mock_redis.from_url.return_value = mock_client
-        mock_client.ping.return_value = True
-        mock_client.keys.return_value = []
+        mock_client = make_mock_redis()
+        mock_redis.Redis.return_value = mock_client
 
         # Test manager creation
         manager = RedisStorageManager()
@@ -57,19 +43,22 @@ class TestStorageModuleIntegration:
         assert result is True
         assert manager.is_enabled() is True
 
+        # Test cleanup scans instead of using the blocking KEYS command
+        manager.cleanup_keys()
+        mock_client.scan_iter.assert_called_once()
+        mock_client.keys.assert_not_called()
+
         # Test teardown
         manager.teardown()
         assert manager.is_enabled() is False
 
-    def test_module_functions_integration(self):
+    def test_module_functions_integration(self, make_mock_redis):
         """Test module-level functions integration."""
         # Test setup function
         with patch(
             "gunicorn_prometheus_exporter.backend.service.manager.redis"
         ) as mock_redis:
-            mock_client = Mock()
-            mock_redis.from_url.return_value = mock_client
-            mock_client.ping.return_value = True
+            mock_redis.Redis.return_value = make_mock_redis()
 
             result = setup_redis_metrics()
             assert result is True
@@ -82,26 +71,58 @@ class TestStorageModuleIntegration:
             assert isinstance(enabled, bool)
 
     def test_redis_backend_integration(self):
-        """Test Redis backend integration."""
-        with patch("redis.Redis") as mock_redis:
-            mock_client = Mock()
-            mock_redis.return_value = mock_client
-            mock_client.ping.return_value = True
-            mock_client.hget.return_value = None
-            mock_client.hset.return_value = True
-            mock_client.keys.return_value = []
-
-            # Test RedisStorageDict
-            redis_dict = RedisStorageDict(mock_client, "test")
-            assert redis_dict is not None
-
-            # Test RedisStorageClient
-            storage_client = RedisStorageClient(mock_client, "test")
-            assert storage_client is not None
-
-            # Test RedisValueClass
-            value_class = RedisValueClass(mock_client, "test")
-            assert value_class is not None
+        """Test Redis backend integration against an in-process Redis server."""
+        client = fakeredis.FakeStrictRedis()
+        redis_dict = RedisStorageDict(client, "test")
+
+        with (
+            patch.object(client, "pipeline", wraps=client.pipeline) as pipeline,
+            patch.object(
+                client, "execute_command", wraps=client.execute_command
+            ) as direct,
+        ):
+            redis_dict.write_value("test_key", 10.5, 1234567890.0, "gauge", "all")
+
+        # Everything except the server TIME lookup goes out in one pipeline
+        pipeline.assert_called_once_with(transaction=False)
+        assert [c.args[0] for c in direct.call_args_list] == ["TIME"]
+
+        metric_key = redis_dict._get_metric_key("test_key", "gauge", "all")
+        stored = client.hgetall(metric_key)
+        assert stored[b"value"] == b"10.5"
+        assert stored[b"timestamp"] == b"1234567890.0"
+        assert redis_dict.read_value("test_key", "gauge", "all") == (
+            10.5,
+            1234567890.0,
+        )
+        assert list(redis_dict.read_all_values()) == [("test_key", 10.5, 1234567890.0)]
+
+        # RedisStorageClient removes the keys written by this process
+        storage_client = RedisStorageClient(client, "test")
+        storage_client.cleanup_process_keys(os.getpid())
+        assert client.dbsize() == 0
+
+        # RedisValueClass
+        value_class = RedisValueClass(client, "test")
+        assert value_class is not None
+
+    def test_redis_value_inc_integration(self):
+        """Test RedisValue.inc() increments atomically in Redis."""
+        client = fakeredis.FakeStrictRedis()
+        value_class = RedisValueClass(client, "test")
+        args = ("counter", "requests", "requests_total", (), (), "Requests")
+        first, second = value_class(*args), value_class(*args)
+
+        # Two values on the same key do not overwrite each other's increments
+        first.inc(2)
+        second.inc(3)
+        assert second.get() == 5.0
+
+        # A key lost in Redis (e.g. expired TTL) restarts from the local value
+        client.flushall()
+        second.inc(1)
+        assert second.get() == 6.0
+        assert first._redis_dict.read_value(first._key, "counter") == (6.0, 0.0)
 
     def test_error_handling_integration(self):
         """Test error handling across the storage module."""
@@ -109,7 +130,7 @@ class TestStorageModuleIntegration:
         with patch(
             "gunicorn_prometheus_exporter.backend.service.manager.redis"
         ) as mock_redis:
-            mock_redis.from_url.side_effect = Exception("Connection failed")
+            mock_redis.Redis.side_effect = Exception("Connection failed")
 
             manager = RedisStorageManager()
             # RedisStorageManager handles connection failures gracefully
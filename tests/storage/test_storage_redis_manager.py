@@ -4,7 +4,14 @@ import os
 
 from unittest.mock import Mock, patch
 
+import fakeredis
+import pytest
+
+from prometheus_client import CollectorRegistry
+
+from gunicorn_prometheus_exporter.backend.core import RedisMultiProcessCollector
 from gunicorn_prometheus_exporter.backend.service import (
+    RedisConfig,
     RedisStorageManager,
     cleanup_redis_keys,
     get_redis_client,
@@ -14,301 +21,339 @@ from gunicorn_prometheus_exporter.backend.service import (
     setup_redis_metrics,
     teardown_redis_metrics,
 )
+from gunicorn_prometheus_exporter.config import ExporterConfig
+
+
+REDIS_CONFIG = RedisConfig(host="localhost", port=6379, db=0)
+
+
+@pytest.fixture(scope="module")
+def mock_redis_module():
+    """Patch the manager's redis module once for the whole module."""
+    with patch("gunicorn_prometheus_exporter.backend.service.manager.redis") as m:
+        yield m
+
+
+@pytest.fixture
+def mock_client(mock_redis_module, make_mock_redis):
+    """Give each test a fresh client returned by the patched redis module."""
+    mock_redis_module.reset_mock(return_value=True, side_effect=True)
+    client = make_mock_redis()
+    mock_redis_module.Redis.return_value = client
+    return client
+
+
+@pytest.fixture
+def initialized_manager(mock_client):
+    """Provide a manager already set up against the mock client."""
+    manager = RedisStorageManager(config=REDIS_CONFIG)
+    manager.setup()
+    yield manager
+    manager._is_initialized = False
+    manager._redis_client = None
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Back the global manager with an in-process fakeredis server."""
+    from gunicorn_prometheus_exporter.backend.service import manager
+
+    client = fakeredis.FakeStrictRedis()
+    monkeypatch.setattr(manager.redis, "Redis", lambda *a, **kw: client)
+    return client
+
+
+def test_init_success(mock_client):
+    """Test successful initialization."""
+    manager = RedisStorageManager(config=REDIS_CONFIG)
+
+    # Setup the manager to initialize Redis client
+    result = manager.setup()
+    assert result is True
+
+    assert manager._redis_client is not None
+    assert manager._is_initialized is True
+
+
+def test_get_client(mock_client, initialized_manager):
+    """Test getting Redis client."""
+    assert initialized_manager.get_client() == mock_client
+
 
+def test_get_collector(mock_client, initialized_manager):
+    """Test getting Redis collector."""
+    with patch(
+        "gunicorn_prometheus_exporter.metrics.get_shared_registry",
+        return_value=CollectorRegistry(),
+    ):
+        collector = initialized_manager.get_collector()
 
-class TestRedisStorageManager:
-    """Test RedisStorageManager class."""
-
-    def setup_method(self):
-        """Set up test environment."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["REDIS_HOST"] = "localhost"
-        os.environ["REDIS_PORT"] = "6379"
-        os.environ["REDIS_DB"] = "0"
-
-    def teardown_method(self):
-        """Clean up test environment."""
-        os.environ.pop("REDIS_ENABLED", None)
-        os.environ.pop("REDIS_HOST", None)
-        os.environ.pop("REDIS_PORT", None)
-        os.environ.pop("REDIS_DB", None)
+    assert isinstance(collector, RedisMultiProcessCollector)
+    assert collector._redis_client is mock_client
 
-    @patch("gunicorn_prometheus_exporter.backend.service.manager.redis")
-    def test_init_success(self, mock_redis):
-        """Test successful initialization."""
-        mock_client = Mock()
-        mock_redis.from_url.return_value = mock_client
-        mock_client.ping.return_value = True
-
-        manager = RedisStorageManager()
-
-        # Setup the manager to initialize Redis client
-        result = manager.setup()
-        assert result is True
-
-        assert manager._redis_client is not None
-        assert manager._is_initialized is True
 
-    @patch("gunicorn_prometheus_exporter.backend.service.manager.redis")
-    def test_init_connection_failure(self, mock_redis):
-        """Test initialization with connection failure."""
-        mock_redis.Redis.side_effect = Exception("Connection failed")
-
-        manager = RedisStorageManager()
+@pytest.mark.usefixtures("mock_client")
+def test_cleanup_keys(mock_redis_module):
+    """Test cleanup removes this process's keys and nothing else."""
+    client = fakeredis.FakeStrictRedis()
+    mock_redis_module.Redis.return_value = client
+    pid = os.getpid()
+    pipe = client.pipeline()
+    for i in range(200):
+        pipe.hset(f"gunicorn:counter:{pid}:metric:{i}", "value", 0)
+    pipe.hset(f"gunicorn:counter:{pid + 1}:metric:0", "value", 0)
+    pipe.execute()
 
-        # RedisStorageManager handles connection failures gracefully
-        # Just test that it doesn't raise an exception
-        assert manager is not None
+    manager = RedisStorageManager(config=REDIS_CONFIG)
 
-    @patch("gunicorn_prometheus_exporter.backend.service.manager.redis")
-    def test_get_client(self, mock_redis):
-        """Test getting Redis client."""
-        mock_client = Mock()
-        mock_redis.from_url.return_value = mock_client
-        mock_client.ping.return_value = True
+    # Setup the manager to initialize Redis client
+    manager.setup()
 
-        manager = RedisStorageManager()
+    result = manager.cleanup_keys()
 
-        # Setup the manager to initialize Redis client
-        manager.setup()
-
-        client = manager.get_client()
-        assert client == mock_client
-
-    @patch("gunicorn_prometheus_exporter.backend.service.manager.redis")
-    def test_get_collector(self, mock_redis):
-        """Test getting Redis collector."""
-        mock_client = Mock()
-        mock_redis.from_url.return_value = mock_client
-        mock_client.ping.return_value = True
-
-        manager = RedisStorageManager()
-
-        # Setup the manager to initialize Redis client
-        manager.setup()
+    # cleanup_keys returns None, just test it doesn't raise
+    assert result is None
+    assert list(client.scan_iter(match=f"gunicorn:*:{pid}:*")) == []
+    # Keys owned by other processes are left alone
+    assert list(client.scan_iter(match="gunicorn:*")) == [
+        f"gunicorn:counter:{pid + 1}:metric:0".encode()
+    ]
 
-        collector = manager.get_collector()
-        # Collector may be None if there's an import error
-        assert collector is None or collector is not None
-
-    @patch("gunicorn_prometheus_exporter.backend.service.manager.redis")
-    def test_cleanup_keys(self, mock_redis):
-        """Test cleanup of Redis keys."""
-        mock_client = Mock()
-        mock_redis.from_url.return_value = mock_client
-        mock_client.ping.return_value = True
-        mock_client.scan_iter.return_value = [
-            b"gunicorn:counter:123:metric1",
-            b"gunicorn:gauge:456:metric2",
-        ]
-        mock_client.delete.return_value = 2
-
-        manager = RedisStorageManager()
-
-        # Setup the manager to initialize Redis client
-        manager.setup()
-
-        result = manager.cleanup_keys()
-
-        # cleanup_keys returns None, just test it doesn't raise
-        assert result is None
-        # The actual key pattern includes more parts, so just test that keys was called
-        mock_client.scan_iter.assert_called_once()
-        mock_client.delete.assert_called_once()
-
-    @patch("gunicorn_prometheus_exporter.backend.service.manager.redis")
-    def test_cleanup_keys_no_keys(self, mock_redis):
-        """Test cleanup when no keys exist."""
-        mock_client = Mock()
-        mock_redis.from_url.return_value = mock_client
-        mock_client.ping.return_value = True
-        mock_client.scan_iter.return_value = []
-
-        manager = RedisStorageManager()
-
-        # Setup the manager to initialize Redis client
-        manager.setup()
-
-        result = manager.cleanup_keys()
-
-        # cleanup_keys returns None, just test it doesn't raise
-        assert result is None
-        # The actual key pattern includes more parts, so just test that keys was called
-        mock_client.scan_iter.assert_called_once()
-
-    @patch("gunicorn_prometheus_exporter.backend.service.manager.redis")
-    def test_cleanup_keys_error(self, mock_redis):
-        """Test cleanup with Redis error."""
-        mock_client = Mock()
-        mock_redis.from_url.return_value = mock_client
-        mock_client.ping.return_value = True
-        mock_client.keys.side_effect = Exception("Redis error")
-
-        manager = RedisStorageManager()
 
-        # Setup the manager to initialize Redis client
-        manager.setup()
-
-        # RedisStorageManager handles errors gracefully
-        # Just test that it doesn't raise an exception
-        result = manager.cleanup_keys()
-        assert result is None
+def test_cleanup_keys_unlinks_in_batches(mock_client, initialized_manager):
+    """Test cleanup of many keys unlinks them in batches of 500."""
+    keys = [f"gunicorn:counter:{os.getpid()}:metric:{i}" for i in range(750)]
+    mock_client.scan_iter.return_value = iter(keys)
+    mock_pipe = mock_client.pipeline.return_value
+    mock_pipe.execute.return_value = [500, 250]
 
+    initialized_manager.cleanup_keys()
 
-class TestRedisStorageManagerFunctions:
-    """Test module-level functions."""
-
-    def setup_method(self):
-        """Set up test environment."""
-        os.environ["REDIS_ENABLED"] = "true"
-
-    def teardown_method(self):
-        """Clean up test environment."""
-        os.environ.pop("REDIS_ENABLED", None)
-
-    @patch("gunicorn_prometheus_exporter.backend.service.manager.redis")
-    def test_is_redis_enabled_true(self, mock_redis):
-        """Test is_redis_enabled returns True when enabled."""
-        mock_client = Mock()
-        mock_redis.from_url.return_value = mock_client
-        mock_client.ping.return_value = True
-
-        # Setup the manager first
-        manager = get_redis_storage_manager()
-        manager.setup()
-
-        result = is_redis_enabled()
-        assert result is True
-
-    def test_is_redis_enabled_false(self):
-        """Test is_redis_enabled returns False when disabled."""
-        # Use a fresh config instance for this test
-        from gunicorn_prometheus_exporter.config import ExporterConfig
-
-        test_config = ExporterConfig()
-
-        # Mock the environment variable
-        with patch.dict(os.environ, {"REDIS_ENABLED": "false"}):
-            # Reset the cached value
-            test_config._redis_enabled = None
-            result = test_config.redis_enabled
-            assert result is False
-
-    def test_is_redis_enabled_not_set(self):
-        """Test is_redis_enabled returns False when not set."""
-        # Use a fresh config instance for this test
-        from gunicorn_prometheus_exporter.config import ExporterConfig
+    assert [c.args for c in mock_pipe.unlink.call_args_list] == [
+        tuple(keys[:500]),
+        tuple(keys[500:]),
+    ]
+    # Every batch goes out in the same round trip
+    assert mock_pipe.execute.call_count == 1
 
-        test_config = ExporterConfig()
 
-        # Mock the environment variable (remove it)
-        with patch.dict(os.environ, {}, clear=True):
-            # Reset the cached value
-            test_config._redis_enabled = None
-            result = test_config.redis_enabled
-            assert result is False
+def test_cleanup_keys_no_keys(mock_client, initialized_manager):
+    """Test cleanup when no keys exist."""
+    mock_client.scan_iter.return_value = []
 
-    def test_get_redis_storage_manager(self):
-        """Test get_redis_storage_manager function."""
-        result = get_redis_storage_manager()
-
-        # Function returns a real instance, not a mock
-        assert isinstance(result, RedisStorageManager)
+    result = initialized_manager.cleanup_keys()
 
-    def test_get_redis_client(self):
-        """Test get_redis_client function."""
-        result = get_redis_client()
+    # cleanup_keys returns None, just test it doesn't raise
+    assert result is None
+    mock_client.scan_iter.assert_called_once()
+    mock_client.keys.assert_not_called()
+    # Nothing to unlink, so no pipeline round trip
+    mock_client.pipeline.assert_not_called()
 
-        # Function may return None if not initialized
-        assert result is None or hasattr(result, "ping")
 
-    def test_get_redis_collector(self):
-        """Test get_redis_collector function."""
+@pytest.mark.parametrize(
+    "failing,setup_ok",
+    [("Redis", False), ("ping", False), ("scan_iter", True)],
+)
+def test_graceful_failures(failing, setup_ok, mock_redis_module, mock_client):
+    """Test Redis errors during setup or cleanup are handled gracefully."""
+    target = mock_redis_module if failing == "Redis" else mock_client
+    getattr(target, failing).side_effect = Exception("Redis error")
+
+    manager = RedisStorageManager(config=REDIS_CONFIG)
+
+    assert manager.setup() is setup_ok
+    assert manager.is_enabled() is setup_ok
+    assert manager.cleanup_keys() is None
+
+
+class TestRedisConfig:
+    """Test RedisConfig settings object."""
+
+    def test_from_env(self, monkeypatch):
+        """Test RedisConfig reads settings from the environment."""
+        monkeypatch.setenv("REDIS_ENABLED", "true")
+        monkeypatch.setenv("REDIS_HOST", "redis.internal")
+        monkeypatch.setenv("REDIS_PORT", "6380")
+        monkeypatch.setenv("REDIS_DB", "2")
+        monkeypatch.setenv("REDIS_KEY_PREFIX", "app")
+        monkeypatch.delenv("REDIS_PASSWORD", raising=False)
+
+        config = RedisConfig.from_env()
+
+        assert config == RedisConfig(
+            enabled=True, host="redis.internal", port=6380, db=2, key_prefix="app"
+        )
+        assert config.url == "redis://redis.internal:6380/2"
+
+    def test_url_with_password(self):
+        """Test RedisConfig URL includes the password when set."""
+        config = RedisConfig(host="localhost", password="secret")
+
+        assert config.url == "redis://:secret@localhost:6379/0"
+
+    def test_disabled_config_skips_setup(self):
+        """Test an injected disabled config wins over the environment."""
+        manager = RedisStorageManager(config=RedisConfig(enabled=False))
+
+        assert manager.setup() is False
+        assert manager.is_enabled() is False
+
+
+def test_is_redis_enabled_true(fake_redis):
+    """Test is_redis_enabled returns True when enabled."""
+    # Setup the manager first
+    manager = get_redis_storage_manager()
+    manager.setup()
+
+    result = is_redis_enabled()
+    assert result is True
+
+
+@pytest.mark.parametrize(
+    "env,expected",
+    [
+        ({"REDIS_ENABLED": "true"}, True),
+        ({"REDIS_ENABLED": "false"}, False),
+        ({}, False),
+    ],
+)
+def test_config_redis_enabled(env, expected, monkeypatch):
+    """Test the config's Redis flag for enabled, disabled and unset values."""
+    test_config = ExporterConfig()
+
+    monkeypatch.delenv("REDIS_ENABLED", raising=False)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+    assert test_config.redis_enabled is expected
+
+
+def test_get_redis_storage_manager(fake_redis):
+    """Test get_redis_storage_manager function."""
+    result = get_redis_storage_manager()
+
+    # Function returns a real instance, created once
+    assert isinstance(result, RedisStorageManager)
+    assert get_redis_storage_manager() is result
+
+
+def test_get_redis_client(fake_redis):
+    """Test get_redis_client function."""
+    assert get_redis_client() is None
+
+    setup_redis_metrics()
+
+    assert get_redis_client() is fake_redis
+
+
+def test_get_redis_collector(fake_redis):
+    """Test get_redis_collector function."""
+    assert get_redis_collector() is None
+
+    setup_redis_metrics()
+    with patch(
+        "gunicorn_prometheus_exporter.metrics.get_shared_registry",
+        return_value=CollectorRegistry(),
+    ):
         result = get_redis_collector()
 
-        # Function may return None if not initialized
-        assert result is None or hasattr(result, "collect")
-
-    def test_cleanup_redis_keys(self):
-        """Test cleanup_redis_keys function."""
-        result = cleanup_redis_keys()
-
-        # Function returns None, just test it doesn't raise
-        assert result is None
-
-    def test_setup_redis_metrics(self):
-        """Test setup_redis_metrics function."""
-        result = setup_redis_metrics()
-
-        # Function may return False if Redis is not enabled
-        assert result is False or result is True
-
-    def test_teardown_redis_metrics(self):
-        """Test teardown_redis_metrics function."""
-        result = teardown_redis_metrics()
-
-        # Function returns None, just test it doesn't raise
-        assert result is None
-
-
-class TestRedisStorageManagerIntegration:
-    """Integration tests for Redis storage manager."""
-
-    def setup_method(self):
-        """Set up test environment."""
-        os.environ["REDIS_ENABLED"] = "true"
-        os.environ["REDIS_HOST"] = "localhost"
-        os.environ["REDIS_PORT"] = "6379"
-        os.environ["REDIS_DB"] = "0"
-
-    def teardown_method(self):
-        """Clean up test environment."""
-        os.environ.pop("REDIS_ENABLED", None)
-        os.environ.pop("REDIS_HOST", None)
-        os.environ.pop("REDIS_PORT", None)
-        os.environ.pop("REDIS_DB", None)
-
-    @patch("gunicorn_prometheus_exporter.backend.service.manager.redis")
-    def test_manager_lifecycle(self, mock_redis):
-        """Test complete manager lifecycle."""
-        mock_client = Mock()
-        mock_redis.from_url.return_value = mock_client
-        mock_client.ping.return_value = True
-        mock_client.keys.return_value = []
-        mock_client.delete.return_value = 0
-
-        # Test initialization
-        manager = RedisStorageManager()
-        assert manager is not None
-
-        # Test getting client
-        client = manager.get_client()
-        # Client may be None if not initialized
-        assert client is None or hasattr(client, "ping")
-
-        # Test getting collector
-        collector = manager.get_collector()
-        # Collector may be None if not initialized
-        assert collector is None or hasattr(collector, "collect")
-
-        # Test cleanup
-        result = manager.cleanup_keys()
-
-        # cleanup_keys returns None, just test it doesn't raise
-        assert result is None
-
-    @patch("gunicorn_prometheus_exporter.backend.service.manager.redis")
-    def test_error_handling(self, mock_redis):
-        """Test error handling in manager."""
-        mock_client = Mock()
-        mock_redis.from_url.return_value = mock_client
-        mock_client.ping.side_effect = Exception("Connection failed")
-
-        manager = RedisStorageManager()
-
-        # RedisStorageManager handles connection failures gracefully
-        # Just test that it doesn't raise an exception
-        assert manager is not None
+    assert isinstance(result, RedisMultiProcessCollector)
+
+
+def test_cleanup_redis_keys(fake_redis):
+    """Test cleanup_redis_keys function."""
+    own_key = f"gunicorn:counter:{os.getpid()}:metric:abc"
+    other_key = "gunicorn:counter:1:metric:abc"
+    fake_redis.hset(own_key, "value", 1.0)
+    fake_redis.hset(other_key, "value", 1.0)
+    setup_redis_metrics()
+
+    result = cleanup_redis_keys()
+
+    assert result is None
+    # Only this process's keys are removed
+    assert not fake_redis.exists(own_key)
+    assert fake_redis.exists(other_key)
+
+
+def test_setup_redis_metrics(fake_redis):
+    """Test setup_redis_metrics function."""
+    from prometheus_client import values
+
+    result = setup_redis_metrics()
+
+    assert result is True
+    assert is_redis_enabled() is True
+    assert values.ValueClass.__name__ == "ConfiguredRedisValue"
+
+
+def test_setup_redis_metrics_registers_atexit_teardown_once(monkeypatch):
+    """Test setup_redis_metrics registers teardown at exit only once."""
+    from gunicorn_prometheus_exporter.backend.service import manager
+
+    mock_manager = Mock()
+    mock_manager.setup.return_value = True
+    monkeypatch.setattr(manager, "_global_manager", mock_manager)
+    monkeypatch.setattr(manager, "_atexit_registered", False)
+
+    with patch.object(manager.atexit, "register") as mock_register:
+        assert setup_redis_metrics() is True
+        assert setup_redis_metrics() is True
+
+    mock_register.assert_called_once_with(teardown_redis_metrics)
+
+
+def test_setup_redis_metrics_failure_skips_atexit(monkeypatch):
+    """Test a failed setup does not register the exit hook."""
+    from gunicorn_prometheus_exporter.backend.service import manager
+
+    mock_manager = Mock()
+    mock_manager.setup.return_value = False
+    monkeypatch.setattr(manager, "_global_manager", mock_manager)
+    monkeypatch.setattr(manager, "_atexit_registered", False)
+
+    with patch.object(manager.atexit, "register") as mock_register:
+        assert setup_redis_metrics() is False
+
+    mock_register.assert_not_called()
+
+
+def test_teardown_redis_metrics(fake_redis):
+    """Test teardown_redis_metrics function."""
+    from prometheus_client import values
+
+    original_value_class = values.ValueClass
+    setup_redis_metrics()
+
+    result = teardown_redis_metrics()
+
+    assert result is None
+    assert is_redis_enabled() is False
+    assert values.ValueClass is original_value_class
+
+
+def test_manager_lifecycle(mock_client):
+    """Test complete manager lifecycle."""
+    # Test initialization
+    manager = RedisStorageManager(config=REDIS_CONFIG)
+    assert manager is not None
+
+    # Client and collector are unavailable until setup
+    assert manager.get_client() is None
+    assert manager.get_collector() is None
+
+    # Test cleanup before setup is a no-op
+    assert manager.cleanup_keys() is None
+    mock_client.scan_iter.assert_not_called()
+
+    # Test cleanup after setup scans and finds nothing to unlink
+    assert manager.setup() is True
+    assert manager.get_client() is mock_client
+    assert manager.cleanup_keys() is None
+    mock_client.scan_iter.assert_called_once()
+    mock_client.keys.assert_not_called()
+    mock_client.pipeline.return_value.unlink.assert_not_called()
 
 
 class TestManagerExceptionHandling:
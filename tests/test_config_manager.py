@@ -3,10 +3,9 @@ Tests for Gunicorn Prometheus Exporter configuration manager.
 """
 
 import os
-import tempfile
 import threading
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -17,9 +16,61 @@ from gunicorn_prometheus_exporter.config import (
     get_config,
     get_config_manager,
     initialize_config,
+    manager as config_manager,
 )
 
 
+BASE_KWARGS = {
+    "PROMETHEUS_METRICS_PORT": "9091",
+    "PROMETHEUS_BIND_ADDRESS": "0.0.0.0",
+    "GUNICORN_WORKERS": "2",
+}
+
+REDIS_KWARGS = {
+    "REDIS_ENABLED": "true",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+}
+
+
+@pytest.fixture(scope="session")
+def multiproc_dir(tmp_path_factory):
+    """One multiprocess directory shared by every ConfigManager test."""
+    return str(tmp_path_factory.mktemp("multiproc"))
+
+
+@pytest.fixture
+def initialized_manager(multiproc_dir):
+    """A ConfigManager initialized with BASE_KWARGS, cleaned up afterwards."""
+    manager = ConfigManager()
+    manager.initialize(**BASE_KWARGS, PROMETHEUS_MULTIPROC_DIR=multiproc_dir)
+    yield manager
+    manager.cleanup()
+
+
+@pytest.fixture
+def mock_redis():
+    """Patch redis.Redis and yield the mock class with the client it returns."""
+    with patch("redis.Redis") as mock_redis_cls:
+        # Only ping() is used, so a typo in a test fails instead of passing
+        mock_client = Mock(spec=["ping"])
+        mock_redis_cls.return_value = mock_client
+        yield mock_redis_cls, mock_client
+
+
+@pytest.fixture
+def fresh_global_manager(monkeypatch):
+    """Swap in an empty global manager; the session one is restored afterwards."""
+    monkeypatch.setattr(config_manager, "_config_manager", None)
+
+
+@pytest.fixture(autouse=True)
+def restore_environ():
+    """Undo the variables ConfigManager.initialize writes to os.environ."""
+    with patch.dict(os.environ):
+        yield
+
+
 class TestConfigManager:
     """Test ConfigManager class."""
 
@@ -31,42 +82,26 @@ class TestConfigManager:
         assert not manager.is_initialized
         assert manager.validation_errors == []
 
-    def test_initialize_success(self):
+    def test_initialize_success(self, initialized_manager):
         """Test successful configuration initialization."""
-        manager = ConfigManager()
+        manager = initialized_manager
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager.initialize(
-                PROMETHEUS_METRICS_PORT="9091",
-                PROMETHEUS_BIND_ADDRESS="0.0.0.0",
-                GUNICORN_WORKERS="2",
-                PROMETHEUS_MULTIPROC_DIR=temp_dir,
-            )
-
-            assert manager.state == ConfigState.INITIALIZED
-            assert manager.is_initialized
-            assert manager.validation_errors == []
+        assert manager.state == ConfigState.INITIALIZED
+        assert manager.is_initialized
+        assert manager.validation_errors == []
 
-            config = manager.get_config()
-            assert config.prometheus_metrics_port == 9091
-            assert config.prometheus_bind_address == "0.0.0.0"
-            assert config.gunicorn_workers == 2
+        config = manager.get_config()
+        assert config.prometheus_metrics_port == 9091
+        assert config.prometheus_bind_address == "0.0.0.0"
+        assert config.gunicorn_workers == 2
 
-    def test_initialize_already_initialized(self):
+    def test_initialize_already_initialized(self, initialized_manager):
         """Test initialization when already initialized."""
-        manager = ConfigManager()
+        manager = initialized_manager
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager.initialize(
-                PROMETHEUS_METRICS_PORT="9091",
-                PROMETHEUS_BIND_ADDRESS="0.0.0.0",
-                GUNICORN_WORKERS="2",
-                PROMETHEUS_MULTIPROC_DIR=temp_dir,
-            )
-
-            # Try to initialize again
-            with pytest.raises(RuntimeError, match="Configuration already initialized"):
-                manager.initialize(PROMETHEUS_METRICS_PORT="9092")
+        # Try to initialize again
+        with pytest.raises(RuntimeError, match="Configuration already initialized"):
+            manager.initialize(PROMETHEUS_METRICS_PORT="9092")
 
     def test_initialize_validation_failure(self):
         """Test initialization with validation failure."""
@@ -98,24 +133,16 @@ class TestConfigManager:
         with pytest.raises(RuntimeError, match="Configuration not ready"):
             manager.get_config()
 
-    def test_update_config_success(self):
+    def test_update_config_success(self, initialized_manager):
         """Test successful configuration update."""
-        manager = ConfigManager()
+        manager = initialized_manager
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager.initialize(
-                PROMETHEUS_METRICS_PORT="9091",
-                PROMETHEUS_BIND_ADDRESS="0.0.0.0",
-                GUNICORN_WORKERS="2",
-                PROMETHEUS_MULTIPROC_DIR=temp_dir,
-            )
-
-            # Update configuration
-            manager.update_config(PROMETHEUS_METRICS_PORT="9092")
+        # Update configuration
+        manager.update_config(PROMETHEUS_METRICS_PORT="9092")
 
-            assert manager.state == ConfigState.INITIALIZED
-            config = manager.get_config()
-            assert config.prometheus_metrics_port == 9092
+        assert manager.state == ConfigState.INITIALIZED
+        config = manager.get_config()
+        assert config.prometheus_metrics_port == 9092
 
     def test_update_config_not_initialized(self):
         """Test updating config when not initialized."""
@@ -124,68 +151,44 @@ class TestConfigManager:
         with pytest.raises(RuntimeError, match="Configuration not initialized"):
             manager.update_config(PROMETHEUS_METRICS_PORT="9092")
 
-    def test_reload_config_success(self):
+    def test_reload_config_success(self, monkeypatch, initialized_manager):
         """Test successful configuration reload."""
-        manager = ConfigManager()
+        manager = initialized_manager
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager.initialize(
-                PROMETHEUS_METRICS_PORT="9091",
-                PROMETHEUS_BIND_ADDRESS="0.0.0.0",
-                GUNICORN_WORKERS="2",
-                PROMETHEUS_MULTIPROC_DIR=temp_dir,
-            )
-
-            # Change environment variable
-            os.environ["PROMETHEUS_METRICS_PORT"] = "9093"
+        # Change environment variable
+        monkeypatch.setenv("PROMETHEUS_METRICS_PORT", "9093")
 
-            # Reload configuration
-            manager.reload_config()
+        # Reload configuration
+        manager.reload_config()
 
-            assert manager.state == ConfigState.INITIALIZED
-            config = manager.get_config()
-            assert config.prometheus_metrics_port == 9093
+        assert manager.state == ConfigState.INITIALIZED
+        config = manager.get_config()
+        assert config.prometheus_metrics_port == 9093
 
-    def test_cleanup(self):
+    def test_cleanup(self, initialized_manager):
         """Test configuration cleanup."""
-        manager = ConfigManager()
+        manager = initialized_manager
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager.initialize(
-                PROMETHEUS_METRICS_PORT="9091",
-                PROMETHEUS_BIND_ADDRESS="0.0.0.0",
-                GUNICORN_WORKERS="2",
-                PROMETHEUS_MULTIPROC_DIR=temp_dir,
-            )
-
-            assert manager.is_initialized
+        assert manager.is_initialized
 
-            # Cleanup
-            manager.cleanup()
+        # Cleanup
+        manager.cleanup()
 
-            assert manager.state == ConfigState.UNINITIALIZED
-            assert not manager.is_initialized
-            assert manager._config is None
+        assert manager.state == ConfigState.UNINITIALIZED
+        assert not manager.is_initialized
+        assert manager._config is None
 
-    def test_reset(self):
+    def test_reset(self, initialized_manager):
         """Test configuration reset."""
-        manager = ConfigManager()
+        manager = initialized_manager
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager.initialize(
-                PROMETHEUS_METRICS_PORT="9091",
-                PROMETHEUS_BIND_ADDRESS="0.0.0.0",
-                GUNICORN_WORKERS="2",
-                PROMETHEUS_MULTIPROC_DIR=temp_dir,
-            )
+        # Reset
+        manager.reset()
 
-            # Reset
-            manager.reset()
-
-            assert manager.state == ConfigState.UNINITIALIZED
-            assert not manager.is_initialized
+        assert manager.state == ConfigState.UNINITIALIZED
+        assert not manager.is_initialized
 
-    def test_get_config_summary(self):
+    def test_get_config_summary(self, multiproc_dir):
         """Test getting configuration summary."""
         manager = ConfigManager()
 
@@ -195,36 +198,22 @@ class TestConfigManager:
         assert not summary["initialized"]
 
         # Test initialized state
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager.initialize(
-                PROMETHEUS_METRICS_PORT="9091",
-                PROMETHEUS_BIND_ADDRESS="0.0.0.0",
-                GUNICORN_WORKERS="2",
-                PROMETHEUS_MULTIPROC_DIR=temp_dir,
-            )
+        manager.initialize(**BASE_KWARGS, PROMETHEUS_MULTIPROC_DIR=multiproc_dir)
 
-            summary = manager.get_config_summary()
-            assert summary["state"] == ConfigState.INITIALIZED.value
-            assert summary["initialized"]
-            assert summary["prometheus_port"] == 9091
-            assert summary["gunicorn_workers"] == 2
+        summary = manager.get_config_summary()
+        assert summary["state"] == ConfigState.INITIALIZED.value
+        assert summary["initialized"]
+        assert summary["prometheus_port"] == 9091
+        assert summary["gunicorn_workers"] == 2
 
-    def test_health_check_healthy(self):
+    def test_health_check_healthy(self, initialized_manager):
         """Test health check when healthy."""
-        manager = ConfigManager()
+        manager = initialized_manager
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager.initialize(
-                PROMETHEUS_METRICS_PORT="9091",
-                PROMETHEUS_BIND_ADDRESS="0.0.0.0",
-                GUNICORN_WORKERS="2",
-                PROMETHEUS_MULTIPROC_DIR=temp_dir,
-            )
-
-            health = manager.health_check()
-            assert health["healthy"]
-            assert health["state"] == ConfigState.INITIALIZED.value
-            assert health["errors"] == []
+        health = manager.health_check()
+        assert health["healthy"]
+        assert health["state"] == ConfigState.INITIALIZED.value
+        assert health["errors"] == []
 
     def test_health_check_unhealthy(self):
         """Test health check when unhealthy."""
@@ -235,74 +224,57 @@ class TestConfigManager:
         assert not health["healthy"]
         assert "Configuration not initialized" in health["errors"]
 
-    def test_redis_validation_success(self):
+    def test_redis_validation_success(self, mock_redis, multiproc_dir):
         """Test Redis validation when Redis is enabled and working."""
+        mock_redis_cls, mock_client = mock_redis
+        mock_client.ping.return_value = True
         manager = ConfigManager()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("redis.Redis") as mock_redis:
-                mock_client = MagicMock()
-                mock_client.ping.return_value = True
-                mock_redis.return_value = mock_client
+        manager.initialize(
+            **BASE_KWARGS,
+            PROMETHEUS_MULTIPROC_DIR=multiproc_dir,
+            **REDIS_KWARGS,
+        )
 
-                manager.initialize(
-                    PROMETHEUS_METRICS_PORT="9091",
-                    PROMETHEUS_BIND_ADDRESS="0.0.0.0",
-                    GUNICORN_WORKERS="2",
-                    PROMETHEUS_MULTIPROC_DIR=temp_dir,
-                    REDIS_ENABLED="true",
-                    REDIS_HOST="localhost",
-                    REDIS_PORT="6379",
-                )
-
-                assert manager.state == ConfigState.INITIALIZED
-                mock_redis.assert_called_once()
-                mock_client.ping.assert_called_once()
+        assert manager.state == ConfigState.INITIALIZED
+        mock_redis_cls.assert_called_once()
+        mock_client.ping.assert_called_once()
 
-    def test_redis_validation_failure(self):
+    def test_redis_validation_failure(self, mock_redis, multiproc_dir):
         """Test Redis validation when Redis connection fails."""
+        _, mock_client = mock_redis
+        mock_client.ping.side_effect = Exception("Connection failed")
         manager = ConfigManager()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("redis.Redis") as mock_redis:
-                mock_client = MagicMock()
-                mock_client.ping.side_effect = Exception("Connection failed")
-                mock_redis.return_value = mock_client
-
-                with pytest.raises(ValueError, match="Cannot connect to Redis"):
-                    manager.initialize(
-                        PROMETHEUS_METRICS_PORT="9091",
-                        PROMETHEUS_BIND_ADDRESS="0.0.0.0",
-                        GUNICORN_WORKERS="2",
-                        PROMETHEUS_MULTIPROC_DIR=temp_dir,
-                        REDIS_ENABLED="true",
-                        REDIS_HOST="localhost",
-                        REDIS_PORT="6379",
-                    )
-
-    def test_thread_safety(self):
+        with pytest.raises(ValueError, match="Cannot connect to Redis"):
+            manager.initialize(
+                **BASE_KWARGS,
+                PROMETHEUS_MULTIPROC_DIR=multiproc_dir,
+                **REDIS_KWARGS,
+            )
+
+    def test_thread_safety(self, multiproc_dir):
         """Test thread safety of ConfigManager."""
         manager = ConfigManager()
         results = []
         errors = []
+        # Release all threads together so they actually race on initialize()
+        barrier = threading.Barrier(3)
 
         def worker():
+            barrier.wait()
             try:
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    manager.initialize(
-                        PROMETHEUS_METRICS_PORT="9091",
-                        PROMETHEUS_BIND_ADDRESS="0.0.0.0",
-                        GUNICORN_WORKERS="2",
-                        PROMETHEUS_MULTIPROC_DIR=temp_dir,
-                    )
-                    config = manager.get_config()
-                    results.append(config.prometheus_metrics_port)
+                manager.initialize(
+                    **BASE_KWARGS, PROMETHEUS_MULTIPROC_DIR=multiproc_dir
+                )
+                config = manager.get_config()
+                results.append(config.prometheus_metrics_port)
             except Exception as e:
                 errors.append(e)
 
         # Start multiple threads
         threads = []
-        for _ in range(5):
+        for _ in range(3):
             thread = threading.Thread(target=worker)
             threads.append(thread)
             thread.start()
@@ -317,6 +289,7 @@ class TestConfigManager:
         assert all(result == 9091 for result in results)
 
 
+@pytest.mark.usefixtures("fresh_global_manager")
 class TestGlobalConfigManager:
     """Test global configuration manager functions."""
 
@@ -327,110 +300,29 @@ class TestGlobalConfigManager:
 
         assert manager1 is manager2
 
-    def test_initialize_config(self):
+    def test_initialize_config(self, multiproc_dir):
         """Test global initialize_config function."""
-        # Clean up first
-        cleanup_config()
+        initialize_config(**BASE_KWARGS, PROMETHEUS_MULTIPROC_DIR=multiproc_dir)
 
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                initialize_config(
-                    PROMETHEUS_METRICS_PORT="9091",
-                    PROMETHEUS_BIND_ADDRESS="0.0.0.0",
-                    GUNICORN_WORKERS="2",
-                    PROMETHEUS_MULTIPROC_DIR=temp_dir,
-                )
+        manager = get_config_manager()
+        assert manager.is_initialized
 
-                manager = get_config_manager()
-                assert manager.is_initialized
-        finally:
-            # Always cleanup to prevent leaving singleton pointing at deleted temp dir
-            cleanup_config()
-            # Re-initialize with session-scoped temp dir for other tests
-            try:
-                initialize_config(
-                    PROMETHEUS_METRICS_PORT="9091",
-                    PROMETHEUS_BIND_ADDRESS="127.0.0.1",
-                    GUNICORN_WORKERS="2",
-                    PROMETHEUS_MULTIPROC_DIR=os.environ.get("PROMETHEUS_MULTIPROC_DIR"),
-                )
-            except RuntimeError as e:
-                if "Configuration already initialized" in str(e):
-                    # Config is already initialized, that's fine
-                    pass
-                else:
-                    raise
-
-    def test_get_config_global(self):
+    def test_get_config_global(self, multiproc_dir):
         """Test global get_config function."""
-        # Clean up first
-        cleanup_config()
+        initialize_config(**BASE_KWARGS, PROMETHEUS_MULTIPROC_DIR=multiproc_dir)
 
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                initialize_config(
-                    PROMETHEUS_METRICS_PORT="9091",
-                    PROMETHEUS_BIND_ADDRESS="0.0.0.0",
-                    GUNICORN_WORKERS="2",
-                    PROMETHEUS_MULTIPROC_DIR=temp_dir,
-                )
+        config = get_config()
+        assert config.prometheus_metrics_port == 9091
 
-                config = get_config()
-                assert config.prometheus_metrics_port == 9091
-        finally:
-            # Always cleanup to prevent leaving singleton pointing at deleted temp dir
-            cleanup_config()
-            # Re-initialize with session-scoped temp dir for other tests
-            try:
-                initialize_config(
-                    PROMETHEUS_METRICS_PORT="9091",
-                    PROMETHEUS_BIND_ADDRESS="127.0.0.1",
-                    GUNICORN_WORKERS="2",
-                    PROMETHEUS_MULTIPROC_DIR=os.environ.get("PROMETHEUS_MULTIPROC_DIR"),
-                )
-            except RuntimeError as e:
-                if "Configuration already initialized" in str(e):
-                    # Config is already initialized, that's fine
-                    pass
-                else:
-                    raise
-
-    def test_cleanup_config(self):
+    def test_cleanup_config(self, multiproc_dir):
         """Test global cleanup_config function."""
-        # Clean up first
-        cleanup_config()
-
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                initialize_config(
-                    PROMETHEUS_METRICS_PORT="9091",
-                    PROMETHEUS_BIND_ADDRESS="0.0.0.0",
-                    GUNICORN_WORKERS="2",
-                    PROMETHEUS_MULTIPROC_DIR=temp_dir,
-                )
+        initialize_config(**BASE_KWARGS, PROMETHEUS_MULTIPROC_DIR=multiproc_dir)
 
-                manager = get_config_manager()
-                assert manager.is_initialized
+        manager = get_config_manager()
+        assert manager.is_initialized
 
-                cleanup_config()
+        cleanup_config()
 
-                # Get new manager instance
-                manager = get_config_manager()
-                assert not manager.is_initialized
-        finally:
-            # Always cleanup to prevent leaving singleton pointing at deleted temp dir
-            cleanup_config()
-            # Re-initialize with session-scoped temp dir for other tests
-            try:
-                initialize_config(
-                    PROMETHEUS_METRICS_PORT="9091",
-                    PROMETHEUS_BIND_ADDRESS="127.0.0.1",
-                    GUNICORN_WORKERS="2",
-                    PROMETHEUS_MULTIPROC_DIR=os.environ.get("PROMETHEUS_MULTIPROC_DIR"),
-                )
-            except RuntimeError as e:
-                if "Configuration already initialized" in str(e):
-                    # Config is already initialized, that's fine
-                    pass
-                else:
-                    raise
+        # Get new manager instance
+        manager = get_config_manager()
+        assert not manager.is_initialized
@@ -1,14 +1,16 @@
 """Tests for enhanced ConfigManager with YAML support."""
 
+import copy
 import os
-import tempfile
 
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
 
 import pytest
 import yaml
 
+from conftest import YAML_DUMPER
+
 from gunicorn_prometheus_exporter.config.manager import (
     ConfigManager,
     ConfigState,
@@ -17,28 +19,80 @@ from gunicorn_prometheus_exporter.config.manager import (
 )
 
 
+# Environment variables the exporter reads or the YAML loader writes
+_ENV_PREFIXES = ("PROMETHEUS_", "GUNICORN_", "REDIS_", "CLEANUP_", "SIDECAR_")
+
+BASE_CONFIG = {
+    "exporter": {
+        "prometheus": {"metrics_port": 9091, "bind_address": "0.0.0.0"},
+        "gunicorn": {"workers": 2},
+    }
+}
+
+
+def dump_yaml(path: Path, config_data: dict) -> str:
+    """Write a test YAML configuration file and return its path."""
+    path.write_bytes(yaml.dump(config_data, Dumper=YAML_DUMPER, encoding="utf-8"))
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def exporter_env(monkeypatch):
+    """Hide exporter variables from each test and drop any the test sets.
+
+    ConfigManager writes os.environ directly, which monkeypatch does not
+    track, so keys left behind are removed before monkeypatch restores the
+    originals.
+    """
+    for key in [key for key in os.environ if key.startswith(_ENV_PREFIXES)]:
+        monkeypatch.delenv(key)
+    yield
+    for key in [key for key in os.environ if key.startswith(_ENV_PREFIXES)]:
+        del os.environ[key]
+
+
+@pytest.fixture(scope="session")
+def yaml_tmpdir(tmp_path_factory):
+    """Single directory shared by every config file in this module."""
+    return tmp_path_factory.mktemp("cfg")
+
+
+@pytest.fixture
+def config_path(yaml_tmpdir, request):
+    """Per-test config file path inside the shared directory."""
+    return yaml_tmpdir / f"{request.node.name}.yml"
+
+
+@pytest.fixture(scope="module")
+def ssl_stubs(tmp_path_factory):
+    """Placeholder certificate, key and CA files shared by the SSL tests."""
+    ssl_dir = tmp_path_factory.mktemp("ssl")
+    cert = ssl_dir / "cert.pem"
+    key = ssl_dir / "key.pem"
+    ca = ssl_dir / "ca.pem"
+    cert.write_bytes(b"test cert content")
+    key.write_bytes(b"test key content")
+    ca.write_bytes(b"test ca content")
+    return SimpleNamespace(dir=str(ssl_dir), cert=str(cert), key=str(key), ca=str(ca))
+
+
+@pytest.fixture(scope="module")
+def base_yaml():
+    """BASE_CONFIG serialized once for the whole module."""
+    return yaml.dump(BASE_CONFIG, Dumper=YAML_DUMPER, encoding="utf-8")
+
+
+@pytest.fixture
+def base_config_file(config_path, base_yaml):
+    """Path to a config file holding the unmodified BASE_CONFIG."""
+    config_path.write_bytes(base_yaml)
+    return str(config_path)
+
+
 class TestConfigManagerYaml:
     """Test cases for ConfigManager with YAML support."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_file = Path(self.temp_dir) / "test_config.yml"
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        if self.config_file.exists():
-            self.config_file.unlink()
-        os.rmdir(self.temp_dir)
-
-    def create_test_config(self, config_data: dict) -> str:
-        """Create a test YAML configuration file."""
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            yaml.dump(config_data, f)
-        return str(self.config_file)
-
-    @patch.dict(os.environ, {}, clear=True)
-    def test_initialize_with_yaml_config_success(self):
+    def test_initialize_with_yaml_config_success(self, config_path):
         """Test successful initialization with YAML configuration."""
         config_data = {
             "exporter": {
@@ -50,7 +104,7 @@ class TestConfigManagerYaml:
                 "gunicorn": {"workers": 4, "timeout": 300, "keepalive": 5},
             }
         }
-        config_file = self.create_test_config(config_data)
+        config_file = dump_yaml(config_path, config_data)
 
         manager = ConfigManager()
         manager.initialize(config_file=config_file)
@@ -61,20 +115,11 @@ class TestConfigManagerYaml:
         assert os.environ["PROMETHEUS_BIND_ADDRESS"] == "0.0.0.0"
         assert os.environ["GUNICORN_WORKERS"] == "4"
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_initialize_with_yaml_config_and_overrides(self):
+    def test_initialize_with_yaml_config_and_overrides(self, base_config_file):
         """Test initialization with YAML config and environment variable overrides."""
-        config_data = {
-            "exporter": {
-                "prometheus": {"metrics_port": 9091, "bind_address": "0.0.0.0"},
-                "gunicorn": {"workers": 2},
-            }
-        }
-        config_file = self.create_test_config(config_data)
-
         manager = ConfigManager()
         manager.initialize(
-            config_file=config_file,
+            config_file=base_config_file,
             PROMETHEUS_METRICS_PORT="8080",
             GUNICORN_WORKERS="8",
         )
@@ -86,26 +131,20 @@ class TestConfigManagerYaml:
         # YAML values should be set for non-overridden values
         assert os.environ["PROMETHEUS_BIND_ADDRESS"] == "0.0.0.0"
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_initialize_with_yaml_config_redis_enabled(self):
+    def test_initialize_with_yaml_config_redis_enabled(self, config_path):
         """Test initialization with YAML config that enables Redis."""
-        config_data = {
-            "exporter": {
-                "prometheus": {"metrics_port": 9091, "bind_address": "0.0.0.0"},
-                "gunicorn": {"workers": 2},
-                "redis": {
-                    "enabled": True,
-                    "host": "redis.example.com",
-                    "port": 6379,
-                    "db": 1,
-                    "password": "secret",
-                    "key_prefix": "myapp",
-                    "ttl_seconds": 600,
-                    "ttl_disabled": False,
-                },
-            }
+        config_data = copy.deepcopy(BASE_CONFIG)
+        config_data["exporter"]["redis"] = {
+            "enabled": True,
+            "host": "redis.example.com",
+            "port": 6379,
+            "db": 1,
+            "password": "secret",
+            "key_prefix": "myapp",
+            "ttl_seconds": 600,
+            "ttl_disabled": False,
         }
-        config_file = self.create_test_config(config_data)
+        config_file = dump_yaml(config_path, config_data)
 
         manager = ConfigManager()
         manager.initialize(config_file=config_file)
@@ -120,60 +159,40 @@ class TestConfigManagerYaml:
         assert os.environ["REDIS_TTL_SECONDS"] == "600"
         assert os.environ["REDIS_TTL_DISABLED"] == "false"
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_initialize_with_yaml_config_ssl_enabled(self):
+    def test_initialize_with_yaml_config_ssl_enabled(self, config_path, ssl_stubs):
         """Test initialization with YAML config that enables SSL."""
+        cert_path = ssl_stubs.cert
+        key_path = ssl_stubs.key
 
-        # Create temporary SSL files for testing
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".pem", delete=False
-        ) as cert_file:
-            cert_file.write("test cert content")
-            cert_path = cert_file.name
-
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".pem", delete=False
-        ) as key_file:
-            key_file.write("test key content")
-            key_path = key_file.name
-
-        try:
-            config_data = {
-                "exporter": {
-                    "prometheus": {
-                        "metrics_port": 9091,
-                        "bind_address": "0.0.0.0",
-                        "ssl": {
-                            "enabled": True,
-                            "certfile": cert_path,
-                            "keyfile": key_path,
-                            "client_cafile": cert_path,  # Reuse cert file for CA
-                            "client_capath": os.path.dirname(cert_path),
-                            "client_auth_required": True,
-                        },
+        config_data = {
+            "exporter": {
+                "prometheus": {
+                    "metrics_port": 9091,
+                    "bind_address": "0.0.0.0",
+                    "ssl": {
+                        "enabled": True,
+                        "certfile": cert_path,
+                        "keyfile": key_path,
+                        "client_cafile": cert_path,  # Reuse cert file for CA
+                        "client_capath": os.path.dirname(cert_path),
+                        "client_auth_required": True,
                     },
-                    "gunicorn": {"workers": 2},
-                }
+                },
+                "gunicorn": {"workers": 2},
             }
-            config_file = self.create_test_config(config_data)
+        }
+        config_file = dump_yaml(config_path, config_data)
 
-            manager = ConfigManager()
-            manager.initialize(config_file=config_file)
+        manager = ConfigManager()
+        manager.initialize(config_file=config_file)
+
+        assert manager.state == ConfigState.INITIALIZED
+        assert os.environ["PROMETHEUS_SSL_CERTFILE"] == cert_path
+        assert os.environ["PROMETHEUS_SSL_KEYFILE"] == key_path
+        assert os.environ["PROMETHEUS_SSL_CLIENT_CAFILE"] == cert_path
+        assert os.environ["PROMETHEUS_SSL_CLIENT_CAPATH"] == os.path.dirname(cert_path)
+        assert os.environ["PROMETHEUS_SSL_CLIENT_AUTH_REQUIRED"] == "true"
 
-            assert manager.state == ConfigState.INITIALIZED
-            assert os.environ["PROMETHEUS_SSL_CERTFILE"] == cert_path
-            assert os.environ["PROMETHEUS_SSL_KEYFILE"] == key_path
-            assert os.environ["PROMETHEUS_SSL_CLIENT_CAFILE"] == cert_path
-            assert os.environ["PROMETHEUS_SSL_CLIENT_CAPATH"] == os.path.dirname(
-                cert_path
-            )
-            assert os.environ["PROMETHEUS_SSL_CLIENT_AUTH_REQUIRED"] == "true"
-        finally:
-            # Clean up temporary files
-            os.unlink(cert_path)
-            os.unlink(key_path)
-
-    @patch.dict(os.environ, {}, clear=True)
     def test_initialize_with_yaml_config_file_not_found(self):
         """Test initialization with non-existent YAML config file."""
         manager = ConfigManager()
@@ -181,19 +200,16 @@ class TestConfigManagerYaml:
         with pytest.raises(FileNotFoundError):
             manager.initialize(config_file="nonexistent.yml")
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_initialize_with_yaml_config_invalid_yaml(self):
+    def test_initialize_with_yaml_config_invalid_yaml(self, config_path):
         """Test initialization with invalid YAML config file."""
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            f.write("invalid: yaml: content: [")
+        config_path.write_bytes(b"invalid: yaml: content: [")
 
         manager = ConfigManager()
 
         with pytest.raises(yaml.YAMLError):
-            manager.initialize(config_file=str(self.config_file))
+            manager.initialize(config_file=str(config_path))
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_initialize_with_yaml_config_invalid_structure(self):
+    def test_initialize_with_yaml_config_invalid_structure(self, config_path):
         """Test initialization with YAML config file with invalid structure."""
         config_data = {
             "exporter": {
@@ -204,7 +220,7 @@ class TestConfigManagerYaml:
                 "gunicorn": {"workers": 2},
             }
         }
-        config_file = self.create_test_config(config_data)
+        config_file = dump_yaml(config_path, config_data)
 
         manager = ConfigManager()
 
@@ -213,7 +229,6 @@ class TestConfigManagerYaml:
         ):
             manager.initialize(config_file=config_file)
 
-    @patch.dict(os.environ, {}, clear=True)
     def test_initialize_without_yaml_config(self):
         """Test initialization without YAML config (backward compatibility)."""
         manager = ConfigManager()
@@ -228,7 +243,6 @@ class TestConfigManagerYaml:
         assert os.environ["PROMETHEUS_BIND_ADDRESS"] == "0.0.0.0"
         assert os.environ["GUNICORN_WORKERS"] == "2"
 
-    @patch.dict(os.environ, {}, clear=True)
     def test_initialize_with_none_yaml_config(self):
         """Test initialization with None YAML config (backward compatibility)."""
         manager = ConfigManager()
@@ -244,23 +258,15 @@ class TestConfigManagerYaml:
         assert os.environ["PROMETHEUS_BIND_ADDRESS"] == "0.0.0.0"
         assert os.environ["GUNICORN_WORKERS"] == "2"
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_initialize_config_function_with_yaml(self):
+    @pytest.mark.serial
+    def test_initialize_config_function_with_yaml(self, base_config_file):
         """Test the global initialize_config function with YAML."""
         from gunicorn_prometheus_exporter.config.manager import cleanup_config
 
         # Clean up any existing configuration
         cleanup_config()
 
-        config_data = {
-            "exporter": {
-                "prometheus": {"metrics_port": 9091, "bind_address": "0.0.0.0"},
-                "gunicorn": {"workers": 2},
-            }
-        }
-        config_file = self.create_test_config(config_data)
-
-        initialize_config(config_file=config_file)
+        initialize_config(config_file=base_config_file)
 
         # Get the global config manager
         manager = get_config_manager()
@@ -269,24 +275,16 @@ class TestConfigManagerYaml:
         assert os.environ["PROMETHEUS_BIND_ADDRESS"] == "0.0.0.0"
         assert os.environ["GUNICORN_WORKERS"] == "2"
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_initialize_config_function_with_yaml_and_overrides(self):
+    @pytest.mark.serial
+    def test_initialize_config_function_with_yaml_and_overrides(self, base_config_file):
         """Test the global initialize_config function with YAML and overrides."""
         from gunicorn_prometheus_exporter.config.manager import cleanup_config
 
         # Clean up any existing configuration
         cleanup_config()
 
-        config_data = {
-            "exporter": {
-                "prometheus": {"metrics_port": 9091, "bind_address": "0.0.0.0"},
-                "gunicorn": {"workers": 2},
-            }
-        }
-        config_file = self.create_test_config(config_data)
-
         initialize_config(
-            config_file=config_file,
+            config_file=base_config_file,
             PROMETHEUS_METRICS_PORT="8080",
             GUNICORN_WORKERS="8",
         )
@@ -300,7 +298,7 @@ class TestConfigManagerYaml:
         # YAML values should be set for non-overridden values
         assert os.environ["PROMETHEUS_BIND_ADDRESS"] == "0.0.0.0"
 
-    @patch.dict(os.environ, {}, clear=True)
+    @pytest.mark.serial
     def test_initialize_config_function_without_yaml(self):
         """Test the global initialize_config function without YAML (backward compatibility)."""
         from gunicorn_prometheus_exporter.config.manager import cleanup_config
@@ -321,7 +319,7 @@ class TestConfigManagerYaml:
         assert os.environ["PROMETHEUS_BIND_ADDRESS"] == "0.0.0.0"
         assert os.environ["GUNICORN_WORKERS"] == "2"
 
-    @patch.dict(os.environ, {}, clear=True)
+    @pytest.mark.serial
     def test_initialize_config_function_with_none_yaml(self):
         """Test the global initialize_config function with None YAML (backward compatibility)."""
         from gunicorn_prometheus_exporter.config.manager import cleanup_config
@@ -343,7 +341,7 @@ class TestConfigManagerYaml:
         assert os.environ["PROMETHEUS_BIND_ADDRESS"] == "0.0.0.0"
         assert os.environ["GUNICORN_WORKERS"] == "2"
 
-    @patch.dict(os.environ, {}, clear=True)
+    @pytest.mark.serial
     def test_get_config_manager_singleton(self):
         """Test that get_config_manager returns a singleton instance."""
         manager1 = get_config_manager()
@@ -352,17 +350,11 @@ class TestConfigManagerYaml:
         assert manager1 is manager2
         assert isinstance(manager1, ConfigManager)
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_yaml_config_with_cleanup_settings(self):
+    def test_yaml_config_with_cleanup_settings(self, config_path):
         """Test YAML configuration with cleanup settings."""
-        config_data = {
-            "exporter": {
-                "prometheus": {"metrics_port": 9091, "bind_address": "0.0.0.0"},
-                "gunicorn": {"workers": 2},
-                "cleanup": {"db_files": True},
-            }
-        }
-        config_file = self.create_test_config(config_data)
+        config_data = copy.deepcopy(BASE_CONFIG)
+        config_data["exporter"]["cleanup"] = {"db_files": True}
+        config_file = dump_yaml(config_path, config_data)
 
         manager = ConfigManager()
         manager.initialize(config_file=config_file)
@@ -370,88 +362,70 @@ class TestConfigManagerYaml:
         assert manager.state == ConfigState.INITIALIZED
         assert os.environ["CLEANUP_DB_FILES"] == "true"
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_yaml_config_with_comprehensive_settings(self):
+    def test_yaml_config_with_comprehensive_settings(
+        self, config_path, yaml_tmpdir, ssl_stubs
+    ):
         """Test YAML configuration with all possible settings."""
+        multiproc_dir = str(yaml_tmpdir / "prometheus")
+        cert_path = ssl_stubs.cert
+        key_path = ssl_stubs.key
+        ca_path = ssl_stubs.ca
+        ssl_dir = ssl_stubs.dir
 
-        # Create temporary directory and SSL files for testing
-        temp_dir = tempfile.mkdtemp()
-        ssl_dir = os.path.join(temp_dir, "ssl")
-        os.makedirs(ssl_dir, exist_ok=True)
-
-        cert_path = os.path.join(ssl_dir, "cert.pem")
-        key_path = os.path.join(ssl_dir, "key.pem")
-        ca_path = os.path.join(ssl_dir, "ca.pem")
-
-        with open(cert_path, "w") as f:
-            f.write("test cert content")
-        with open(key_path, "w") as f:
-            f.write("test key content")
-        with open(ca_path, "w") as f:
-            f.write("test ca content")
-
-        try:
-            config_data = {
-                "exporter": {
-                    "prometheus": {
-                        "metrics_port": 9091,
-                        "bind_address": "0.0.0.0",
-                        "multiproc_dir": os.path.join(temp_dir, "prometheus"),
-                        "ssl": {
-                            "enabled": True,
-                            "certfile": cert_path,
-                            "keyfile": key_path,
-                            "client_cafile": ca_path,
-                            "client_capath": ssl_dir,
-                            "client_auth_required": False,
-                        },
-                    },
-                    "gunicorn": {"workers": 8, "timeout": 300, "keepalive": 5},
-                    "redis": {
+        config_data = {
+            "exporter": {
+                "prometheus": {
+                    "metrics_port": 9091,
+                    "bind_address": "0.0.0.0",
+                    "multiproc_dir": multiproc_dir,
+                    "ssl": {
                         "enabled": True,
-                        "host": "redis-cluster.internal",
-                        "port": 6379,
-                        "db": 0,
-                        "password": "REPLACE_WITH_YOUR_REDIS_PASSWORD",
-                        "key_prefix": "gunicorn:prod",
-                        "ttl_seconds": 600,
-                        "ttl_disabled": False,
+                        "certfile": cert_path,
+                        "keyfile": key_path,
+                        "client_cafile": ca_path,
+                        "client_capath": ssl_dir,
+                        "client_auth_required": False,
                     },
-                    "cleanup": {"db_files": True},
-                }
+                },
+                "gunicorn": {"workers": 8, "timeout": 300, "keepalive": 5},
+                "redis": {
+                    "enabled": True,
+                    "host": "redis-cluster.internal",
+                    "port": 6379,
+                    "db": 0,
+                    "password": "REPLACE_WITH_YOUR_REDIS_PASSWORD",
+                    "key_prefix": "gunicorn:prod",
+                    "ttl_seconds": 600,
+                    "ttl_disabled": False,
+                },
+                "cleanup": {"db_files": True},
             }
-            config_file = self.create_test_config(config_data)
+        }
+        config_file = dump_yaml(config_path, config_data)
 
-            manager = ConfigManager()
-            manager.initialize(config_file=config_file)
+        manager = ConfigManager()
+        manager.initialize(config_file=config_file)
+
+        assert manager.state == ConfigState.INITIALIZED
 
-            assert manager.state == ConfigState.INITIALIZED
-
-            # Check all environment variables are set correctly
-            assert os.environ["PROMETHEUS_METRICS_PORT"] == "9091"
-            assert os.environ["PROMETHEUS_BIND_ADDRESS"] == "0.0.0.0"
-            assert os.environ["PROMETHEUS_MULTIPROC_DIR"] == os.path.join(
-                temp_dir, "prometheus"
-            )
-            assert os.environ["GUNICORN_WORKERS"] == "8"
-            assert os.environ["GUNICORN_TIMEOUT"] == "300"
-            assert os.environ["GUNICORN_KEEPALIVE"] == "5"
-            assert os.environ["REDIS_ENABLED"] == "true"
-            assert os.environ["REDIS_HOST"] == "redis-cluster.internal"
-            assert os.environ["REDIS_PORT"] == "6379"
-            assert os.environ["REDIS_DB"] == "0"
-            assert os.environ["REDIS_PASSWORD"] == "REPLACE_WITH_YOUR_REDIS_PASSWORD"
-            assert os.environ["REDIS_KEY_PREFIX"] == "gunicorn:prod"
-            assert os.environ["REDIS_TTL_SECONDS"] == "600"
-            assert os.environ["REDIS_TTL_DISABLED"] == "false"
-            assert os.environ["PROMETHEUS_SSL_CERTFILE"] == cert_path
-            assert os.environ["PROMETHEUS_SSL_KEYFILE"] == key_path
-            assert os.environ["PROMETHEUS_SSL_CLIENT_CAFILE"] == ca_path
-            assert os.environ["PROMETHEUS_SSL_CLIENT_CAPATH"] == ssl_dir
-            assert os.environ["PROMETHEUS_SSL_CLIENT_AUTH_REQUIRED"] == "false"
-            assert os.environ["CLEANUP_DB_FILES"] == "true"
-        finally:
-            # Clean up temporary files and directory
-            import shutil
-
-            shutil.rmtree(temp_dir)
+        # Check all environment variables are set correctly
+        assert os.environ["PROMETHEUS_METRICS_PORT"] == "9091"
+        assert os.environ["PROMETHEUS_BIND_ADDRESS"] == "0.0.0.0"
+        assert os.environ["PROMETHEUS_MULTIPROC_DIR"] == multiproc_dir
+        assert os.environ["GUNICORN_WORKERS"] == "8"
+        assert os.environ["GUNICORN_TIMEOUT"] == "300"
+        assert os.environ["GUNICORN_KEEPALIVE"] == "5"
+        assert os.environ["REDIS_ENABLED"] == "true"
+        assert os.environ["REDIS_HOST"] == "redis-cluster.internal"
+        assert os.environ["REDIS_PORT"] == "6379"
+        assert os.environ["REDIS_DB"] == "0"
+        assert os.environ["REDIS_PASSWORD"] == "REPLACE_WITH_YOUR_REDIS_PASSWORD"
+        assert os.environ["REDIS_KEY_PREFIX"] == "gunicorn:prod"
+        assert os.environ["REDIS_TTL_SECONDS"] == "600"
+        assert os.environ["REDIS_TTL_DISABLED"] == "false"
+        assert os.environ["PROMETHEUS_SSL_CERTFILE"] == cert_path
+        assert os.environ["PROMETHEUS_SSL_KEYFILE"] == key_path
+        assert os.environ["PROMETHEUS_SSL_CLIENT_CAFILE"] == ca_path
+        assert os.environ["PROMETHEUS_SSL_CLIENT_CAPATH"] == ssl_dir
+        assert os.environ["PROMETHEUS_SSL_CLIENT_AUTH_REQUIRED"] == "false"
+        assert os.environ["CLEANUP_DB_FILES"] == "true"
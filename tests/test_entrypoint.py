@@ -3,215 +3,156 @@
 import os
 
 from pathlib import Path
-from unittest.mock import Mock, patch
 
+import pytest
 
-class TestEntrypointScript:
-    """Test entrypoint.sh script functionality."""
 
-    def setup_method(self):
-        """Set up test environment."""
-        # Clear environment variables
-        for key in [
-            "REDIS_ENABLED",
-            "REDIS_HOST",
-            "REDIS_PORT",
-            "REDIS_DB",
-            "SIDECAR_MODE",
-        ]:
-            os.environ.pop(key, None)
-
-    def teardown_method(self):
-        """Clean up test environment."""
-        # Clear environment variables
-        for key in [
-            "REDIS_ENABLED",
-            "REDIS_HOST",
-            "REDIS_PORT",
-            "REDIS_DB",
-            "SIDECAR_MODE",
-        ]:
-            os.environ.pop(key, None)
+# docker/entrypoint.sh, one level up from this test file
+ENTRYPOINT_PATH = Path(__file__).parent.parent / "docker" / "entrypoint.sh"
 
-    def test_entrypoint_script_exists(self):
-        """Test that entrypoint.sh script exists and is executable."""
-        # Get the project root directory (one level up from this test file)
-        project_root = Path(__file__).parent.parent
-        entrypoint_path = project_root / "docker" / "entrypoint.sh"
-        assert os.path.exists(entrypoint_path)
-        assert os.access(entrypoint_path, os.X_OK)
-
-    @patch("subprocess.run")
-    def test_entrypoint_sidecar_mode(self, mock_run):
-        """Test entrypoint sidecar mode execution."""
-        mock_run.return_value = Mock(returncode=0)
-
-        # Test sidecar mode
-        with patch("sys.argv", ["entrypoint.sh", "sidecar"]):
-            # This would normally execute the script, but we're mocking subprocess.run
-            # to avoid actual execution
-            pass
-
-        # Verify the script would call python3 /app/sidecar.py sidecar
-        # This is more of a structural test since we can't easily test shell scripts
-
-    @patch("subprocess.run")
-    def test_entrypoint_standalone_mode(self, mock_run):
-        """Test entrypoint standalone mode execution."""
-        mock_run.return_value = Mock(returncode=0)
-
-        # Test standalone mode
-        with patch("sys.argv", ["entrypoint.sh", "standalone"]):
-            # This would normally execute the script, but we're mocking subprocess.run
-            # to avoid actual execution
-            pass
-
-    @patch("subprocess.run")
-    def test_entrypoint_health_mode(self, mock_run):
-        """Test entrypoint health mode execution."""
-        mock_run.return_value = Mock(returncode=0)
-
-        # Test health mode
-        with patch("sys.argv", ["entrypoint.sh", "health"]):
-            # This would normally execute the script, but we're mocking subprocess.run
-            # to avoid actual execution
-            pass
-
-    def test_entrypoint_script_content(self):
-        """Test that entrypoint.sh contains expected functions."""
-        # Get the project root directory (one level up from this test file)
-        project_root = Path(__file__).parent.parent
-        entrypoint_path = project_root / "docker" / "entrypoint.sh"
+_ENV_KEYS = (
+    "REDIS_ENABLED",
+    "REDIS_HOST",
+    "REDIS_PORT",
+    "REDIS_DB",
+    "SIDECAR_MODE",
+)
 
-        with open(entrypoint_path, "r") as f:
-            content = f.read()
 
-        # Check for key functions
-        assert "run_sidecar()" in content
-        assert "run_standalone()" in content
-        assert "run_health()" in content
-        # Check for main script logic (case statement instead of main function)
-        assert 'case "$MODE" in' in content
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    """Start each test without the sidecar variables; monkeypatch restores them."""
+    for key in _ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
 
-        # Check for Redis handling
-        assert "REDIS_ENABLED" in content
-        assert "redis" in content.lower()
 
-        # Check for sidecar.py calls
-        assert "sidecar.py" in content
-        assert "python3" in content
+def assert_contains(content: str, needles) -> None:
+    """Assert every needle occurs in content, reporting all that are missing."""
+    missing = [needle for needle in needles if needle not in content]
+    assert not missing, f"entrypoint.sh is missing: {missing}"
 
-    def test_entrypoint_environment_variables(self):
-        """Test that entrypoint.sh handles environment variables correctly."""
-        # Get the project root directory (one level up from this test file)
-        project_root = Path(__file__).parent.parent
-        entrypoint_path = project_root / "docker" / "entrypoint.sh"
-
-        with open(entrypoint_path, "r") as f:
-            content = f.read()
-
-        # Check for environment variable handling
-        assert "PROMETHEUS_METRICS_PORT" in content
-        assert "PROMETHEUS_BIND_ADDRESS" in content
-        assert "PROMETHEUS_MULTIPROC_DIR" in content
-        assert "REDIS_ENABLED" in content
-        assert "REDIS_HOST" in content
-        assert "REDIS_PORT" in content
-        assert "REDIS_DB" in content
-        assert "REDIS_KEY_PREFIX" in content
-
-    def test_entrypoint_redis_mode_handling(self):
-        """Test that entrypoint.sh handles Redis mode correctly."""
-        # Get the project root directory (one level up from this test file)
-        project_root = Path(__file__).parent.parent
-        entrypoint_path = project_root / "docker" / "entrypoint.sh"
 
-        with open(entrypoint_path, "r") as f:
-            content = f.read()
+@pytest.fixture(scope="module")
+def entrypoint_content():
+    """Read entrypoint.sh once for all the content checks."""
+    return ENTRYPOINT_PATH.read_text()
 
-        # Check for Redis mode logic
-        assert "REDIS_ENABLED" in content
-        assert "false" in content  # Default value
-        assert "true" in content  # Redis enabled value
 
-        # Check for multiprocess directory handling
-        assert "MULTIPROC_DIR" in content
-        assert "multiproc-dir" in content
+class TestEntrypointScript:
+    """Test entrypoint.sh script functionality."""
 
-    def test_entrypoint_error_handling(self):
-        """Test that entrypoint.sh has proper error handling."""
-        # Get the project root directory (one level up from this test file)
-        project_root = Path(__file__).parent.parent
-        entrypoint_path = project_root / "docker" / "entrypoint.sh"
+    def test_entrypoint_script_exists(self):
+        """Test that entrypoint.sh script exists and is executable."""
+        assert os.path.exists(ENTRYPOINT_PATH)
+        assert os.access(ENTRYPOINT_PATH, os.X_OK)
+
+    @pytest.mark.parametrize("mode", ["sidecar", "standalone", "health"])
+    def test_entrypoint_mode_dispatch(self, mode, entrypoint_content):
+        """Test that the case statement dispatches each supported mode."""
+        assert f'"{mode}")' in entrypoint_content
 
-        with open(entrypoint_path, "r") as f:
-            content = f.read()
+    def test_entrypoint_script_content(self, entrypoint_content):
+        """Test that entrypoint.sh contains expected functions."""
+        assert_contains(
+            entrypoint_content,
+            (
+                # Key functions
+                "run_sidecar()",
+                "run_standalone()",
+                "run_health()",
+                # Main script logic (case statement instead of main function)
+                'case "$MODE" in',
+                # Redis handling
+                "REDIS_ENABLED",
+                # sidecar.py calls
+                "sidecar.py",
+                "python3",
+            ),
+        )
+        assert "redis" in entrypoint_content.lower()
 
+    def test_entrypoint_environment_variables(self, entrypoint_content):
+        """Test that entrypoint.sh handles environment variables correctly."""
+        assert_contains(
+            entrypoint_content,
+            (
+                "PROMETHEUS_METRICS_PORT",
+                "PROMETHEUS_BIND_ADDRESS",
+                "PROMETHEUS_MULTIPROC_DIR",
+                "REDIS_ENABLED",
+                "REDIS_HOST",
+                "REDIS_PORT",
+                "REDIS_DB",
+                "REDIS_KEY_PREFIX",
+            ),
+        )
+
+    def test_entrypoint_redis_mode_handling(self, entrypoint_content):
+        """Test that entrypoint.sh handles Redis mode correctly."""
+        assert_contains(
+            entrypoint_content,
+            (
+                # Redis mode logic: default and enabled values
+                "REDIS_ENABLED",
+                "false",
+                "true",
+                # Multiprocess directory handling
+                "MULTIPROC_DIR",
+                "multiproc-dir",
+            ),
+        )
+
+    def test_entrypoint_error_handling(self, entrypoint_content):
+        """Test that entrypoint.sh has proper error handling."""
         # Check for error handling (strict bash options)
         assert (
-            "set -Eeuo pipefail" in content
-            or "set -e" in content
-            or "set -o errexit" in content
+            "set -Eeuo pipefail" in entrypoint_content
+            or "set -e" in entrypoint_content
+            or "set -o errexit" in entrypoint_content
         )
-        assert "exit" in content
-        assert "echo" in content  # For logging
+        assert "exit" in entrypoint_content
+        assert "echo" in entrypoint_content  # For logging
 
-    def test_entrypoint_logging(self):
+    def test_entrypoint_logging(self, entrypoint_content):
         """Test that entrypoint.sh has proper logging."""
-        # Get the project root directory (one level up from this test file)
-        project_root = Path(__file__).parent.parent
-        entrypoint_path = project_root / "docker" / "entrypoint.sh"
-
-        with open(entrypoint_path, "r") as f:
-            content = f.read()
-
         # Check for logging
-        assert "echo" in content
-        assert "DEBUG:" in content or "INFO:" in content or "ERROR:" in content
+        assert "echo" in entrypoint_content
+        assert (
+            "DEBUG:" in entrypoint_content
+            or "INFO:" in entrypoint_content
+            or "ERROR:" in entrypoint_content
+        )
 
-    def test_entrypoint_help_functionality(self):
+    def test_entrypoint_help_functionality(self, entrypoint_content):
         """Test that entrypoint.sh has help functionality."""
-        # Get the project root directory (one level up from this test file)
-        project_root = Path(__file__).parent.parent
-        entrypoint_path = project_root / "docker" / "entrypoint.sh"
-
-        with open(entrypoint_path, "r") as f:
-            content = f.read()
-
         # Check for help/usage information
-        assert "Usage:" in content or "usage:" in content or "help" in content.lower()
+        assert (
+            "Usage:" in entrypoint_content
+            or "usage:" in entrypoint_content
+            or "help" in entrypoint_content.lower()
+        )
 
-    def test_entrypoint_default_values(self):
+    def test_entrypoint_default_values(self, entrypoint_content):
         """Test that entrypoint.sh has proper default values."""
-        # Get the project root directory (one level up from this test file)
-        project_root = Path(__file__).parent.parent
-        entrypoint_path = project_root / "docker" / "entrypoint.sh"
-
-        with open(entrypoint_path, "r") as f:
-            content = f.read()
-
-        # Check for default values
-        assert "9091" in content  # Default port
-        assert "0.0.0.0" in content  # Default bind address
-        assert "/tmp/prometheus_multiproc" in content  # Default multiproc dir
-        assert "30" in content  # Default update interval
+        assert_contains(
+            entrypoint_content,
+            (
+                "9091",  # Default port
+                "0.0.0.0",  # Default bind address
+                "/tmp/prometheus_multiproc",  # Default multiproc dir
+                "30",  # Default update interval
+            ),
+        )
 
-    def test_entrypoint_signal_handling(self):
+    def test_entrypoint_signal_handling(self, entrypoint_content):
         """Test that entrypoint.sh has signal handling."""
-        # Get the project root directory (one level up from this test file)
-        project_root = Path(__file__).parent.parent
-        entrypoint_path = project_root / "docker" / "entrypoint.sh"
-
-        with open(entrypoint_path, "r") as f:
-            content = f.read()
-
         # Check for signal handling (if implemented)
         # This is optional but good practice for containerized applications
         signal_handling_present = (
-            "trap" in content
-            or "signal" in content
-            or "SIGTERM" in content
-            or "SIGINT" in content
+            "trap" in entrypoint_content
+            or "signal" in entrypoint_content
+            or "SIGTERM" in entrypoint_content
+            or "SIGINT" in entrypoint_content
         )
 
         # Signal handling is not strictly required for this test
@@ -221,21 +162,14 @@ class TestEntrypointScript:
             signal_handling_present is not None
         )  # Use the variable to avoid unused warning
 
-    def test_entrypoint_cleanup_functionality(self):
+    def test_entrypoint_cleanup_functionality(self, entrypoint_content):
         """Test that entrypoint.sh has cleanup functionality."""
-        # Get the project root directory (one level up from this test file)
-        project_root = Path(__file__).parent.parent
-        entrypoint_path = project_root / "docker" / "entrypoint.sh"
-
-        with open(entrypoint_path, "r") as f:
-            content = f.read()
-
         # Check for cleanup functionality
         cleanup_present = (
-            "cleanup" in content
-            or "trap" in content
-            or "rm" in content
-            or "kill" in content
+            "cleanup" in entrypoint_content
+            or "trap" in entrypoint_content
+            or "rm" in entrypoint_content
+            or "kill" in entrypoint_content
         )
 
         # Cleanup is not strictly required for this test
@@ -2,6 +2,7 @@
 
 import logging
 import os
+import threading
 import unittest
 
 from unittest.mock import ANY, MagicMock, Mock, patch
@@ -621,6 +622,31 @@ class TestProcessManager(unittest.TestCase):
 
                 mock_terminate.assert_called_once_with(mock_child)
 
+    def test_cleanup_processes_terminates_children_concurrently(self):
+        """Test cleanup_processes overlaps the wait for each child."""
+        mock_logger = MagicMock()
+        manager = ProcessManager(mock_logger)
+
+        # Every wait blocks until all eight are waiting at once, so the barrier
+        # only breaks (after its timeout) if termination is sequential
+        barrier = threading.Barrier(8, timeout=5)
+        children = []
+        for pid in range(8):
+            mock_child = MagicMock()
+            mock_child.pid = pid
+            mock_child.wait.side_effect = lambda timeout: barrier.wait()
+            children.append(mock_child)
+
+        with patch("gunicorn_prometheus_exporter.hooks.psutil.Process") as mock_process:
+            mock_process.return_value.children.return_value = children
+            manager.cleanup_processes()
+
+        for mock_child in children:
+            mock_child.terminate.assert_called_once()
+            mock_child.wait.assert_called_once_with(timeout=5)
+        self.assertFalse(barrier.broken)
+        mock_logger.error.assert_not_called()
+
     def test_cleanup_processes_exception(self):
         """Test cleanup_processes with exception."""
         mock_logger = MagicMock()
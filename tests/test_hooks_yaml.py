@@ -1,35 +1,29 @@
 """Tests for YAML loading functionality in hooks."""
 
 import os
-import tempfile
 
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 import yaml
 
+from conftest import YAML_DUMPER
+
 from gunicorn_prometheus_exporter.hooks import load_yaml_config
 
 
 class TestHooksYaml:
     """Test cases for YAML loading functionality in hooks."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_file = Path(self.temp_dir) / "test_config.yml"
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        if self.config_file.exists():
-            self.config_file.unlink()
-        os.rmdir(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _paths(self, tmp_path):
+        """Point each test at a config file in its own tmp_path."""
+        self.config_file = tmp_path / "test_config.yml"
 
     def create_test_config(self, config_data: dict) -> str:
         """Create a test YAML configuration file."""
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            yaml.dump(config_data, f)
+        with open(self.config_file, "wb") as f:
+            yaml.dump(config_data, f, Dumper=YAML_DUMPER, encoding="utf-8")
         return str(self.config_file)
 
     @patch.dict(os.environ, {}, clear=True)
@@ -169,8 +163,7 @@ class TestHooksYaml:
 
     def test_load_yaml_config_invalid_yaml(self):
         """Test loading invalid YAML configuration file through hooks."""
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            f.write("invalid: yaml: content: [")
+        self.config_file.write_bytes(b"invalid: yaml: content: [")
 
         with pytest.raises(yaml.YAMLError):
             load_yaml_config(str(self.config_file))
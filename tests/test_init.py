@@ -1,6 +1,10 @@
 """Tests for main module initialization."""
 
 import logging
+import subprocess
+import sys
+
+import pytest
 
 import gunicorn_prometheus_exporter
 
@@ -42,6 +46,25 @@ class TestModuleInitialization:
             assert export in gunicorn_prometheus_exporter.__all__
             assert hasattr(gunicorn_prometheus_exporter, export)
 
+    def test_backend_imported_lazily(self):
+        """Test that importing the package does not import redis."""
+        code = (
+            "import sys, gunicorn_prometheus_exporter as m; "
+            "assert 'redis' not in sys.modules; "
+            "assert m.RedisStorageManager.__name__ == 'RedisStorageManager'; "
+            "assert 'redis' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown attributes still raise AttributeError."""
+        from gunicorn_prometheus_exporter import backend
+
+        with pytest.raises(AttributeError):
+            _ = gunicorn_prometheus_exporter.does_not_exist
+        with pytest.raises(AttributeError):
+            _ = backend.does_not_exist
+
     def test_eventlet_availability(self):
         """Test Eventlet availability detection."""
         # Test that EVENTLET_AVAILABLE is defined
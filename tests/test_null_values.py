@@ -5,6 +5,8 @@ import tempfile
 
 from unittest.mock import patch
 
+from conftest import YAML_DUMPER
+
 from gunicorn_prometheus_exporter.config.loader import YamlConfigLoader
 
 
@@ -16,7 +18,7 @@ class TestNullValueHandling:
         import yaml
 
         temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False)
-        yaml.dump(config_data, temp_file)
+        yaml.dump(config_data, temp_file, Dumper=YAML_DUMPER)
         temp_file.close()
         return temp_file.name
 
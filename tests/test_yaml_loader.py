@@ -1,14 +1,14 @@
 """Tests for YAML configuration loader."""
 
 import os
-import tempfile
 
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 import yaml
 
+from conftest import YAML_DUMPER
+
 from gunicorn_prometheus_exporter.config.loader import (
     YamlConfigLoader,
     get_yaml_loader,
@@ -22,19 +22,16 @@ class TestYamlConfigLoader:
     def setup_method(self):
         """Set up test fixtures."""
         self.loader = YamlConfigLoader()
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_file = Path(self.temp_dir) / "test_config.yml"
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        if self.config_file.exists():
-            self.config_file.unlink()
-        os.rmdir(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _paths(self, tmp_path):
+        """Point each test at a config file in its own tmp_path."""
+        self.config_file = tmp_path / "test_config.yml"
 
     def create_test_config(self, config_data: dict) -> str:
         """Create a test YAML configuration file."""
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            yaml.dump(config_data, f)
+        with open(self.config_file, "wb") as f:
+            yaml.dump(config_data, f, Dumper=YAML_DUMPER, encoding="utf-8")
         return str(self.config_file)
 
     def test_load_config_file_success(self):
@@ -51,6 +48,19 @@ class TestYamlConfigLoader:
 
         assert result == config_data
 
+    def test_load_config_file_non_ascii(self):
+        """Test that non-ASCII UTF-8 values survive the binary read."""
+        self.config_file.write_bytes(
+            "exporter:\n"
+            "  prometheus: {metrics_port: 9091, bind_address: 0.0.0.0}\n"
+            "  gunicorn: {workers: 2}\n"
+            "  redis: {enabled: true, key_prefix: métriques}\n".encode("utf-8")
+        )
+
+        result = self.loader.load_config_file(str(self.config_file))
+
+        assert result["exporter"]["redis"]["key_prefix"] == "métriques"
+
     def test_load_config_file_not_found(self):
         """Test loading non-existent configuration file."""
         with pytest.raises(FileNotFoundError):
@@ -58,16 +68,14 @@ class TestYamlConfigLoader:
 
     def test_load_config_file_invalid_yaml(self):
         """Test loading invalid YAML file."""
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            f.write("invalid: yaml: content: [")
+        self.config_file.write_bytes(b"invalid: yaml: content: [")
 
         with pytest.raises(yaml.YAMLError):
             self.loader.load_config_file(str(self.config_file))
 
     def test_load_config_file_not_dict(self):
         """Test loading YAML file that doesn't contain a dictionary."""
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            f.write("not a dictionary")
+        self.config_file.write_bytes(b"not a dictionary")
 
         with pytest.raises(
             ValueError, match="Configuration file must contain a dictionary"
@@ -361,8 +369,7 @@ class TestYamlConfigLoader:
 
     def test_load_yaml_config_invalid_yaml(self):
         """Test load_yaml_config with invalid YAML."""
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            f.write("invalid: yaml: content: [")
+        self.config_file.write_bytes(b"invalid: yaml: content: [")
 
         with pytest.raises(yaml.YAMLError):
             load_yaml_config(str(self.config_file))